@@ -57,6 +57,27 @@ class TestAudioExtractor:
             assert "-i" in args[0]
             assert str(video_path) in args[0]
 
+    @patch("subprocess.run")
+    def test_extract_audio_to_array(self, mock_run):
+        """Test decoding audio straight from the ffmpeg pipe."""
+        pcm = np.array([0, 16384, -16384, 32767], dtype=np.int16)
+        mock_run.return_value = MagicMock(stdout=pcm.tobytes())
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video_path = Path(temp_dir) / "test_video.mp4"
+            video_path.write_bytes(b"dummy video content")
+
+            extractor = AudioExtractor()
+            audio_data, sr = extractor.extract_audio_to_array(video_path)
+
+            assert sr == 16000
+            assert audio_data.dtype == np.float32
+            np.testing.assert_allclose(audio_data, [0.0, 0.5, -0.5, 32767 / 32768])
+
+            args, _ = mock_run.call_args
+            assert "pipe:1" in args[0]
+            assert "s16le" in args[0]
+
     @patch("soundfile.info")
     def test_get_audio_properties(self, mock_sf_info):
         """Test getting audio properties."""
@@ -0,0 +1,44 @@
+"""Tests for optional zstd artifact compression."""
+
+import json
+import sys
+
+import pytest
+
+from video_processor.utils.compression import read_text, write_zstd
+
+zstandard = pytest.importorskip("zstandard")
+
+
+class TestCompression:
+    def test_write_and_read_roundtrip(self, tmp_path):
+        path = tmp_path / "knowledge_graph.json"
+        text = json.dumps({"nodes": [{"name": "Python"}] * 50, "relationships": []})
+        path.write_text(text)
+
+        zst_path = write_zstd(path, text)
+        assert zst_path == tmp_path / "knowledge_graph.json.zst"
+        assert zst_path.stat().st_size < len(text)
+        assert read_text(zst_path) == text
+
+    def test_read_text_plain_file(self, tmp_path):
+        path = tmp_path / "transcript.json"
+        path.write_text('{"text": "hello"}')
+        assert read_text(path) == '{"text": "hello"}'
+
+    def test_read_without_zstandard_names_the_extra(self, tmp_path, monkeypatch):
+        zst_path = write_zstd(tmp_path / "kg.json", "{}")
+        monkeypatch.setitem(sys.modules, "zstandard", None)
+        with pytest.raises(ImportError, match=r"planopticon\[compress\]"):
+            read_text(zst_path)
+
+    def test_query_engine_loads_compressed_graph(self, tmp_path):
+        from video_processor.integrators.graph_query import GraphQueryEngine
+
+        data = {
+            "nodes": [{"name": "Python", "type": "technology", "descriptions": []}],
+            "relationships": [],
+        }
+        zst_path = write_zstd(tmp_path / "knowledge_graph.json", json.dumps(data))
+        engine = GraphQueryEngine.from_json_path(zst_path)
+        assert engine.stats().data["entity_count"] == 1
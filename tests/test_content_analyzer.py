@@ -22,6 +22,13 @@ class TestCrossReference:
         assert "A language" in result[0].descriptions
         assert "A snake-named lang" in result[0].descriptions
 
+    def test_merged_descriptions_keep_first_seen_order(self):
+        analyzer = ContentAnalyzer()
+        t_entities = [Entity(name="Python", type="concept", descriptions=["B", "A"])]
+        d_entities = [Entity(name="python", type="concept", descriptions=["A", "C", "B"])]
+        result = analyzer.cross_reference(t_entities, d_entities)
+        assert result[0].descriptions == ["B", "A", "C"]
+
     def test_case_insensitive_merge(self):
         analyzer = ContentAnalyzer()
         t_entities = [Entity(name="Docker", type="technology", descriptions=["Containers"])]
@@ -1,14 +1,22 @@
 """Tests for the frame extractor module."""
 
 import os
+import shutil
 import tempfile
 
+import cv2
 import numpy as np
 import pytest
 
+from video_processor.extractors import frame_extractor
 from video_processor.extractors.frame_extractor import (
     calculate_frame_difference,
+    detect_faces,
+    extract_frames,
+    filter_people_frames,
     is_gpu_available,
+    is_people_frame,
+    iter_frames,
     save_frames,
 )
 
@@ -42,7 +50,115 @@ def test_calculate_frame_difference():
     assert diff_identical < 0.001  # Should be very close to 0
 
 
-def test_is_gpu_available():
+def test_is_people_frame_hd_screen_share():
+    """Test that a large faceless frame is downscaled and not flagged as people."""
+    frame = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+    frame[:, :600] = 0  # wide black bar, but no faces
+    assert is_people_frame(frame) is False
+
+
+class _FakeYuNet:
+    """Stands in for cv2.FaceDetectorYN, returning one large and one tiny face."""
+
+    def __init__(self):
+        self.size = (0, 0)
+
+    def getInputSize(self):
+        return self.size
+
+    def setInputSize(self, size):
+        self.size = size
+
+    def detect(self, frame):
+        faces = np.zeros((2, 15), dtype=np.float32)
+        faces[0, :4] = (10, 10, 200, 200)
+        faces[1, :4] = (0, 0, 10, 10)
+        return 1, faces
+
+
+def test_detect_faces_uses_yunet_when_configured(monkeypatch):
+    """Test that the YuNet detector replaces the cascade and drops tiny faces."""
+    detector = _FakeYuNet()
+    monkeypatch.setattr(frame_extractor, "_get_face_detector_yn", lambda: detector)
+    frame = np.zeros((300, 400, 3), dtype=np.uint8)
+
+    assert detect_faces(frame) == [(10, 10, 200, 200)]
+    assert detector.size == (400, 300)
+    assert is_people_frame(frame) is True
+
+
+def test_is_people_frame_skips_small_scales_without_black_bars(monkeypatch):
+    """Test that only significant-size faces are searched for when there are no bars."""
+    calls = []
+
+    class FakeCascade:
+        def detectMultiScale(self, gray, **kwargs):
+            calls.append(kwargs["minSize"])
+            return []
+
+    monkeypatch.setattr(frame_extractor, "_get_face_cascade", lambda: FakeCascade())
+    bright = np.full((400, 400, 3), 255, dtype=np.uint8)
+    dark = np.zeros((400, 400, 3), dtype=np.uint8)
+
+    assert is_people_frame(bright) is False
+    assert is_people_frame(dark) is False
+    assert calls == [(90, 90), (40, 40)]
+
+    # Too small to hold a significant face and no bars: detection is skipped
+    assert is_people_frame(np.full((60, 80, 3), 255, dtype=np.uint8)) is False
+    assert len(calls) == 2
+
+
+def test_filter_people_frames_keeps_order(monkeypatch):
+    """Test that concurrent filtering preserves frame order and counts removals."""
+    monkeypatch.setattr(
+        frame_extractor, "is_people_frame", lambda frame, face_area_threshold: frame[0, 0, 0] % 2
+    )
+    frames = [np.full((4, 4, 3), i, dtype=np.uint8) for i in range(20)]
+
+    filtered, removed = filter_people_frames(frames)
+
+    assert removed == 10
+    assert [int(f[0, 0, 0]) for f in filtered] == list(range(0, 20, 2))
+
+
+def test_filter_people_frames_single_threaded_opencv(monkeypatch):
+    """Test that OpenCV threading is disabled while frames are classified in parallel."""
+    seen = []
+
+    def classify(frame, face_area_threshold):
+        seen.append(cv2.getNumThreads())
+        return False
+
+    monkeypatch.setattr(frame_extractor, "is_people_frame", classify)
+    before = cv2.getNumThreads()
+
+    filter_people_frames([np.zeros((4, 4, 3), dtype=np.uint8)] * 4)
+
+    assert seen == [1] * 4
+    assert cv2.getNumThreads() == before
+
+
+def test_iter_content_frames_restores_opencv_threads_between_windows(monkeypatch):
+    """Test that OpenCV threading is back to normal while upstream frames decode."""
+    monkeypatch.setattr(frame_extractor, "is_people_frame", lambda frame, **kw: False)
+    original = cv2.getNumThreads()
+    cv2.setNumThreads(4)
+    before = cv2.getNumThreads()
+    upstream = []
+
+    def frames():
+        for _ in range(3):
+            upstream.append(cv2.getNumThreads())
+            yield np.zeros((4, 4, 3), dtype=np.uint8)
+
+    content = frame_extractor.iter_content_frames(frames())
+    next(content)
+    assert cv2.getNumThreads() == before  # suspended mid-stream
+    list(content)
+    cv2.setNumThreads(original)
+    assert upstream == [before] * 3
+
     """Test GPU availability check."""
     # This just tests that the function runs without error
     # We don't assert the result because it depends on the system
@@ -63,3 +179,197 @@ def test_save_frames(dummy_frames):
         for path in paths:
             assert os.path.exists(path)
             assert os.path.getsize(path) > 0  # Files should have content
+
+
+def test_save_frames_parallel():
+    """Test saving a batch large enough to use the worker pool."""
+    frames = [np.full((64, 64, 3), i * 10, dtype=np.uint8) for i in range(12)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = save_frames(frames, temp_dir, "frame")
+
+        assert [p.name for p in paths] == [f"frame_{i:04d}.jpg" for i in range(12)]
+        for path in paths:
+            assert os.path.getsize(path) > 0
+
+
+@pytest.fixture
+def sample_video(tmp_path):
+    """A 60-frame video whose brightness steps every 10 frames."""
+    path = tmp_path / "sample.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (160, 120))
+    for i in range(60):
+        writer.write(np.full((120, 160, 3), (i // 10) * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_extract_frames_change_detection(sample_video):
+    """Test that each brightness step is captured once."""
+    frames = extract_frames(
+        sample_video, sampling_rate=1.0, change_threshold=0.05, periodic_capture_seconds=0
+    )
+    assert len(frames) == 6
+
+
+def test_iter_frames_streams_into_people_filter(sample_video, monkeypatch):
+    """Test that the frame generator feeds the people filter without a list."""
+    monkeypatch.setattr(
+        frame_extractor, "is_people_frame", lambda frame, face_area_threshold: frame.mean() > 100
+    )
+    frames = iter_frames(
+        sample_video, sampling_rate=1.0, change_threshold=0.05, periodic_capture_seconds=0
+    )
+    assert not isinstance(frames, list)
+
+    filtered, removed = filter_people_frames(frames)
+
+    # Brightness steps 0, 40, 80 are kept; 120, 160, 200 count as people
+    assert (len(filtered), removed) == (3, 3)
+
+
+def test_iter_frames_validates_eagerly(tmp_path):
+    """Test that a missing video raises before iteration starts."""
+    with pytest.raises(FileNotFoundError):
+        iter_frames(tmp_path / "missing.mp4")
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_extract_frames_sparse_sampling_uses_ffmpeg(sample_video):
+    """Test the ffmpeg select-filter path matches OpenCV decoding."""
+    frames = extract_frames(
+        sample_video,
+        sampling_rate=0.25,
+        change_threshold=0.05,
+        periodic_capture_seconds=0,
+        resize_to=(80, 60),
+    )
+    assert len(frames) == 6
+    assert frames[0].shape == (60, 80, 3)
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_iter_frames_writes_audio_from_same_ffmpeg_process(tmp_path):
+    """Test that frames and the soundtrack come out of one decode pass."""
+    import subprocess
+
+    import soundfile as sf
+
+    video = tmp_path / "talk.avi"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            "-f", "lavfi", "-i", "testsrc=duration=2:size=160x120:rate=10",
+            "-f", "lavfi", "-i", "sine=duration=2",
+            "-shortest", "-c:v", "mjpeg", "-c:a", "pcm_s16le", str(video),
+        ],
+        check=True,
+    )  # fmt: skip
+    audio_path = tmp_path / "audio" / "talk.wav"
+
+    frames = list(iter_frames(video, sampling_rate=0.25, audio_path=audio_path))
+
+    assert frames
+    info = sf.info(audio_path)
+    assert (info.samplerate, info.channels) == (16000, 1)
+    assert abs(info.duration - 2.0) < 0.2
+    assert not audio_path.with_name("talk.wav.part").exists()
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_iter_frames_without_audio_stream(sample_video, tmp_path):
+    """Test that a silent video still yields frames and writes no audio."""
+    audio_path = tmp_path / "sample.wav"
+    frames = list(
+        iter_frames(
+            sample_video,
+            sampling_rate=0.25,
+            change_threshold=0.05,
+            periodic_capture_seconds=0,
+            audio_path=audio_path,
+        )
+    )
+    assert frames
+    assert not audio_path.exists()
+
+
+def test_iter_frames_audio_path_keeps_opencv_backend(sample_video, tmp_path, monkeypatch):
+    """Test that asking for audio does not move dense sampling onto ffmpeg."""
+    monkeypatch.setattr(frame_extractor.shutil, "which", lambda name: f"/usr/bin/{name}")
+
+    def no_ffmpeg(*args, **kwargs):
+        raise AssertionError("ffmpeg frame path used")
+
+    monkeypatch.setattr(frame_extractor, "_iter_frames_ffmpeg", no_ffmpeg)
+    audio_path = tmp_path / "sample.wav"
+    frames = list(
+        iter_frames(
+            sample_video,
+            sampling_rate=1.0,
+            change_threshold=0.05,
+            periodic_capture_seconds=0,
+            audio_path=audio_path,
+        )
+    )
+    assert len(frames) == 6
+    assert not audio_path.exists()
+
+
+class _FakeFfmpeg:
+    """Popen stand-in that streams *frames* and writes the audio output path."""
+
+    def __init__(self, frames, returncode=0, stderr_text=b""):
+        self.frames = frames
+        self.returncode_on_wait = returncode
+        self.stderr_text = stderr_text
+        self.killed = False
+
+    def __call__(self, cmd, stdout=None, stderr=None, bufsize=None):
+        import io
+
+        if cmd[-1].endswith(".part"):
+            with open(cmd[-1], "wb") as f:
+                f.write(b"RIFF")
+        if self.stderr_text and stderr is not None:
+            stderr.write(self.stderr_text)
+        self.stdout = io.BytesIO(b"".join(frame.tobytes() for frame in self.frames))
+        return self
+
+    def poll(self):
+        # ffmpeg has closed its pipe but not exited yet
+        return None
+
+    def kill(self):
+        self.killed = True
+
+    def wait(self, timeout=None):
+        return -9 if self.killed else self.returncode_on_wait
+
+
+def test_ffmpeg_audio_kept_when_process_exits_after_eof(tmp_path, monkeypatch):
+    """Test that a full read waits for ffmpeg instead of killing it."""
+    fake = _FakeFfmpeg([np.zeros((6, 8, 3), dtype=np.uint8)] * 3)
+    monkeypatch.setattr(frame_extractor.subprocess, "Popen", fake)
+    audio_path = tmp_path / "audio.wav"
+
+    frames = list(
+        frame_extractor._iter_frames_ffmpeg(tmp_path / "in.mp4", 4, (8, 6), audio_path=audio_path)
+    )
+
+    assert [idx for idx, _ in frames] == [0, 4, 8]
+    assert not fake.killed
+    assert audio_path.read_bytes() == b"RIFF"
+    assert not audio_path.with_name("audio.wav.part").exists()
+
+
+def test_ffmpeg_failure_is_logged_and_falls_back_to_opencv(sample_video, monkeypatch, caplog):
+    """Test that a failed ffmpeg decode reports its error and still yields frames."""
+    fake = _FakeFfmpeg([], returncode=1, stderr_text=b"moov atom not found")
+    monkeypatch.setattr(frame_extractor.subprocess, "Popen", fake)
+
+    with caplog.at_level("WARNING", logger=frame_extractor.logger.name):
+        frames = list(frame_extractor._iter_frames_ffmpeg(sample_video, 4, (80, 60)))
+
+    assert [idx for idx, _ in frames] == list(range(0, 60, 4))
+    assert frames[0][1].shape == (60, 80, 3)
+    assert "moov atom not found" in caplog.text
+    assert "falling back to OpenCV" in caplog.text
@@ -3,6 +3,7 @@
 import json
 
 from video_processor.integrators.graph_discovery import (
+    clear_nearest_graph_cache,
     describe_graph,
     find_knowledge_graphs,
     find_nearest_graph,
@@ -16,6 +17,14 @@ class TestFindKnowledgeGraphs:
         graphs = find_knowledge_graphs(tmp_path, walk_up=False)
         assert db.resolve() in graphs
 
+    def test_compressed_copy_is_listed_only_without_plain_file(self, tmp_path):
+        plain = tmp_path / "knowledge_graph.json"
+        zst = tmp_path / "knowledge_graph.json.zst"
+        zst.write_bytes(b"")
+        assert find_knowledge_graphs(tmp_path, walk_up=False) == [zst.resolve()]
+        plain.write_text('{"nodes": [], "relationships": []}')
+        assert find_knowledge_graphs(tmp_path, walk_up=False) == [plain.resolve()]
+
     def test_finds_in_results_subdir(self, tmp_path):
         results = tmp_path / "results"
         results.mkdir()
@@ -70,6 +79,48 @@ class TestFindKnowledgeGraphs:
         graphs = find_knowledge_graphs(tmp_path, walk_up=False)
         assert graphs.index(close_db.resolve()) < graphs.index(deep_db.resolve())
 
+    def test_skips_dependency_and_excluded_dirs(self, tmp_path):
+        for name in ("node_modules", "venv", "archive", "notes"):
+            d = tmp_path / name
+            d.mkdir()
+            (d / "knowledge_graph.db").write_bytes(b"")
+        graphs = find_knowledge_graphs(tmp_path, walk_up=False, exclude={"archive"})
+        assert graphs == [(tmp_path / "notes" / "knowledge_graph.db").resolve()]
+
+    def test_respects_max_depth_down(self, tmp_path):
+        deep = tmp_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        (deep / "knowledge_graph.db").write_bytes(b"")
+        assert find_knowledge_graphs(tmp_path, walk_up=False, max_depth_down=3) == []
+        assert find_knowledge_graphs(tmp_path, walk_up=False, max_depth_down=4)
+
+    def test_early_exit_keeps_nearest_first(self, tmp_path):
+        close_db = tmp_path / "results" / "knowledge_graph.db"
+        close_db.parent.mkdir()
+        close_db.write_bytes(b"")
+        deep = tmp_path / "a" / "b"
+        deep.mkdir(parents=True)
+        (deep / "knowledge_graph.db").write_bytes(b"")
+        graphs = find_knowledge_graphs(tmp_path, walk_up=False, early_exit=True)
+        assert graphs == [close_db.resolve()]
+
+    def test_walk_up_stops_at_project_root(self, tmp_path):
+        (tmp_path / "knowledge_graph.db").write_bytes(b"")
+        project = tmp_path / "project"
+        (project / "src" / "pkg").mkdir(parents=True)
+        (project / "pyproject.toml").write_text("")
+        project_db = project / "knowledge_graph.db"
+        project_db.write_bytes(b"")
+        graphs = find_knowledge_graphs(project / "src" / "pkg")
+        assert graphs == [project_db.resolve()]
+
+    def test_walk_up_limited_levels(self, tmp_path):
+        (tmp_path / "knowledge_graph.db").write_bytes(b"")
+        child = tmp_path / "a" / "b" / "c"
+        child.mkdir(parents=True)
+        assert find_knowledge_graphs(child, max_walk_up=2) == []
+        assert find_knowledge_graphs(child, max_walk_up=3)
+
 
 class TestFindNearestGraph:
     def test_returns_closest(self, tmp_path):
@@ -81,6 +132,23 @@ class TestFindNearestGraph:
     def test_returns_none_when_empty(self, tmp_path):
         assert find_nearest_graph(tmp_path) is None
 
+    def test_result_is_cached_until_cleared(self, tmp_path):
+        assert find_nearest_graph(tmp_path) is None
+        db = tmp_path / "knowledge_graph.db"
+        db.write_bytes(b"")
+        assert find_nearest_graph(tmp_path) is None
+        clear_nearest_graph_cache()
+        assert find_nearest_graph(tmp_path) == db.resolve()
+
+    def test_deleted_cached_graph_triggers_rescan(self, tmp_path):
+        db = tmp_path / "knowledge_graph.db"
+        db.write_bytes(b"")
+        jf = tmp_path / "knowledge_graph.json"
+        jf.write_text('{"nodes":[], "relationships":[]}')
+        assert find_nearest_graph(tmp_path) == db.resolve()
+        db.unlink()
+        assert find_nearest_graph(tmp_path) == jf.resolve()
+
 
 class TestDescribeGraph:
     def test_describe_json_graph(self, tmp_path):
@@ -102,3 +170,18 @@ class TestDescribeGraph:
         assert info["entity_types"]["technology"] == 2
         assert info["entity_types"]["person"] == 1
         assert info["store_type"] == "json"
+
+    def test_describe_json_graph_merges_names_like_the_store(self, tmp_path):
+        data = {
+            "nodes": [
+                {"name": "Python", "type": "technology"},
+                {"name": "python", "type": "concept"},
+                {"name": "Alice"},
+            ],
+            "relationships": [],
+        }
+        jf = tmp_path / "knowledge_graph.json"
+        jf.write_text(json.dumps(data))
+        info = describe_graph(jf)
+        assert info["entity_count"] == 2
+        assert info["entity_types"] == {"technology": 1, "concept": 1}
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from video_processor.integrators.graph_query import GraphQueryEngine, QueryResult
+from video_processor.integrators.graph_query import GraphQueryEngine, QueryResult, _parse_json
 from video_processor.integrators.graph_store import InMemoryStore
 
 
@@ -67,6 +67,12 @@ class TestQueryResultToJson:
         assert parsed["data"]["key"] == "val"
         assert parsed["raw_query"] == "test()"
 
+    def test_json_serializes_description_sets_as_lists(self):
+        store = _make_populated_store()
+        r = GraphQueryEngine(store).entities(name="python")
+        parsed = json.loads(r.to_json())
+        assert parsed["data"][0]["descriptions"] == ["A programming language"]
+
 
 class TestQueryResultToMermaid:
     def test_mermaid_with_entities_and_rels(self):
@@ -84,6 +90,21 @@ class TestQueryResultToMermaid:
         assert "Bob" in mermaid
         assert "knows" in mermaid
 
+    def test_mermaid_declares_each_node_once_with_its_type(self):
+        r = QueryResult(
+            data=[
+                {"source": "Alice", "target": "Bob", "type": "knows"},
+                {"name": "Bob", "type": "person"},
+            ],
+            query_type="filter",
+        )
+        lines = r.to_mermaid().splitlines()
+        assert lines[1:4] == [
+            '    Alice["Alice"]',
+            '    Bob["Bob"]:::person',
+            '    Alice -- "knows" --> Bob',
+        ]
+
     def test_mermaid_empty(self):
         r = QueryResult(data=[], query_type="filter")
         mermaid = r.to_mermaid()
@@ -162,6 +183,54 @@ class TestDirectMode:
         assert len(entities) >= 2  # Alice + neighbors
         assert len(rels) >= 1
 
+    def test_neighbors_depth_two(self):
+        store = _make_populated_store()
+        engine = GraphQueryEngine(store)
+        result = engine.neighbors("Django", depth=2)
+        names = [item["name"] for item in result.data if "name" in item]
+        rels = [(r["source"], r["target"]) for r in result.data if "target" in r]
+        assert names == ["Django", "Python", "Alice"]
+        # Hop 2 rescans Python's edges in store order, including the hop-1 edge
+        assert rels == [("Django", "Python"), ("Alice", "Python"), ("Django", "Python")]
+
+    def test_neighbors_rebuilds_adjacency_after_new_relationship(self):
+        store = _make_populated_store()
+        engine = GraphQueryEngine(store)
+        assert len(engine.neighbors("Bob").data) == 3
+        store.add_relationship("Bob", "Django", "reviews")
+        names = [item["name"] for item in engine.neighbors("Bob").data if "name" in item]
+        assert names == ["Bob", "Alice", "Django"]
+
+    def test_repeated_reads_hit_cache_until_counts_change(self, monkeypatch):
+        store = _make_populated_store()
+        engine = GraphQueryEngine(store)
+        calls = []
+        real = store.get_all_entities
+        monkeypatch.setattr(store, "get_all_entities", lambda: calls.append(1) or real())
+
+        engine.stats()
+        engine.stats()
+        assert len(engine.entities(entity_type="person").data) == 2
+        assert len(calls) == 1
+
+        store.merge_entity("Carol", "person", [])
+        assert engine.stats().data["entity_count"] == 6
+        assert len(engine.entities(entity_type="person").data) == 3
+        assert len(calls) == 2
+
+    def test_invalidate_drops_cached_results(self, monkeypatch):
+        store = _make_populated_store()
+        engine = GraphQueryEngine(store)
+        calls = []
+        real = store.find_relationships
+        monkeypatch.setattr(store, "find_relationships", lambda **kw: calls.append(1) or real(**kw))
+
+        engine.relationships(source="alice")
+        engine.relationships(source="alice")
+        engine.invalidate()
+        engine.relationships(source="alice")
+        assert len(calls) == 2
+
     def test_neighbors_not_found(self):
         store = _make_populated_store()
         engine = GraphQueryEngine(store)
@@ -288,3 +357,19 @@ class TestAgenticMode:
         result = engine.ask("Gibberish?")
         assert result.data is None
         assert "parse" in result.explanation.lower() or "could not" in result.explanation.lower()
+
+
+class TestParseJson:
+    def test_plain_object(self):
+        assert _parse_json('{"action": "stats"}') == {"action": "stats"}
+
+    def test_object_in_prose_with_trailing_braces(self):
+        text = 'Plan: {"action": "entities", "name": "a}b"} -- or maybe {"action": "stats"}'
+        assert _parse_json(text) == {"action": "entities", "name": "a}b"}
+
+    def test_skips_unbalanced_prefix(self):
+        assert _parse_json('use {braces like this, then {"action": "stats"}') == {"action": "stats"}
+
+    def test_non_object_returns_none(self):
+        assert _parse_json("42") is None
+        assert _parse_json("no json here") is None
@@ -1,8 +1,20 @@
 """Tests for graph storage backends."""
 
+import io
+import json
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
 
-from video_processor.integrators.graph_store import InMemoryStore, create_store
+from video_processor.integrators.graph_store import (
+    GraphStore,
+    InMemoryStore,
+    NodeRecord,
+    RelationshipRow,
+    create_store,
+)
+from video_processor.models import Entity, KnowledgeGraphData, Relationship
 
 
 class TestInMemoryStore:
@@ -28,6 +40,26 @@ class TestInMemoryStore:
         assert "Snake-based" in entity["descriptions"]
         assert "Popular" in entity["descriptions"]
 
+    def test_descriptions_are_sorted_and_deduplicated(self):
+        store = InMemoryStore()
+        store.merge_entity("Python", "technology", ["b", "a", "b"])
+        descs = store.get_entity("python")["descriptions"]
+        assert descs == ("a", "b")
+        store.merge_entity("Python", "technology", ["a"])
+        assert store.get_entity("python")["descriptions"] is descs
+        store.merge_entity("Python", "technology", ["c", "a"])
+        assert store.get_entity("python")["descriptions"] == ("a", "b", "c")
+
+    def test_names_are_matched_by_lower_like_falkordb(self):
+        store = InMemoryStore()
+        store.merge_entity("Straße", "place", [])
+        store.merge_entity("STRASSE", "place", ["Street"])
+        store.merge_entity("ÉCOLE", "place", [])
+        # lower() keeps ß distinct from "ss", as FalkorDB's name_lower does
+        assert store.get_entity_count() == 3
+        assert store.has_entity("straße") and store.has_entity("école")
+        assert [e["name"] for e in store.find_entities(name="ASS")] == ["STRASSE"]
+
     def test_add_occurrence(self):
         store = InMemoryStore()
         store.merge_entity("Alice", "person", ["Engineer"])
@@ -127,6 +159,265 @@ class TestInMemoryStore:
         assert store2.get_entity_count() == 2
         assert store2.get_relationship_count() == 1
 
+    def test_find_entities_and_relationships(self):
+        store = InMemoryStore()
+        store.merge_entity("Python", "technology", [])
+        store.merge_entity("PyTorch", "technology", [])
+        store.merge_entity("Pyotr", "person", [])
+        store.add_relationship("Pyotr", "Python", "uses")
+        store.add_relationship("Pyotr", "PyTorch", "contributes_to")
+
+        assert [e["name"] for e in store.find_entities(name="PY", entity_type="Technology")] == [
+            "Python",
+            "PyTorch",
+        ]
+        assert len(store.find_entities(name="py", limit=1)) == 1
+        rels = store.find_relationships(source="pyotr", rel_type="USES")
+        assert [r["target"] for r in rels] == ["Python"]
+
+    def test_find_entities_vectorized_matches_scan(self, monkeypatch):
+        from video_processor.integrators import graph_store
+
+        store = InMemoryStore()
+        for i in range(300):
+            store.merge_entity(f"Node{i}", "person" if i % 3 else "Concept", [])
+        store.set_entity_properties("node4", {"type": "concept"})
+
+        expected = [e["name"] for e in GraphStore.find_entities(store, "NODE1", "concept", 20)]
+        scanned = [e["name"] for e in store.find_entities("NODE1", "concept", 20)]
+        monkeypatch.setattr(graph_store, "_VECTORIZE_MIN_ENTITIES", 100)
+        vectorized = [e["name"] for e in store.find_entities("NODE1", "concept", 20)]
+
+        assert expected == scanned == vectorized
+        assert "Node12" in expected
+        assert store.filter_indices(type_lc="concept", limit=3) == [0, 3, 4]
+
+    def test_types_and_labels_share_one_string(self):
+        store = InMemoryStore()
+        store.merge_entity("Alice", "".join(["per", "son"]), [])
+        store.merge_entity("Bob", "".join(["per", "son"]), [])
+        store.add_relationship("Alice", "Bob", "".join(["kno", "ws"]))
+        store.add_relationship("Bob", "Alice", "".join(["kno", "ws"]))
+        alice, bob = store.get_all_entities()
+        assert alice["type"] is bob["type"]
+        rels = store.get_all_relationships()
+        assert rels[0]["type"] is rels[1]["type"]
+        assert store.find_entities(entity_type="PERSON", limit=5) == [alice, bob]
+        assert store.find_entities(entity_type="robot") == []
+
+    def test_find_relationships_stops_iterating_at_limit(self, monkeypatch):
+        store = InMemoryStore()
+        for i in range(10):
+            store.add_relationship(f"a{i}", f"b{i}", "uses")
+        pulled = []
+
+        def iter_relationships():
+            for r in store._relationships:
+                pulled.append(r)
+                yield r
+
+        monkeypatch.setattr(store, "iter_relationships", iter_relationships)
+        assert len(GraphStore.find_relationships(store, rel_type="uses", limit=3)) == 3
+        assert len(pulled) == 3
+
+    def test_find_relationships_uses_prelowered_keys(self):
+        store = InMemoryStore()
+        store.add_relationship("Alice", "Python", "USES")
+        store.add_typed_relationship("Django", "Python", "DEPENDS_ON", {"weight": 1})
+        store.add_relationship("alice", "Bob", "knows")
+        for kwargs in ({"source": "ALICE"}, {"target": "pyth", "rel_type": "depends"}, {}):
+            assert store.find_relationships(**kwargs) == GraphStore.find_relationships(
+                store, **kwargs
+            )
+        assert store.has_relationship("ALICE", "python")
+        assert not store.has_relationship("Python", "Alice")
+
+    def test_freeze_builds_csr_adjacency(self):
+        store = InMemoryStore()
+        for name in ("Alice", "Bob", "Python"):
+            store.merge_entity(name, "person", [])
+        store.add_relationship("Alice", "Python", "uses")
+        store.add_relationship("Bob", "Alice", "knows")
+        store.add_relationship("alice", "Bob", "knows")
+        store.add_relationship("Alice", "Rust", "learning")
+
+        csr = store.freeze()
+        assert csr.names == ("alice", "bob", "python", "rust")
+        assert csr.offsets.tolist() == [0, 3, 4, 4, 4]
+        assert csr.neighbors.dtype == np.int32
+        assert csr.edge_type.dtype == np.uint8
+        assert [csr.names[i] for i in store.out_neighbors("ALICE")] == ["python", "bob", "rust"]
+        assert [csr.labels[t] for t in csr.edge_type[:3]] == ["uses", "knows", "learning"]
+        assert store.degree("Bob") == 1
+        assert store.degree("Python") == 0
+        assert store.degree("Nobody") == 0
+        assert store.freeze() is csr
+
+        store.add_relationship("Python", "Rust", "inspired")
+        assert store.freeze() is not csr
+        assert store.degree("python") == 1
+
+    def test_bfs_and_pagerank_on_csr(self):
+        from video_processor.integrators import graph_store
+
+        store = InMemoryStore()
+        for src, tgt in [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("e", "a")]:
+            store.add_relationship(src, tgt, "links")
+        csr = store.freeze()
+        dist = dict(zip(csr.names, store.bfs("A").tolist()))
+        assert dist == {"a": 0, "b": 1, "c": 2, "d": 3, "e": -1}
+        assert (store.bfs("nobody") == -1).all()
+
+        rank = store.pagerank()
+        assert rank.sum() == pytest.approx(1.0)
+        assert rank[csr.id_of["a"]] > rank[csr.id_of["e"]]
+        python_rank = graph_store._pagerank(csr.offsets, csr.neighbors, len(csr.names))
+        assert rank == pytest.approx(python_rank)
+        python_dist = graph_store._bfs(csr.offsets, csr.neighbors, csr.id_of["a"])
+        assert python_dist.tolist() == store.bfs("a").tolist()
+        assert InMemoryStore().pagerank().size == 0
+
+    def test_nodes_are_slotted_records_read_as_dicts(self):
+        store = InMemoryStore()
+        store.merge_entity("Python", "technology", ["A language"], source="transcript")
+        assert isinstance(store._nodes["python"], NodeRecord)
+        assert store.set_entity_properties("python", {"type": "language", "dag_id": 7})
+        assert store.get_entity("PYTHON") == {
+            "id": "Python",
+            "name": "Python",
+            "type": "language",
+            "descriptions": ("A language",),
+            "occurrences": [],
+            "source": "transcript",
+            "dag_id": 7,
+        }
+        assert store.find_entities(entity_type="language")[0]["dag_id"] == 7
+        assert "row" not in store.get_entity("python")
+        assert not store.set_entity_properties("rust", {"dag_id": 1})
+
+    def test_type_change_updates_that_entity_only(self):
+        store = InMemoryStore()
+        for name in ("a", "b", "c"):
+            store.merge_entity(name, "concept", [])
+        store.find_entities(entity_type="concept")  # build the column arrays
+        store._names_lc = None  # the update must not scan the name column
+        store.set_entity_properties("B", {"type": "person"})
+        store._names_lc = ["a", "b", "c"]
+        assert [e["name"] for e in store.find_entities(entity_type="person")] == ["b"]
+        assert [e["name"] for e in store.find_entities(entity_type="concept")] == ["a", "c"]
+
+    def test_set_entity_properties_keeps_record_invariants(self):
+        store = InMemoryStore()
+        store.merge_entity("Python", "technology", ["b"])
+        store.set_entity_properties("python", {"descriptions": ["c", "a", "c"]})
+        assert store.get_entity("python")["descriptions"] == ("a", "c")
+        store.merge_entity("Python", "technology", ["b"])
+        assert store.get_entity("python")["descriptions"] == ("a", "b", "c")
+
+        with pytest.raises(ValueError, match="rename"):
+            store.set_entity_properties("python", {"name": "Rust"})
+        assert store.has_entity("Python") and not store.has_entity("Rust")
+
+    def test_existing_entities(self):
+        store = InMemoryStore()
+        store.merge_entity("Alice", "person", [])
+        store.merge_entity("Python", "technology", [])
+        assert store.existing_entities({"ALICE", "python", "Bob"}) == {"ALICE", "python"}
+        assert GraphStore.existing_entities(store, ["alice", "Bob"]) == {"alice"}
+
+    def test_get_relationships_columnar(self):
+        store = InMemoryStore()
+        store.add_relationship("Alice", "Python", "uses", content_source="t0", timestamp=2.0)
+        store.add_relationship("Bob", "Rust", "learning")
+        assert store.get_relationships_columnar() == {
+            "source": ["Alice", "Bob"],
+            "target": ["Python", "Rust"],
+            "type": ["uses", "learning"],
+            "content_source": ["t0", None],
+            "timestamp": [2.0, None],
+        }
+        assert InMemoryStore().get_relationships_columnar()["source"] == []
+
+    def test_get_entities_by_names(self):
+        store = InMemoryStore()
+        store.merge_entity("Alice", "person", ["Engineer"])
+        store.merge_entity("Python", "", [])
+        store.merge_entity("Bob", "person", [])
+        expected = [{"name": "Alice", "type": "person"}, {"name": "Python", "type": "concept"}]
+        assert store.get_entities_by_names(["python", "ALICE", "Nobody"]) == expected
+        assert GraphStore.get_entities_by_names(store, {"python", "alice"}) == expected
+        assert store.get_entities_by_names([]) == []
+
+    def test_add_relationships_bulk(self):
+        store = InMemoryStore()
+        store.add_relationships_bulk(
+            [("Alice", "Python", "uses", "t0", 1.0), ("Bob", "Python", "uses", None, None)]
+        )
+        assert store.get_relationship_count() == 2
+        assert store.get_all_relationships()[0]["content_source"] == "t0"
+        assert store.has_relationship("bob", "python", "uses")
+
+    def test_has_relationship_by_edge_label(self):
+        store = InMemoryStore()
+        store.add_typed_relationship("Django", "Python", "DEPENDS_ON")
+        store.add_relationship("django", "python", "uses")
+        assert store.has_relationship("Django", "Python", "DEPENDS_ON")
+        assert store.has_relationship("DJANGO", "PYTHON", "uses")
+        assert not store.has_relationship("Django", "Python", "USES_SYSTEM")
+        assert not store.has_relationship("Python", "Django", "DEPENDS_ON")
+
+    def test_merge_entities_bulk(self):
+        store = InMemoryStore()
+        store.merge_entity("Python", "technology", ["Language"])
+        store.merge_entities_bulk(
+            [
+                {"name": "python", "type": "technology", "descriptions": ["Popular"]},
+                {"name": "Alice", "type": "person", "source": "t0"},
+            ]
+        )
+        assert store.get_entity_count() == 2
+        assert store.get_entity("Python")["descriptions"] == ("Language", "Popular")
+        assert store.get_entity("alice")["source"] == "t0"
+
+    def test_iter_relationship_rows(self):
+        store = InMemoryStore()
+        store.add_relationship("Alice", "Bob", "knows", content_source="t0", timestamp=5.0)
+        store.add_typed_relationship("Bob", "Alice", "REPORTS_TO")
+        rows = list(store.iter_relationship_rows())
+        assert rows == [
+            RelationshipRow("Alice", "Bob", "knows", "t0", 5.0),
+            RelationshipRow("Bob", "Alice", "REPORTS_TO"),
+        ]
+        assert not hasattr(rows[0], "__dict__")
+
+    def test_to_json_stream(self):
+        store = InMemoryStore()
+        buf = io.BytesIO()
+        store.to_json_stream(buf)
+        assert json.loads(buf.getvalue()) == {"nodes": [], "relationships": []}
+
+        store.merge_entity("Python", "technology", ["A language"])
+        store.merge_entity("Alice", "person", [])
+        store.add_occurrence("Alice", "t0", 1.0, "hi")
+        store.add_relationship("Alice", "Python", "uses")
+        store.add_relationship("Python", "Alice", "helps", timestamp=3)
+        buf = io.BytesIO()
+        store.to_json_stream(buf)
+        assert buf.getvalue().decode() == KnowledgeGraphData(
+            nodes=[
+                Entity(name="Python", type="technology", descriptions=["A language"]),
+                Entity(
+                    name="Alice",
+                    type="person",
+                    occurrences=[{"source": "t0", "timestamp": 1.0, "text": "hi"}],
+                ),
+            ],
+            relationships=[
+                Relationship(source="Alice", target="Python", type="uses"),
+                Relationship(source="Python", target="Alice", type="helps", timestamp=3.0),
+            ],
+        ).model_dump_json(indent=2)
+
     def test_empty_store(self):
         store = InMemoryStore()
         assert store.get_entity_count() == 0
@@ -155,6 +446,234 @@ class TestCreateStore:
         assert store.get_entity_count() == 1
 
 
+class _FakeGraph:
+    """Stands in for a FalkorDB graph: records queries, answers counts."""
+
+    def __init__(self, entity_count=0):
+        self.queries = []
+        self.entity_count = entity_count
+
+    def query(self, query, params=None):
+        self.queries.append(query)
+        if "count(e)" in query:
+            return SimpleNamespace(result_set=[[self.entity_count]])
+        if "count(r)" in query:
+            return SimpleNamespace(result_set=[[0]])
+        return SimpleNamespace(result_set=[], nodes_created=1, relationships_created=1)
+
+
+def _falkordb_store_with(graph):
+    from video_processor.integrators.graph_store import FalkorDBStore
+
+    store = object.__new__(FalkorDBStore)
+    store._graph = graph
+    store._entity_count = store._rel_count = None
+    store._entity_names = None
+    return store
+
+
+class TestFalkorDBStoreCounts:
+    def test_counts_follow_writes_without_requerying(self):
+        graph = _FakeGraph(entity_count=2)
+        store = _falkordb_store_with(graph)
+        assert store.get_entity_count() == 2
+        assert store.get_relationship_count() == 0
+        queried = len(graph.queries)
+
+        store.merge_entity("Python", "technology", ["A language"])
+        store.add_relationship("Python", "Django", "uses")
+        assert store.get_entity_count() == 3
+        assert store.get_relationship_count() == 1
+        assert len(graph.queries) == queried + 2
+
+    def test_raw_query_invalidates_counts(self):
+        graph = _FakeGraph(entity_count=2)
+        store = _falkordb_store_with(graph)
+        store.get_entity_count()
+        store.raw_query("CREATE (:Entity {name: 'x'})")
+        graph.entity_count = 5
+        assert store.get_entity_count() == 5
+
+
+class TestFalkorDBStoreIndexes:
+    def test_only_missing_indexes_are_created(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            _q(query),
+            SimpleNamespace(result_set=[["Entity", ["name_lower", "type"]]]),
+        )[1]
+        _falkordb_store_with(graph)._ensure_indexes()
+        assert graph.queries == [
+            "CALL db.indexes() YIELD label, properties",
+            "CREATE INDEX FOR (e:Entity) ON (e.dag_id)",
+        ]
+
+    def test_falls_back_to_creating_all_when_listing_fails(self):
+        graph = _FakeGraph()
+
+        def query(query, params=None):
+            graph.queries.append(query)
+            if query.startswith("CALL"):
+                raise RuntimeError("unknown procedure")
+            raise RuntimeError("index already exists")
+
+        graph.query = query
+        _falkordb_store_with(graph)._ensure_indexes()
+        assert len(graph.queries) == 4
+
+
+class TestFalkorDBStoreHasEntity:
+    def test_has_entity_answers_from_loaded_names(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            SimpleNamespace(result_set=[["python"]])
+            if "RETURN e.name_lower" in query
+            else _q(query)
+        )
+        store = _falkordb_store_with(graph)
+        assert store.has_entity("Python")
+        assert not store.has_entity("Django")
+        store.merge_entity("Django", "technology", [])
+        store.merge_entities_bulk([{"name": "Flask", "type": "technology"}])
+        assert store.has_entity("DJANGO") and store.has_entity("flask")
+        store.raw_query("MATCH (e) DETACH DELETE e")
+        assert store._entity_names is None
+
+    def test_existing_entities_in_one_query_until_names_are_loaded(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            _q(query),
+            SimpleNamespace(result_set=[["python"]]),
+        )[1]
+        store = _falkordb_store_with(graph)
+        assert store.existing_entities(["Python", "PYTHON", "Rust"]) == {"Python", "PYTHON"}
+        assert graph.queries[0].startswith("UNWIND $names")
+        assert store.existing_entities([]) == set()
+        assert len(graph.queries) == 1
+
+        store.has_entity("python")  # loads the name set
+        queried = len(graph.queries)
+        assert store.existing_entities(["python", "Rust"]) == {"python"}
+        assert len(graph.queries) == queried
+
+    def test_bare_merge_of_known_entity_skips_the_round_trip(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            SimpleNamespace(result_set=[["python"]])
+            if "RETURN e.name_lower" in query
+            else _q(query)
+        )
+        store = _falkordb_store_with(graph)
+        store.merge_entity("PYTHON", "technology", [])
+        assert graph.queries == []
+        store.merge_entity("Rust", "technology", [])
+        assert "descriptions = []" in graph.queries[-1]
+        assert "$descs" not in graph.queries[-1]
+        store.merge_entity("Python", "technology", ["A language"])
+        assert "$descs" in graph.queries[-1]
+
+
+class TestFalkorDBStoreOccurrences:
+    def test_bulk_occurrences_are_sent_in_batches(self, monkeypatch):
+        from video_processor.integrators import graph_store
+
+        monkeypatch.setattr(graph_store, "_OCCURRENCE_BATCH_SIZE", 2)
+        graph = _FakeGraph()
+        store = _falkordb_store_with(graph)
+        store.add_occurrences_bulk((f"E{i}", "t0", float(i), None) for i in range(5))
+        assert len(graph.queries) == 3
+        assert all(q.startswith("UNWIND $rows") for q in graph.queries)
+
+    def test_bulk_relationships_are_sent_in_batches(self, monkeypatch):
+        from video_processor.integrators import graph_store
+
+        monkeypatch.setattr(graph_store, "_RELATIONSHIP_BATCH_SIZE", 2)
+        graph = _FakeGraph()
+        store = _falkordb_store_with(graph)
+        store._rel_count = 0
+        store.add_relationships_bulk((f"A{i}", f"B{i}", "uses", "t0", None) for i in range(3))
+        assert len(graph.queries) == 2
+        assert all("MATCH (b:Entity {name_lower: r.tgt_lower})" in q for q in graph.queries)
+        assert store.get_relationship_count() == 2  # one per query from the fake stats
+
+
+class TestFalkorDBStoreTypedRelationships:
+    def test_typed_relationship_queries_are_reused_per_shape(self):
+        graph = _FakeGraph()
+        store = _falkordb_store_with(graph)
+        store.add_typed_relationship("a", "b", "DEPENDS_ON", {"weight": 1})
+        store.add_typed_relationship("c", "d", "DEPENDS_ON", {"weight": 2})
+        assert graph.queries[0] is graph.queries[1]
+        assert graph.queries[0].endswith("CREATE (a)-[r:DEPENDS_ON]->(b) SET r.weight = $prop_0")
+
+    def test_filter_and_property_queries_are_reused_per_shape(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            SimpleNamespace(result_set=[["a"], ["b"]])
+            if "RETURN e.name_lower" in query
+            else _q(query)
+        )
+        store = _falkordb_store_with(graph)
+        store.find_entities(name="py", entity_type="technology")
+        store.find_entities(name="dj", entity_type="concept")
+        store.find_relationships(source="a", rel_type="uses")
+        store.find_relationships(source="b", rel_type="knows")
+        store.set_entity_properties("a", {"dag_id": 1, "layer": "x"})
+        store.set_entity_properties("b", {"dag_id": 2, "layer": "y"})
+        queries = graph.queries
+        assert len(queries) == 6
+        assert queries[0] is queries[1]
+        assert queries[2] is queries[3]
+        assert queries[4] is queries[5]
+        assert queries[4].endswith("SET e.dag_id = $prop_0, e.layer = $prop_1")
+
+    def test_relationships_columnar_transposes_rows(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None: SimpleNamespace(
+            result_set=[["A", "B", None, "t0", 1.0], ["C", "D", "uses", None, None]]
+        )
+        cols = _falkordb_store_with(graph).get_relationships_columnar()
+        assert cols["source"] == ["A", "C"]
+        assert cols["type"] == ["related_to", "uses"]
+        assert cols["timestamp"] == [1.0, None]
+        graph.query = lambda query, params=None: SimpleNamespace(result_set=[])
+        assert _falkordb_store_with(graph).get_relationships_columnar()["type"] == []
+
+    def test_get_entities_by_names_is_one_query(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            _q(query),
+            SimpleNamespace(result_set=[["Alice", "person"], ["Python", None]]),
+        )[1]
+        store = _falkordb_store_with(graph)
+        assert store.get_entities_by_names(["ALICE", "python"]) == [
+            {"name": "Alice", "type": "person"},
+            {"name": "Python", "type": "concept"},
+        ]
+        assert store.get_entities_by_names([]) == []
+        assert len(graph.queries) == 1
+
+    def test_has_relationship_stops_at_first_edge(self):
+        graph = _FakeGraph()
+        graph.query = lambda query, params=None, _q=graph.query: (
+            _q(query),
+            SimpleNamespace(result_set=[[1]] if params["tgt_lower"] == "b" else []),
+        )[1]
+        store = _falkordb_store_with(graph)
+        assert store.has_relationship("A", "B", "USES")
+        assert not store.has_relationship("A", "C")
+        assert all(q.endswith("RETURN 1 LIMIT 1") for q in graph.queries)
+
+    def test_rejects_labels_and_keys_that_are_not_identifiers(self):
+        store = _falkordb_store_with(_FakeGraph())
+        with pytest.raises(ValueError):
+            store.add_typed_relationship("a", "b", "X]->(b) DETACH DELETE b //")
+        with pytest.raises(ValueError):
+            store.add_typed_relationship("a", "b", "USES", {"w = 1, r.x": 2})
+        with pytest.raises(ValueError):
+            store.has_relationship("a", "b", "USES`")
+
+
 # Conditional FalkorDB tests
 _falkordb_available = False
 try:
@@ -258,3 +777,33 @@ class TestFalkorDBStore:
         assert store.has_entity("Python")
         assert store.has_entity("python")
         store.close()
+
+    def test_find_entities_and_relationships(self, tmp_path):
+        from video_processor.integrators.graph_store import FalkorDBStore
+
+        store = FalkorDBStore(tmp_path / "test.db")
+        store.merge_entity("Python", "technology", [])
+        store.merge_entity("Pyotr", "person", [])
+        store.add_relationship("Pyotr", "Python", "uses")
+        assert [e["name"] for e in store.find_entities(name="PY", entity_type="technology")] == [
+            "Python"
+        ]
+        assert [r["target"] for r in store.find_relationships(rel_type="USES")] == ["Python"]
+        store.close()
+
+    def test_merge_entities_bulk(self, tmp_path):
+        from video_processor.integrators.graph_store import FalkorDBStore
+
+        store = FalkorDBStore(tmp_path / "test.db")
+        store.merge_entity("Python", "technology", ["Language"])
+        store.merge_entities_bulk(
+            [
+                {"name": "python", "type": "technology", "descriptions": ["Language", "Popular"]},
+                {"name": "Alice", "type": "person", "descriptions": ["Engineer"]},
+                {"name": "ALICE", "type": "person", "descriptions": ["Speaker"]},
+            ]
+        )
+        assert store.get_entity_count() == 2
+        assert sorted(store.get_entity("python")["descriptions"]) == ["Language", "Popular"]
+        assert sorted(store.get_entity("alice")["descriptions"]) == ["Engineer", "Speaker"]
+        store.close()
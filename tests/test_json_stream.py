@@ -0,0 +1,48 @@
+"""Tests for incremental JSON artifact reading."""
+
+import json
+import sys
+
+import pytest
+
+from video_processor.utils.json_stream import iter_json_arrays
+
+GRAPH = {
+    "nodes": [{"name": "Python", "type": "technology"}, {"name": "Alice", "type": "person"}],
+    "relationships": [{"source": "Alice", "target": "Python", "timestamp": 1.5}],
+}
+
+
+@pytest.fixture
+def graph_path(tmp_path):
+    path = tmp_path / "knowledge_graph.json"
+    path.write_text(json.dumps(GRAPH))
+    return path
+
+
+def _expected():
+    return [("nodes", n) for n in GRAPH["nodes"]] + [
+        ("relationships", r) for r in GRAPH["relationships"]
+    ]
+
+
+class TestIterJsonArrays:
+    def test_streams_with_ijson(self, graph_path):
+        pytest.importorskip("ijson")
+        items = list(iter_json_arrays(graph_path, "nodes", "relationships"))
+        assert items == _expected()
+        assert isinstance(items[-1][1]["timestamp"], float)
+
+    def test_falls_back_to_json(self, graph_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "ijson", None)
+        assert list(iter_json_arrays(graph_path, "nodes", "relationships")) == _expected()
+
+    def test_missing_key_yields_nothing(self, graph_path):
+        assert list(iter_json_arrays(graph_path, "segments")) == []
+
+    def test_reads_compressed_file(self, graph_path):
+        pytest.importorskip("zstandard")
+        from video_processor.utils.compression import write_zstd
+
+        zst_path = write_zstd(graph_path, graph_path.read_text())
+        assert list(iter_json_arrays(zst_path, "nodes", "relationships")) == _expected()
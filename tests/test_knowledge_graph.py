@@ -0,0 +1,311 @@
+"""Tests for the knowledge graph integrator."""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from video_processor.integrators.knowledge_graph import KnowledgeGraph
+
+
+def _extraction(entities, relationships=()):
+    return json.dumps(
+        {
+            "entities": [
+                {"name": name, "type": etype, "description": f"{name} desc"}
+                for name, etype in entities
+            ],
+            "relationships": [
+                {"source": src, "target": tgt, "type": rtype} for src, tgt, rtype in relationships
+            ],
+        }
+    )
+
+
+class TestAddContent:
+    def test_entities_occurrences_and_relationships_go_through_bulk_calls(self):
+        pm = MagicMock()
+        pm.chat.return_value = _extraction(
+            [("Alice", "person"), ("Python", "technology")],
+            [("Alice", "Python", "uses"), ("Alice", "Nobody", "knows")],
+        )
+        kg = KnowledgeGraph(provider_manager=pm)
+        store = kg._store
+        store.merge_entities_bulk = MagicMock(wraps=store.merge_entities_bulk)
+        store.add_relationships_bulk = MagicMock(wraps=store.add_relationships_bulk)
+
+        kg.add_content("Alice uses Python.", "transcript_batch_0", timestamp=1.5)
+
+        store.merge_entities_bulk.assert_called_once()
+        store.add_relationships_bulk.assert_called_once()
+
+        assert store.get_entity("alice")["descriptions"] == ("Alice desc",)
+        assert store.get_entity("python")["occurrences"] == [
+            {"source": "transcript_batch_0", "timestamp": 1.5, "text": "Alice uses Python."}
+        ]
+        assert store.get_all_relationships() == [
+            {
+                "source": "Alice",
+                "target": "Python",
+                "type": "uses",
+                "content_source": "transcript_batch_0",
+                "timestamp": 1.5,
+            }
+        ]
+
+    def test_only_endpoints_not_extracted_here_are_looked_up(self):
+        pm = MagicMock()
+        pm.chat.return_value = _extraction(
+            [("Alice", "person")], [("Alice", "Bob", "knows"), ("Alice", "Ghost", "sees")]
+        )
+        kg = KnowledgeGraph(provider_manager=pm)
+        kg._store.merge_entity("Bob", "person", [])
+        kg._store.existing_entities = MagicMock(wraps=kg._store.existing_entities)
+
+        kg.add_content("Alice knows Bob.", "transcript_batch_0")
+
+        kg._store.existing_entities.assert_called_once_with({"Bob", "Ghost"})
+        assert [(r["source"], r["target"]) for r in kg._store.get_all_relationships()] == [
+            ("Alice", "Bob")
+        ]
+
+
+class TestGenerateMermaid:
+    def test_keeps_highest_degree_nodes_and_their_edges(self):
+        kg = KnowledgeGraph()
+        for name in ("Loner", "Hub", "Spoke A", "Spoke B"):
+            kg._store.merge_entity(name, "concept", [])
+        kg._store.add_relationship("Hub", "Spoke A", "has")
+        kg._store.add_relationship("Hub", "Spoke B", "has")
+        kg._store.add_relationship("Spoke A", "Loner", "near")
+
+        lines = kg.generate_mermaid(max_nodes=2).splitlines()
+
+        assert lines[1:3] == ['    Hub["Hub"]:::concept', '    Spoke_A["Spoke A"]:::concept']
+        assert '    Hub -- "has" --> Spoke_A' in lines
+        assert not any("Loner" in line or "Spoke_B" in line for line in lines)
+
+    def test_pads_with_unconnected_entities_without_loading_all_entities(self):
+        kg = KnowledgeGraph()
+        for name in ("Alone", "Hub", "Spoke", "Also alone"):
+            kg._store.merge_entity(name, "concept", [])
+        kg._store.add_relationship("Hub", "Spoke", "has")
+        kg._store.get_all_entities = MagicMock(side_effect=AssertionError("full scan"))
+
+        lines = kg.generate_mermaid(max_nodes=3).splitlines()
+
+        assert [line.split("[")[0].strip() for line in lines[1:4]] == ["Hub", "Spoke", "Alone"]
+        assert "Also_alone" not in "\n".join(lines)
+
+    def test_edges_with_pipes_in_names_are_not_merged(self):
+        kg = KnowledgeGraph()
+        for name in ("a|b", "c", "a", "b|c"):
+            kg._store.merge_entity(name, "concept", [])
+        kg._store.add_relationship("a|b", "c", "x")
+        kg._store.add_relationship("a", "b|c", "x")
+        kg._store.add_relationship("a", "b|c", "x")
+
+        edges = [line for line in kg.generate_mermaid().splitlines() if "-->" in line]
+
+        assert edges == ['    a_b -- "x" --> c', '    a -- "x" --> b_c']
+
+
+class TestProcessTranscript:
+    def test_batches_are_sourced_by_start_index(self):
+        pm = MagicMock()
+        pm.chat.return_value = _extraction([("Topic", "concept")])
+        kg = KnowledgeGraph(provider_manager=pm)
+        # Equal segments: looking a batch up by value would find the first one
+        segment = {"text": "same", "start": 0.0}
+        kg.process_transcript({"segments": [segment] * 5}, batch_size=2)
+        occurrences = kg._store.get_entity("topic")["occurrences"]
+        assert [o["source"] for o in occurrences] == [
+            "transcript_batch_0",
+            "transcript_batch_2",
+            "transcript_batch_4",
+        ]
+
+    def test_speakers_are_registered_with_one_lookup(self):
+        kg = KnowledgeGraph()
+        kg._store.merge_entity("Bob", "person", ["Host"])
+        kg._store.has_entity = MagicMock(side_effect=AssertionError("per-segment lookup"))
+        kg._store.existing_entities = MagicMock(wraps=kg._store.existing_entities)
+        segments = [
+            {"text": "hi", "speaker": "Alice"},
+            {"text": "hello", "speaker": "bob"},
+            {"text": "again", "speaker": "ALICE"},
+            {"text": "so"},
+        ]
+        kg.process_transcript({"segments": segments})
+
+        kg._store.existing_entities.assert_called_once()
+        assert [(e["name"], e["descriptions"]) for e in kg._store.get_all_entities()] == [
+            ("Bob", ("Host",)),
+            ("Alice", ("Speaker in transcript",)),
+        ]
+
+    def test_blank_batches_are_skipped_and_empty_texts_dropped(self):
+        pm = MagicMock()
+        pm.chat.return_value = _extraction([])
+        kg = KnowledgeGraph(provider_manager=pm)
+        segments = [{"text": " "}, {}, {"text": "a"}, {"text": ""}, {"text": "b"}]
+        kg.process_transcript({"segments": segments}, batch_size=2)
+        contents = [c.args[0][0]["content"].split("CONTENT:\n")[1] for c in pm.chat.call_args_list]
+        assert [c.split("\n")[0] for c in contents] == ["a", "b"]
+
+    def test_llm_calls_overlap_and_results_apply_in_order(self):
+        started, release = [], threading.Event()
+
+        def chat(messages, **kwargs):
+            text = messages[0]["content"].split("CONTENT:\n")[1].split("\n")[0]
+            started.append(text)
+            if len(started) == 3:
+                release.set()
+            # Every call waits until all three are in flight at once
+            assert release.wait(timeout=5)
+            return _extraction([(f"Entity {text}", "concept")])
+
+        pm = MagicMock()
+        pm.chat.side_effect = chat
+        kg = KnowledgeGraph(provider_manager=pm)
+        segments = [{"text": t, "start": float(i)} for i, t in enumerate("abc")]
+        kg.process_transcript({"segments": segments}, batch_size=1, max_workers=3)
+
+        assert [e["name"] for e in kg._store.get_all_entities()] == [
+            "Entity a",
+            "Entity b",
+            "Entity c",
+        ]
+
+    def test_failed_batch_is_skipped_without_losing_the_others(self):
+        def chat(messages, **kwargs):
+            text = messages[0]["content"].split("CONTENT:\n")[1].split("\n")[0]
+            if text == "b":
+                raise RuntimeError("rate limited")
+            return _extraction([(f"Entity {text}", "concept")])
+
+        pm = MagicMock()
+        pm.chat.side_effect = chat
+        kg = KnowledgeGraph(provider_manager=pm)
+        segments = [{"text": t, "start": float(i)} for i, t in enumerate("abc")]
+        kg.process_transcript({"segments": segments}, batch_size=1)
+
+        assert [e["name"] for e in kg._store.get_all_entities()] == ["Entity a", "Entity c"]
+
+    def test_batch_mode_submits_every_batch_as_one_job(self):
+        pm = MagicMock()
+        pm.chat_batch.side_effect = lambda requests, **kw: [
+            _extraction([("Entity " + r[0]["content"].split("CONTENT:\n")[1][0], "concept")])
+            for r in requests
+        ]
+        kg = KnowledgeGraph(provider_manager=pm)
+        segments = [{"text": t, "start": float(i)} for i, t in enumerate("abc")]
+        kg.process_transcript({"segments": segments}, batch_size=1, mode="batch")
+
+        pm.chat_batch.assert_called_once()
+        pm.chat.assert_not_called()
+        assert [e["name"] for e in kg._store.get_all_entities()] == [
+            "Entity a",
+            "Entity b",
+            "Entity c",
+        ]
+        assert kg._store.get_entity("entity b")["occurrences"][0]["timestamp"] == 1.0
+
+    def test_batch_mode_falls_back_when_provider_has_no_batch_api(self):
+        pm = MagicMock()
+        pm.chat_batch.side_effect = NotImplementedError("no batches")
+        pm.chat.return_value = _extraction([("Topic", "concept")])
+        kg = KnowledgeGraph(provider_manager=pm)
+        kg.process_transcript({"segments": [{"text": "a"}, {"text": "b"}]}, mode="batch")
+
+        pm.chat.assert_called_once()
+        assert kg._store.has_entity("Topic")
+
+    def test_batch_mode_falls_back_when_the_batch_job_fails(self):
+        pm = MagicMock()
+        pm.chat_batch.side_effect = RuntimeError("OpenAI batch b1 expired")
+        pm.chat.return_value = _extraction([("Topic", "concept")])
+        kg = KnowledgeGraph(provider_manager=pm)
+        kg.process_transcript({"segments": [{"text": "a"}, {"text": "b"}]}, mode="batch")
+
+        pm.chat.assert_called_once()
+        assert kg._store.has_entity("Topic")
+
+    def test_batch_mode_retries_only_the_failed_requests(self):
+        pm = MagicMock()
+        pm.chat_batch.return_value = [_extraction([("Entity a", "concept")]), None]
+        pm.chat.return_value = _extraction([("Entity b", "concept")])
+        kg = KnowledgeGraph(provider_manager=pm)
+        segments = [{"text": t, "start": float(i)} for i, t in enumerate("ab")]
+        kg.process_transcript({"segments": segments}, batch_size=1, mode="batch")
+
+        pm.chat.assert_called_once()
+        assert "CONTENT:\nb" in pm.chat.call_args.args[0][0]["content"]
+        assert [e["name"] for e in kg._store.get_all_entities()] == ["Entity a", "Entity b"]
+        assert kg._store.get_entity("entity b")["occurrences"][0]["timestamp"] == 1.0
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="mode"):
+            KnowledgeGraph().process_transcript({"segments": []}, mode="later")
+
+
+class TestProcessDiagrams:
+    def test_text_diagrams_are_extracted_and_every_diagram_gets_a_node(self):
+        pm = MagicMock()
+        pm.chat.side_effect = lambda messages, **kw: _extraction(
+            [("Label " + messages[0]["content"].split("CONTENT:\n")[1][0], "concept")]
+        )
+        kg = KnowledgeGraph(provider_manager=pm)
+        kg.process_diagrams(
+            [
+                {"text_content": "x-axis", "frame_index": 1},
+                {"text_content": "", "frame_index": 2},
+                {"text_content": "y-axis", "frame_index": 3},
+            ]
+        )
+        names = [e["name"] for e in kg._store.get_all_entities()]
+        assert names == ["Label x", "diagram_0", "diagram_1", "Label y", "diagram_2"]
+        assert kg._store.get_entity("diagram_1")["occurrences"][0]["source"] == "diagram_1"
+
+
+class TestToData:
+    def test_nodes_are_streamed_from_the_store(self):
+        kg = KnowledgeGraph()
+        kg._store.merge_entity("Python", "technology", ["A language"])
+        kg._store.add_occurrence("Python", "transcript_batch_0", 1.0, "Python")
+        kg._store.get_all_entities = MagicMock(side_effect=AssertionError("materialized"))
+
+        (node,) = kg.to_data().nodes
+
+        assert (node.name, node.type, node.descriptions) == ("Python", "technology", ["A language"])
+        assert node.occurrences[0]["source"] == "transcript_batch_0"
+
+
+class TestSave:
+    def test_streamed_file_matches_model_dump(self, tmp_path):
+        kg = KnowledgeGraph()
+        kg._store.merge_entity("Zoë", "person", ["Designer", 'Speaker "quoted"'])
+        kg._store.merge_entity("Python", "technology", [])
+        kg._store.add_occurrence("Zoë", "transcript_batch_0", 3, "Zoë said\nhello")
+        kg._store.add_relationship("Zoë", "Python", "uses", "transcript_batch_0", 4)
+        kg._store.add_relationship("Python", "Zoë", "helps")
+
+        path = kg.save(tmp_path / "knowledge_graph")
+
+        assert path.read_text() == kg.to_data().model_dump_json(indent=2)
+
+    def test_empty_graph_matches_model_dump(self, tmp_path):
+        kg = KnowledgeGraph()
+        path = kg.save(tmp_path / "kg.json")
+        assert path.read_text() == kg.to_data().model_dump_json(indent=2)
+        assert KnowledgeGraph.from_dict(json.loads(path.read_text())).to_dict() == kg.to_dict()
+
+    def test_compress_writes_zst_alongside(self, tmp_path):
+        pytest.importorskip("zstandard")
+        from video_processor.utils.compression import read_text
+
+        kg = KnowledgeGraph()
+        kg._store.merge_entity("Python", "technology", ["A language"])
+        path = kg.save(tmp_path / "kg.json", compress=True)
+        assert read_text(path.with_name("kg.json.zst")) == path.read_text()
@@ -0,0 +1,40 @@
+"""Tests for the CLI output formatter."""
+
+from video_processor.cli.output_formatter import OutputFormatter
+
+
+class TestOutputFormatter:
+    def test_organize_outputs_copies_diagram_images(self, tmp_path):
+        md = tmp_path / "analysis.md"
+        md.write_text("# Report")
+        kg = tmp_path / "knowledge_graph.json"
+        kg.write_text("{}")
+        img = tmp_path / "diagram_0.jpg"
+        img.write_bytes(b"\xff\xd8\xff fake")
+
+        formatter = OutputFormatter(tmp_path / "out")
+        outputs = formatter.organize_outputs(
+            md, kg, [{"image_path": str(img), "description": "Login flow"}]
+        )
+
+        assert outputs["diagram_images"] == [str(tmp_path / "out" / "diagrams" / "diagram_0.jpg")]
+        # Analysis JSON is written once, by DiagramAnalyzer, not copied or rewritten here
+        assert not list((tmp_path / "out" / "diagrams").glob("*.json"))
+
+    def test_create_html_index_escapes_names(self, tmp_path):
+        formatter = OutputFormatter(tmp_path)
+        outputs = {
+            "markdown": str(tmp_path / "markdown" / "analysis.md"),
+            "diagram_images": [str(tmp_path / "diagrams" / "<d>.jpg")],
+            "frames": [],
+            "knowledge_graph": str(tmp_path / "data" / "knowledge_graph.json"),
+        }
+
+        html = formatter.create_html_index(outputs).read_text()
+
+        assert "<h2>Analysis Report</h2>" in html
+        assert "<h2>Diagrams</h2>" in html
+        assert "<h2>Key Frames</h2>" not in html
+        assert "&lt;d&gt;.jpg" in html
+        assert "data/knowledge_graph.json" in html
+        assert html.endswith("</html>")
@@ -1,5 +1,8 @@
 """Tests for the provider abstraction layer."""
 
+import json
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -108,6 +111,164 @@ class TestProviderManager:
         assert "openai/gpt-4o" == used["vision"]
         assert "anthropic/claude-sonnet-4-5-20250929" == used["chat"]
 
+    def test_concurrent_chat_usage_is_tracked_per_thread(self):
+        class SlowProvider(BaseProvider):
+            provider_name = "openai"
+
+            def __init__(self):
+                self.barrier = threading.Barrier(4)
+
+            def chat(self, messages, max_tokens=4096, temperature=0.7, model=None):
+                tokens = int(messages[0]["content"])
+                self._last_usage = {"input_tokens": tokens, "output_tokens": 1}
+                self.barrier.wait(timeout=5)  # all usages are set before any is read
+                return "ok"
+
+            analyze_image = transcribe_audio = list_models = None
+
+        mgr = ProviderManager(chat_model="gpt-4o")
+        mgr._providers["openai"] = SlowProvider()
+        threads = [
+            threading.Thread(target=mgr.chat, args=([{"role": "user", "content": str(n)}],))
+            for n in (1, 10, 100, 1000)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mgr.usage.total_input_tokens == 1111
+        assert mgr.usage.total_api_calls == 4
+
+    def test_chat_batch_routes_and_tracks_usage(self):
+        mgr = ProviderManager(chat_model="gpt-4o")
+        mock_prov = self._make_mock_provider("openai")
+        mock_prov.chat_batch.return_value = ["a", "b"]
+        mock_prov._last_usage = {"input_tokens": 7, "output_tokens": 3}
+        mgr._providers["openai"] = mock_prov
+
+        assert mgr.chat_batch([[{"role": "user", "content": "x"}]] * 2) == ["a", "b"]
+        assert mock_prov.chat_batch.call_args.kwargs["model"] == "gpt-4o"
+        assert mgr.usage.total_input_tokens == 7
+
+    def test_chat_batch_unsupported_by_default(self):
+        class PlainProvider(BaseProvider):
+            chat = analyze_image = transcribe_audio = list_models = None
+
+        with pytest.raises(NotImplementedError):
+            PlainProvider().chat_batch([[{"role": "user", "content": "x"}]])
+
+
+class TestChatBatch:
+    _REQUESTS = [[{"role": "user", "content": c}] for c in ("one", "two", "three")]
+
+    def test_openai_uploads_jsonl_polls_and_orders_results(self):
+        from video_processor.providers.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="test-key")
+        provider._BATCH_POLL_SECONDS = 0
+        client = provider.client = MagicMock()
+        client.batches.create.return_value = SimpleNamespace(id="b1", status="validating")
+        client.batches.retrieve.side_effect = [
+            SimpleNamespace(id="b1", status="in_progress"),
+            SimpleNamespace(id="b1", status="completed", output_file_id="out"),
+        ]
+
+        def line(custom_id, text):
+            body = {
+                "choices": [{"message": {"content": text}}],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 2},
+            }
+            return json.dumps({"custom_id": custom_id, "response": {"body": body}})
+
+        client.files.content.return_value.text = "\n".join(
+            [
+                line("2", "third"),
+                line("0", "first"),
+                json.dumps({"custom_id": "1", "response": None, "error": {"code": "x"}}),
+            ]
+        )
+
+        assert provider.chat_batch(self._REQUESTS, model="gpt-4o-mini") == ["first", None, "third"]
+        assert provider._last_usage == {"input_tokens": 20, "output_tokens": 4}
+
+        name, payload = client.files.create.call_args.kwargs["file"]
+        uploaded = [json.loads(row) for row in payload.decode().splitlines()]
+        assert name == "batch_input.jsonl"
+        assert [(r["custom_id"], r["url"], r["body"]["model"]) for r in uploaded] == [
+            (str(i), "/v1/chat/completions", "gpt-4o-mini") for i in range(3)
+        ]
+        assert uploaded[1]["body"]["messages"] == self._REQUESTS[1]
+
+    def test_openai_failed_batch_raises(self):
+        from video_processor.providers.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="test-key")
+        provider.client = MagicMock()
+        provider.client.batches.create.return_value = SimpleNamespace(id="b1", status="expired")
+
+        with pytest.raises(RuntimeError, match="expired"):
+            provider.chat_batch(self._REQUESTS)
+
+    def test_anthropic_polls_until_ended_and_orders_results(self):
+        from video_processor.providers.anthropic_provider import AnthropicProvider
+
+        provider = AnthropicProvider(api_key="test-key")
+        provider._BATCH_POLL_SECONDS = 0
+        client = provider.client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(
+            id="b1", processing_status="in_progress"
+        )
+        client.messages.batches.retrieve.return_value = SimpleNamespace(
+            id="b1", processing_status="ended"
+        )
+
+        def succeeded(custom_id, text):
+            message = SimpleNamespace(
+                content=[SimpleNamespace(text=text)],
+                usage=SimpleNamespace(input_tokens=5, output_tokens=1),
+            )
+            return SimpleNamespace(
+                custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message)
+            )
+
+        client.messages.batches.results.return_value = [
+            succeeded("1", "second"),
+            SimpleNamespace(custom_id="0", result=SimpleNamespace(type="errored")),
+            succeeded("2", "third"),
+        ]
+
+        assert provider.chat_batch(self._REQUESTS) == [None, "second", "third"]
+        assert provider._last_usage == {"input_tokens": 10, "output_tokens": 2}
+        submitted = client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in submitted] == ["0", "1", "2"]
+        assert submitted[2]["params"]["messages"] == self._REQUESTS[2]
+
+    def test_anthropic_skips_result_without_content(self):
+        from video_processor.providers.anthropic_provider import AnthropicProvider
+
+        provider = AnthropicProvider(api_key="test-key")
+        client = provider.client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(
+            id="b1", processing_status="ended"
+        )
+
+        def succeeded(custom_id, content):
+            message = SimpleNamespace(
+                content=content, usage=SimpleNamespace(input_tokens=5, output_tokens=0)
+            )
+            return SimpleNamespace(
+                custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message)
+            )
+
+        client.messages.batches.results.return_value = [
+            succeeded("0", [SimpleNamespace(text="first")]),
+            succeeded("1", []),
+            succeeded("2", [SimpleNamespace(text="third")]),
+        ]
+
+        assert provider.chat_batch(self._REQUESTS) == ["first", None, "third"]
+
 
 class TestDiscovery:
     @patch("video_processor.providers.discovery._cached_models", None)
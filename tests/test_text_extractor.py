@@ -0,0 +1,126 @@
+"""Tests for the text extractor module."""
+
+import multiprocessing
+import os
+import sys
+import types
+
+import cv2
+import numpy as np
+import pytest
+
+from video_processor.extractors.text_extractor import TextExtractor
+
+
+@pytest.fixture
+def text_image():
+    image = np.full((200, 400, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "Hello", (20, 120), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 0), 3)
+    return image
+
+
+def test_detect_text_regions(text_image):
+    """Test that text produces plausible bounding boxes inside the image."""
+    regions = TextExtractor().detect_text_regions(text_image)
+    assert regions
+    for x, y, w, h in regions:
+        assert w > 5 and h > 5
+        assert 0 <= x and x + w <= 400
+        assert 0 <= y and y + h <= 200
+
+
+def test_detect_text_regions_downscales_large_images(text_image):
+    """Test that boxes found on a downscaled 4K image map back to full resolution."""
+    large = cv2.resize(text_image, (3840, 1920), interpolation=cv2.INTER_NEAREST)
+    regions = TextExtractor().detect_text_regions(large)
+    assert regions
+    assert max(x + w for x, _, w, _ in regions) > 1024
+    assert all(x + w <= 3840 + 4 and y + h <= 1920 + 4 for x, y, w, h in regions)
+
+
+def test_preprocess_image_binarizes_dark_text_on_white(text_image):
+    """Test that preprocessing yields a binary image with text dark, page white."""
+    result = TextExtractor().preprocess_image(text_image)
+    assert result.shape == text_image.shape[:2]
+    assert set(np.unique(result)) <= {0, 255}
+    assert result[0, 0] == 255
+    assert (result == 0).any()
+
+
+def test_merge_overlapping_boxes():
+    """Test that overlapping boxes merge even when not adjacent in x order."""
+    boxes = [
+        (0, 0, 10, 100),  # tall box overlapping the last one
+        (5, 200, 10, 10),  # disjoint, sorts between the two
+        (8, 90, 10, 10),
+        (100, 100, 5, 5),  # isolated
+    ]
+    merged = TextExtractor()._merge_overlapping_boxes(boxes)
+    assert merged == [(0, 0, 18, 100), (5, 200, 10, 10), (100, 100, 5, 5)]
+
+
+def test_merge_overlapping_boxes_chains_through_union():
+    """Test that a merged box absorbs boxes only its union reaches."""
+    boxes = [(0, 0, 10, 10), (8, 8, 10, 10), (15, 0, 2, 2)]
+    assert TextExtractor()._merge_overlapping_boxes(boxes) == [(0, 0, 18, 18)]
+    assert TextExtractor()._merge_overlapping_boxes([]) == []
+
+
+def test_extract_text_from_regions_single_ocr_call(monkeypatch):
+    """Test that all regions are OCR'd in one call and words map back by offset."""
+    calls = []
+
+    def image_to_data(image, output_type=None, config=""):
+        calls.append((image.shape, config))
+        # Crops stack top-to-bottom: region b (y=10, h=20) at 0, region a at 20 + 20
+        return {
+            "text": ["beta", "", "alpha", "gamma"],
+            "top": [2, 0, 45, 45],
+            "height": [10, 0, 10, 10],
+            "block_num": [1, 1, 1, 1],
+            "par_num": [1, 1, 1, 1],
+            "line_num": [1, 1, 2, 2],
+        }
+
+    fake = types.SimpleNamespace(
+        image_to_data=image_to_data,
+        Output=types.SimpleNamespace(DICT="dict"),
+        pytesseract=types.SimpleNamespace(tesseract_cmd=None),
+    )
+    monkeypatch.setitem(sys.modules, "pytesseract", fake)
+
+    extractor = TextExtractor(tesseract_path="tesseract")
+    image = np.full((100, 100, 3), 255, dtype=np.uint8)
+    region_a, region_b = (0, 50, 60, 30), (10, 10, 40, 20)
+
+    texts = extractor.extract_text_from_regions(image, [region_a, region_b])
+
+    assert texts == {region_a: "alpha gamma", region_b: "beta"}
+    assert calls == [((90, 60), "--psm 6")]
+
+
+def test_extract_text_batch_without_local_ocr():
+    """Test that the batch API falls back to in-process extraction."""
+    images = [np.full((50, 50), 255, dtype=np.uint8)] * 3
+    texts = TextExtractor().extract_text_batch(images, detect_regions=False)
+    assert texts == ["API-based text extraction not yet implemented"] * 3
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="fake module needs fork inheritance"
+)
+def test_extract_text_batch_uses_worker_processes(monkeypatch):
+    """Test that local OCR runs in worker processes and keeps input order."""
+    fake = types.SimpleNamespace(
+        image_to_string=lambda image: f"{image.shape[1]} {os.getpid()}",
+        pytesseract=types.SimpleNamespace(tesseract_cmd=None),
+    )
+    monkeypatch.setitem(sys.modules, "pytesseract", fake)
+
+    images = [np.full((20, 10 + i, 3), 255, dtype=np.uint8) for i in range(6)]
+    texts = TextExtractor(tesseract_path="tesseract").extract_text_batch(
+        images, detect_regions=False, max_workers=2
+    )
+
+    assert [int(t.split()[0]) for t in texts] == [10 + i for i in range(6)]
+    assert str(os.getpid()) not in {t.split()[1] for t in texts}
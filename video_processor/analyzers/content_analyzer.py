@@ -1,6 +1,7 @@
 """Content cross-referencing between transcript and diagram entities."""
 
 import logging
+from itertools import chain
 from typing import List, Optional
 
 from video_processor.models import Entity, KeyPoint
@@ -46,7 +47,9 @@ class ContentAnalyzer:
             if key in merged:
                 existing = merged[key]
                 existing.source = "both"
-                existing.descriptions = list(set(existing.descriptions + e.descriptions))
+                existing.descriptions = list(
+                    dict.fromkeys(chain(existing.descriptions, e.descriptions))
+                )
                 existing.occurrences.extend(e.occurrences)
             else:
                 merged[key] = Entity(
@@ -80,7 +83,7 @@ class ContentAnalyzer:
                         d_entity = merged.pop(d_key)
                         t_entity.source = "both"
                         t_entity.descriptions = list(
-                            set(t_entity.descriptions + d_entity.descriptions)
+                            dict.fromkeys(chain(t_entity.descriptions, d_entity.descriptions))
                         )
                         t_entity.occurrences.extend(d_entity.occurrences)
 
@@ -153,9 +153,11 @@ class DiagramAnalyzer:
         diagram_idx = 0
         capture_idx = 0
 
+        info_enabled = logger.isEnabledFor(logging.INFO)
         for i, fp in enumerate(tqdm(frame_paths, desc="Analyzing frames", unit="frame")):
             fp = Path(fp)
-            logger.info(f"Classifying frame {i}/{len(frame_paths)}: {fp.name}")
+            if info_enabled:
+                logger.info(f"Classifying frame {i}/{len(frame_paths)}: {fp.name}")
 
             try:
                 classification = self.classify_frame(fp)
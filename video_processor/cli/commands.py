@@ -10,27 +10,26 @@ import click
 import colorlog
 from tqdm import tqdm
 
+_LOG_FORMATTER = colorlog.ColoredFormatter(
+    "%(log_color)s%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+    log_colors={
+        "DEBUG": "cyan",
+        "INFO": "green",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red,bg_white",
+    },
+)
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging with color formatting."""
-    log_level = logging.DEBUG if verbose else logging.INFO
-    formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
-    )
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_LOG_FORMATTER)
     root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    for handler in root_logger.handlers:
-        root_logger.removeHandler(handler)
+    root_logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root_logger.handlers.clear()
     root_logger.addHandler(console_handler)
 
 
@@ -81,6 +80,11 @@ def cli(ctx, verbose):
 )
 @click.option("--vision-model", type=str, default=None, help="Override model for vision tasks")
 @click.option("--chat-model", type=str, default=None, help="Override model for LLM/chat tasks")
+@click.option(
+    "--llm-batch",
+    is_flag=True,
+    help="Build the knowledge graph via the provider's batch API (cheaper, can take hours)",
+)
 @click.pass_context
 def analyze(
     ctx,
@@ -96,6 +100,7 @@ def analyze(
     provider,
     vision_model,
     chat_model,
+    llm_batch,
 ):
     """Analyze a single video and extract structured knowledge."""
     from video_processor.pipeline import process_single_video
@@ -122,6 +127,7 @@ def analyze(
             periodic_capture_seconds=periodic_capture,
             use_gpu=use_gpu,
             title=title,
+            llm_batch=llm_batch,
         )
         click.echo(pm.usage.format_summary())
         click.echo(f"\n  Results: {output}/manifest.json")
@@ -384,19 +390,36 @@ def clear_cache(ctx, cache_dir, older_than, clear_all):
         return
 
     try:
-        from video_processor.utils.api_cache import ApiCache
+        import time
 
-        namespaces = [d.name for d in cache_path.iterdir() if d.is_dir()]
-        if not namespaces:
-            logging.info("No cache namespaces found")
-            return
+        # Single scandir sweep over every namespace — no per-namespace ApiCache
+        # construction, and the mtime comes from the directory entry itself.
+        cutoff = time.time() - older_than if older_than is not None and not clear_all else None
 
         total_cleared = 0
-        for namespace in namespaces:
-            cache = ApiCache(cache_path, namespace)
-            cleared = cache.clear(older_than if not clear_all else None)
-            total_cleared += cleared
-            logging.info(f"Cleared {cleared} entries from {namespace} cache")
+        found_namespace = False
+        with os.scandir(cache_path) as namespaces:
+            for ns_dir in namespaces:
+                if not ns_dir.is_dir():
+                    continue
+                found_namespace = True
+                cleared = 0
+                with os.scandir(ns_dir.path) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".json") or not entry.is_file():
+                            continue
+                        try:
+                            if cutoff is None or entry.stat().st_mtime < cutoff:
+                                os.unlink(entry.path)
+                                cleared += 1
+                        except OSError as e:
+                            logging.warning(f"Error clearing cache file {entry.path}: {e}")
+                total_cleared += cleared
+                logging.info(f"Cleared {cleared} entries from {ns_dir.name} cache")
+
+        if not found_namespace:
+            logging.info("No cache namespaces found")
+            return
 
         logging.info(f"Total cleared: {total_cleared} entries")
     except Exception as e:
@@ -471,7 +494,7 @@ def agent_analyze(ctx, input, output, depth, title, provider, vision_model, chat
     "--db-path",
     type=click.Path(),
     default=None,
-    help="Path to knowledge_graph.db or .json (auto-detected if omitted)",
+    help="Path to knowledge_graph.db, .json or .json.zst (auto-detected if omitted)",
 )
 @click.option(
     "--mode",
@@ -544,7 +567,7 @@ def query(ctx, question, db_path, mode, output_format, interactive, provider, ch
                 click.echo("Warning: could not initialize LLM provider for agentic mode.", err=True)
 
     # Create engine
-    if graph_path.suffix == ".json":
+    if graph_path.suffix in (".json", ".zst"):
         engine = GraphQueryEngine.from_json_path(graph_path, provider_manager=pm)
     else:
         engine = GraphQueryEngine.from_db_path(graph_path, provider_manager=pm)
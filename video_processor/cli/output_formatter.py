@@ -4,10 +4,88 @@ import html
 import logging
 import shutil
 from pathlib import Path
+from string import Template
 from typing import Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# HTML index templates — parsed once at import, filled per render
+_PAGE = Template(
+    """\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>PlanOpticon Analysis Results</title>
+    <style>
+        body { font-family: Arial, sans-serif;\
+              margin: 0; padding: 20px; line-height: 1.6; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        h1 { color: #333; }
+        h2 { color: #555; margin-top: 30px; }
+        .section { margin-bottom: 30px; }
+        .files { display: flex; flex-wrap: wrap; }
+        .file-item { margin: 10px; text-align: center; }
+        .file-item img { max-width: 200px; max-height: 150px; object-fit: contain; }
+        .file-name { margin-top: 5px; font-size: 0.9em; }
+        a { color: #0066cc; text-decoration: none; }
+        a:hover { text-decoration: underline; }
+    </style>
+</head>
+<body>
+<div class='container'>
+    <h1>PlanOpticon Analysis Results</h1>
+
+${sections}</div>
+</body>
+</html>"""
+)
+
+_REPORT_SECTION = Template(
+    """\
+    <div class='section'>
+        <h2>Analysis Report</h2>
+        <p><a href='${href}' target='_blank'>View Analysis</a></p>
+    </div>
+"""
+)
+
+_IMAGE_SECTION = Template(
+    """\
+    <div class='section'>
+        <h2>${title}</h2>
+        <div class='files'>
+${items}        </div>
+    </div>
+"""
+)
+
+_IMAGE_ITEM = Template(
+    """\
+            <div class='file-item'>
+                <a href='${href}' target='_blank'>
+                    <img src='${href}' alt='${alt}'>
+                </a>
+                <div class='file-name'>${name}</div>
+            </div>
+"""
+)
+
+_DATA_SECTION = Template(
+    """\
+    <div class='section'>
+        <h2>Data Files</h2>
+        <ul>
+${items}        </ul>
+    </div>
+"""
+)
+
+_DATA_ITEM = Template(
+    """\
+            <li><a href='${href}' target='_blank'>${name}</a></li>
+"""
+)
+
 
 class OutputFormatter:
     """Formats and organizes output from video analysis."""
@@ -135,118 +213,47 @@ class OutputFormatter:
         Path
             Path to HTML index
         """
-        esc = html.escape
-
-        # Simple HTML index template
-        lines = [
-            "<!DOCTYPE html>",
-            "<html>",
-            "<head>",
-            "    <title>PlanOpticon Analysis Results</title>",
-            "    <style>",
-            "        body { font-family: Arial, sans-serif;"
-            "              margin: 0; padding: 20px; line-height: 1.6; }",
-            "        .container { max-width: 1200px; margin: 0 auto; }",
-            "        h1 { color: #333; }",
-            "        h2 { color: #555; margin-top: 30px; }",
-            "        .section { margin-bottom: 30px; }",
-            "        .files { display: flex; flex-wrap: wrap; }",
-            "        .file-item { margin: 10px; text-align: center; }",
-            "        .file-item img { max-width: 200px; max-height: 150px; object-fit: contain; }",
-            "        .file-name { margin-top: 5px; font-size: 0.9em; }",
-            "        a { color: #0066cc; text-decoration: none; }",
-            "        a:hover { text-decoration: underline; }",
-            "    </style>",
-            "</head>",
-            "<body>",
-            "<div class='container'>",
-            "    <h1>PlanOpticon Analysis Results</h1>",
-            "",
-        ]
+        sections = []
 
         # Add markdown section
         if outputs.get("markdown"):
-            md_path = Path(outputs["markdown"])
-            md_rel = esc(str(md_path.relative_to(self.output_dir)))
-
-            lines.append("    <div class='section'>")
-            lines.append("        <h2>Analysis Report</h2>")
-            lines.append(f"        <p><a href='{md_rel}' target='_blank'>View Analysis</a></p>")
-            lines.append("    </div>")
-
-        # Add diagrams section
-        if outputs.get("diagram_images") and len(outputs["diagram_images"]) > 0:
-            lines.append("    <div class='section'>")
-            lines.append("        <h2>Diagrams</h2>")
-            lines.append("        <div class='files'>")
-
-            for img_path in outputs["diagram_images"]:
-                img_path = Path(img_path)
-                img_rel = esc(str(img_path.relative_to(self.output_dir)))
-                img_name = esc(img_path.name)
-
-                lines.append("            <div class='file-item'>")
-                lines.append(f"                <a href='{img_rel}' target='_blank'>")
-                lines.append(f"                    <img src='{img_rel}' alt='Diagram'>")
-                lines.append("                </a>")
-                lines.append(f"                <div class='file-name'>{img_name}</div>")
-                lines.append("            </div>")
-
-            lines.append("        </div>")
-            lines.append("    </div>")
-
-        # Add frames section
-        if outputs.get("frames") and len(outputs["frames"]) > 0:
-            lines.append("    <div class='section'>")
-            lines.append("        <h2>Key Frames</h2>")
-            lines.append("        <div class='files'>")
-
-            for frame_path in outputs["frames"]:
-                frame_path = Path(frame_path)
-                frame_rel = esc(str(frame_path.relative_to(self.output_dir)))
-                frame_name = esc(frame_path.name)
-
-                lines.append("            <div class='file-item'>")
-                lines.append(f"                <a href='{frame_rel}' target='_blank'>")
-                lines.append(f"                    <img src='{frame_rel}' alt='Frame'>")
-                lines.append("                </a>")
-                lines.append(f"                <div class='file-name'>{frame_name}</div>")
-                lines.append("            </div>")
-
-            lines.append("        </div>")
-            lines.append("    </div>")
+            sections.append(_REPORT_SECTION.substitute(href=self._rel(outputs["markdown"])))
+
+        # Add diagrams and frames sections
+        for key, title, alt in (
+            ("diagram_images", "Diagrams", "Diagram"),
+            ("frames", "Key Frames", "Frame"),
+        ):
+            if outputs.get(key):
+                items = "".join(
+                    _IMAGE_ITEM.substitute(
+                        href=self._rel(p), alt=alt, name=html.escape(Path(p).name)
+                    )
+                    for p in outputs[key]
+                )
+                sections.append(_IMAGE_SECTION.substitute(title=title, items=items))
 
         # Add data files section
         data_files = []
         if outputs.get("knowledge_graph"):
-            data_files.append(Path(outputs["knowledge_graph"]))
+            data_files.append(outputs["knowledge_graph"])
         if outputs.get("transcript"):
-            data_files.append(Path(outputs["transcript"]))
+            data_files.append(outputs["transcript"])
 
         if data_files:
-            lines.append("    <div class='section'>")
-            lines.append("        <h2>Data Files</h2>")
-            lines.append("        <ul>")
-
-            for data_path in data_files:
-                data_rel = esc(str(data_path.relative_to(self.output_dir)))
-                data_name = esc(data_path.name)
-                lines.append(
-                    f"            <li><a href='{data_rel}' target='_blank'>{data_name}</a></li>"
-                )
-
-            lines.append("        </ul>")
-            lines.append("    </div>")
-
-        # Close HTML
-        lines.append("</div>")
-        lines.append("</body>")
-        lines.append("</html>")
+            items = "".join(
+                _DATA_ITEM.substitute(href=self._rel(p), name=html.escape(Path(p).name))
+                for p in data_files
+            )
+            sections.append(_DATA_SECTION.substitute(items=items))
 
         # Write HTML file
         index_path = self.output_dir / "index.html"
-        with open(index_path, "w") as f:
-            f.write("\n".join(lines))
+        index_path.write_text(_PAGE.substitute(sections="".join(sections)))
 
         logger.info(f"Created HTML index at {index_path}")
         return index_path
+
+    def _rel(self, path: Union[str, Path]) -> str:
+        """HTML-escaped path relative to the output directory."""
+        return html.escape(str(Path(path).relative_to(self.output_dir)))
@@ -1,17 +1,52 @@
-from video_processor.extractors.audio_extractor import AudioExtractor
-from video_processor.extractors.frame_extractor import (
-    calculate_frame_difference,
-    extract_frames,
-    is_gpu_available,
-    save_frames,
-)
-from video_processor.extractors.text_extractor import TextExtractor
+"""Frame, audio, and text extraction from video files.
+
+Submodules are imported lazily (PEP 562) so that pulling in one extractor does
+not load the dependencies of the others (OpenCV, librosa, OCR).
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from video_processor.extractors.audio_extractor import AudioExtractor
+    from video_processor.extractors.frame_extractor import (
+        calculate_frame_difference,
+        extract_frames,
+        is_gpu_available,
+        iter_frames,
+        save_frames,
+    )
+    from video_processor.extractors.text_extractor import TextExtractor
+
+_LAZY_ATTRS = {
+    "extract_frames": "frame_extractor",
+    "iter_frames": "frame_extractor",
+    "save_frames": "frame_extractor",
+    "calculate_frame_difference": "frame_extractor",
+    "is_gpu_available": "frame_extractor",
+    "AudioExtractor": "audio_extractor",
+    "TextExtractor": "text_extractor",
+}
 
 __all__ = [
     "extract_frames",
+    "iter_frames",
     "save_frames",
     "calculate_frame_difference",
     "is_gpu_available",
     "AudioExtractor",
     "TextExtractor",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -95,6 +95,60 @@ class AudioExtractor:
             logger.error(f"Error extracting audio: {str(e)}")
             raise
 
+    def extract_audio_to_array(self, media_path: Union[str, Path]) -> Tuple[np.ndarray, int]:
+        """
+        Decode audio from a video or audio file straight into memory.
+
+        ffmpeg writes raw 16-bit PCM to stdout, which is read into a NumPy array
+        without an intermediate WAV file on disk.
+
+        Parameters
+        ----------
+        media_path : str or Path
+            Path to video or audio file
+
+        Returns
+        -------
+        tuple
+            (audio_data, sample_rate) with float32 samples in [-1, 1]; stereo
+            audio is shaped (2, n) like librosa's output
+        """
+        media_path = Path(media_path)
+        if not media_path.exists():
+            raise FileNotFoundError(f"Media file not found: {media_path}")
+
+        channels = 1 if self.mono else 2
+        cmd = [
+            "ffmpeg",
+            "-i",
+            str(media_path),
+            "-vn",  # No video
+            "-f",
+            "s16le",  # Raw PCM 16-bit little-endian
+            "-acodec",
+            "pcm_s16le",
+            "-ar",
+            str(self.sample_rate),
+            "-ac",
+            str(channels),
+            "pipe:1",
+        ]
+
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to extract audio: {e.stderr.decode()}")
+            raise RuntimeError(f"Failed to extract audio: {e.stderr.decode()}")
+
+        audio_data = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+        if channels > 1:
+            audio_data = audio_data.reshape(-1, channels).T
+
+        logger.info(
+            f"Decoded audio from {media_path}: shape={audio_data.shape}, sr={self.sample_rate}"
+        )
+        return audio_data, self.sample_rate
+
     def load_audio(self, audio_path: Union[str, Path]) -> Tuple[np.ndarray, int]:
         """
         Load audio file into memory.
@@ -177,7 +231,8 @@ class AudioExtractor:
         Returns
         -------
         list
-            List of audio segments as numpy arrays
+            List of audio segments as read-only numpy views into audio_data
+            (call ``.copy()`` on a segment before modifying it)
         """
         # Convert ms to samples
         segment_length_samples = int(segment_length_ms * sample_rate / 1000)
@@ -186,21 +241,24 @@ class AudioExtractor:
         # Calculate hop length
         hop_length = segment_length_samples - overlap_samples
 
-        # Initialize segments list
+        num_samples = len(audio_data)
         segments = []
+        tail_start = 0
 
-        # Generate segments
-        for i in range(0, len(audio_data), hop_length):
-            end_idx = min(i + segment_length_samples, len(audio_data))
-            segment = audio_data[i:end_idx]
-
-            # Only add if segment is long enough (at least 50% of target length)
-            if len(segment) >= segment_length_samples * 0.5:
-                segments.append(segment)
-
-            # Break if we've reached the end
-            if end_idx == len(audio_data):
-                break
+        # Full-length segments as zero-copy strided views over audio_data
+        if num_samples >= segment_length_samples:
+            windows = np.lib.stride_tricks.sliding_window_view(audio_data, segment_length_samples)[
+                ::hop_length
+            ]
+            segments = list(windows)
+            last_end = (len(windows) - 1) * hop_length + segment_length_samples
+            tail_start = num_samples if last_end == num_samples else len(windows) * hop_length
+
+        # Trailing partial segment, kept only if at least 50% of target length
+        if tail_start < num_samples:
+            tail = audio_data[tail_start:]
+            if len(tail) >= segment_length_samples * 0.5:
+                segments.append(tail)
 
         logger.info(f"Segmented audio into {len(segments)} chunks")
         return segments
@@ -1,9 +1,17 @@
 """Frame extraction module for video processing."""
 
+import contextlib
 import functools
 import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -13,20 +21,77 @@ logger = logging.getLogger(__name__)
 
 # Haar cascade for face detection — ships with OpenCV
 _FACE_CASCADE_PATH = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-_FACE_CASCADE = None
+
+# Optional YuNet DNN face detector (cv2.FaceDetectorYN), used instead of the Haar
+# cascade when this points at the ONNX model (face_detection_yunet_2023mar.onnx)
+_YUNET_MODEL_PATH = os.getenv("PLANOPTICON_YUNET_MODEL", "")
+
+# Detectors are not safe to share between threads, so each thread gets its own
+_FACE_DETECTORS = threading.local()
+
+# Face detection runs on frames downscaled so their longest side is at most this
+_FACE_DETECT_MAX_DIM = 480
+
+# Frames are compared at this (width, height); the change threshold is scene-level
+_FRAME_DIFF_SIZE = (160, 90)
+
+# Below this many frames, worker start-up costs more than it saves
+_PARALLEL_SAVE_MIN_FRAMES = 8
+
+# Saved frames use OpenCV's default JPEG quality, passed once up front
+_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 95]
+
+# Seconds to let ffmpeg finish writing the soundtrack after the last frame
+_FFMPEG_EXIT_TIMEOUT = 60
 
 
 def _get_face_cascade() -> cv2.CascadeClassifier:
-    """Lazy-load the face cascade classifier."""
-    global _FACE_CASCADE
-    if _FACE_CASCADE is None:
-        _FACE_CASCADE = cv2.CascadeClassifier(_FACE_CASCADE_PATH)
-    return _FACE_CASCADE
+    """Lazy-load the face cascade classifier for the calling thread."""
+    cascade = getattr(_FACE_DETECTORS, "cascade", None)
+    if cascade is None:
+        cascade = _FACE_DETECTORS.cascade = cv2.CascadeClassifier(_FACE_CASCADE_PATH)
+    return cascade
+
+
+def _get_face_detector_yn() -> Optional["cv2.FaceDetectorYN"]:
+    """Lazy-load the calling thread's YuNet detector, or None if no model is configured."""
+    if not (_YUNET_MODEL_PATH and Path(_YUNET_MODEL_PATH).is_file()):
+        return None
+    detector = getattr(_FACE_DETECTORS, "yunet", None)
+    if detector is None:
+        detector = _FACE_DETECTORS.yunet = cv2.FaceDetectorYN.create(_YUNET_MODEL_PATH, "", (0, 0))
+    return detector
+
+
+def _detect_faces_yn(
+    detector: "cv2.FaceDetectorYN", frame: np.ndarray, min_size: int
+) -> List[Tuple[int, int, int, int]]:
+    """Run YuNet on a BGR (or grayscale) frame. Returns list of (x, y, w, h)."""
+    if frame.ndim == 2:
+        frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+    h, w = frame.shape[:2]
+    if detector.getInputSize() != (w, h):
+        detector.setInputSize((w, h))
+    _, faces = detector.detect(frame)
+    if faces is None:
+        return []
+    # Rows are x, y, w, h, five landmarks, score; YuNet has no minSize of its own
+    return [
+        (int(x), int(y), int(fw), int(fh))
+        for x, y, fw, fh in faces[:, :4]
+        if fw >= min_size and fh >= min_size
+    ]
 
 
 def detect_faces(frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
-    """Detect faces in a frame using Haar cascade. Returns list of (x, y, w, h)."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
+    """Detect faces in a frame using YuNet if configured, else Haar cascade.
+
+    Returns list of (x, y, w, h).
+    """
+    detector = _get_face_detector_yn()
+    if detector is not None:
+        return _detect_faces_yn(detector, frame, 40)
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
     cascade = _get_face_cascade()
     faces = cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(40, 40))
     return list(faces) if len(faces) > 0 else []
@@ -64,8 +129,40 @@ def is_people_frame(
     h, w = frame.shape[:2]
     frame_area = h * w
 
-    # Detect all faces
-    all_faces = detect_faces(frame)
+    # Work on one downscaled buffer for both face and black-bar checks; only face
+    # sizes and area ratios matter, so positions need not be rescaled
+    scale = min(1.0, _FACE_DETECT_MAX_DIM / max(h, w))
+    small = frame
+    if scale < 1.0:
+        small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+
+    # Check for video conference layout first: large black border areas (pixels
+    # < 15), counted in one pass without a boolean temporary
+    _, black_mask = cv2.threshold(gray, 14, 1, cv2.THRESH_BINARY_INV)
+    black_ratio = cv2.countNonZero(black_mask) / gray.size
+    has_black_bars = black_ratio > 0.25
+
+    # Without black bars only significant faces can matter, so the detector can
+    # skip every scale below min_face_size — or be skipped outright if none fit
+    min_face = 40 if has_black_bars else min_face_size
+    if min(h, w) < min_face:
+        return False
+
+    # Detect faces, reporting sizes in full-resolution pixels
+    min_size = max(1, int(min_face * scale))
+    detector = _get_face_detector_yn()
+    if detector is not None:
+        faces = _detect_faces_yn(detector, small, min_size)
+    else:
+        faces = _get_face_cascade().detectMultiScale(
+            gray,
+            scaleFactor=1.2,
+            minNeighbors=5,
+            minSize=(min_size, min_size),
+            flags=cv2.CASCADE_SCALE_IMAGE,
+        )
+    all_faces = [(x, y, int(fw / scale), int(fh / scale)) for (x, y, fw, fh) in faces]
 
     # Separate significant faces (webcam-sized) from tiny ones (sidebar thumbnails)
     significant_faces = [(x, y, fw, fh) for (x, y, fw, fh) in all_faces if fw >= min_face_size]
@@ -82,12 +179,7 @@ def is_people_frame(
             )
             return True
 
-    # Check for video conference layout: large black border areas
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if len(frame.shape) == 3 else frame
-    black_pixels = np.sum(gray < 15)
-    black_ratio = black_pixels / frame_area
-
-    if black_ratio > 0.25 and all_faces:
+    if has_black_bars and all_faces:
         # Significant black bars + any face = video conference UI (e.g., profile pic on black)
         logger.debug(f"People frame: black_ratio={black_ratio:.2f} with {len(all_faces)} faces")
         return True
@@ -96,29 +188,69 @@ def is_people_frame(
 
 
 def filter_people_frames(
-    frames: List[np.ndarray],
+    frames: Iterable[np.ndarray],
     face_area_threshold: float = 0.03,
 ) -> Tuple[List[np.ndarray], int]:
     """
     Filter out frames that primarily show people/webcam views.
 
+    Accepts any iterable of frames, e.g. the generator from iter_frames, so
+    people frames are dropped without ever being held in memory.
+
     Returns (filtered_frames, num_removed).
     """
-    filtered = []
-    removed = 0
-    for frame in tqdm(frames, desc="Filtering people frames", unit="frame"):
-        if is_people_frame(frame, face_area_threshold):
-            removed += 1
-        else:
-            filtered.append(frame)
+    total = len(frames) if hasattr(frames, "__len__") else None
+    seen = tqdm(frames, total=total, desc="Filtering people frames", unit="frame")
+    filtered = list(iter_content_frames(seen, face_area_threshold))
+    num_frames = seen.n
+    seen.close()
+    removed = num_frames - len(filtered)
 
     if removed:
-        logger.info(f"Filtered out {removed}/{len(frames)} people/webcam frames")
+        logger.info(f"Filtered out {removed}/{num_frames} people/webcam frames")
     return filtered, removed
 
 
+def iter_content_frames(
+    frames: Iterable[np.ndarray],
+    face_area_threshold: float = 0.03,
+) -> Iterator[np.ndarray]:
+    """
+    Yield the frames that do not primarily show people/webcam views, in order.
+
+    Frames are classified concurrently in small windows (OpenCV releases the GIL
+    while detecting), so at most a few frames are buffered at a time.
+    """
+    classify = functools.partial(is_people_frame, face_area_threshold=face_area_threshold)
+    workers = os.cpu_count() or 1
+    frames = iter(frames)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while window := list(islice(frames, workers * 2)):
+            # Parallelism comes from classifying frames side by side; OpenCV's own
+            # threads inside each detection would only oversubscribe the cores. The
+            # setting is process-wide, so it is restored before upstream decoding
+            # resumes and while this generator is suspended.
+            with _opencv_threads(1):
+                flags = list(executor.map(classify, window))
+            for frame, is_people in zip(window, flags):
+                if not is_people:
+                    yield frame
+
+
+@contextlib.contextmanager
+def _opencv_threads(num_threads: int) -> Iterator[None]:
+    """Temporarily set OpenCV's internal thread count, restoring it afterwards."""
+    previous = cv2.getNumThreads()
+    cv2.setNumThreads(num_threads)
+    try:
+        yield
+    finally:
+        cv2.setNumThreads(previous)
+
+
+@functools.lru_cache(maxsize=1)
 def is_gpu_available() -> bool:
-    """Check if GPU acceleration is available for OpenCV."""
+    """Check if GPU acceleration is available for OpenCV (queried once, then cached)."""
     try:
         # Check if CUDA is available
         count = cv2.cuda.getCudaEnabledDeviceCount()
@@ -135,7 +267,7 @@ def gpu_accelerated(func):
         if is_gpu_available() and not kwargs.get("disable_gpu"):
             # Remove the disable_gpu kwarg if it exists
             kwargs.pop("disable_gpu", None)
-            return func_gpu(*args, **kwargs)
+            return func_gpu(func, *args, **kwargs)
         # Remove the disable_gpu kwarg if it exists
         kwargs.pop("disable_gpu", None)
         return func(*args, **kwargs)
@@ -147,6 +279,9 @@ def calculate_frame_difference(prev_frame: np.ndarray, curr_frame: np.ndarray) -
     """
     Calculate the difference between two frames.
 
+    Frames are compared as 160x90 grayscale thumbnails, so the score reflects
+    scene-level change rather than pixel noise.
+
     Parameters
     ----------
     prev_frame : np.ndarray
@@ -159,25 +294,21 @@ def calculate_frame_difference(prev_frame: np.ndarray, curr_frame: np.ndarray) -
     float
         Difference score between 0 and 1
     """
-    # Convert to grayscale
-    if len(prev_frame.shape) == 3:
-        prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-    else:
-        prev_gray = prev_frame
+    return _frame_diff_gray(_diff_thumbnail(prev_frame), _diff_thumbnail(curr_frame))
 
-    if len(curr_frame.shape) == 3:
-        curr_gray = cv2.cvtColor(curr_frame, cv2.COLOR_BGR2GRAY)
-    else:
-        curr_gray = curr_frame
 
-    # Calculate absolute difference
-    diff = cv2.absdiff(prev_gray, curr_gray)
+def _diff_thumbnail(frame: np.ndarray) -> np.ndarray:
+    """Shrink a frame to a small grayscale thumbnail for scene-level differencing."""
+    small = cv2.resize(frame, _FRAME_DIFF_SIZE, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
 
-    # Normalize and return mean difference
-    return np.mean(diff) / 255.0
+
+def _frame_diff_gray(prev_gray: np.ndarray, curr_gray: np.ndarray) -> float:
+    """Mean absolute difference of two grayscale thumbnails, normalized to 0-1."""
+    diff = cv2.absdiff(prev_gray, curr_gray)
+    return cv2.mean(diff)[0] / 255.0
 
 
-@gpu_accelerated
 def extract_frames(
     video_path: Union[str, Path],
     sampling_rate: float = 1.0,
@@ -185,9 +316,59 @@ def extract_frames(
     periodic_capture_seconds: float = 30.0,
     max_frames: Optional[int] = None,
     resize_to: Optional[Tuple[int, int]] = None,
+    disable_gpu: bool = False,
 ) -> List[np.ndarray]:
     """
-    Extract frames from video based on visual change detection + periodic capture.
+    Extract frames from video into a list; see iter_frames for the streaming form.
+
+    Parameters
+    ----------
+    video_path : str or Path
+        Path to video file
+    sampling_rate : float
+        Frame sampling rate (1.0 = every frame)
+    change_threshold : float
+        Threshold for detecting significant visual changes
+    periodic_capture_seconds : float
+        Capture a frame every N seconds regardless of change (0 to disable)
+    max_frames : int, optional
+        Maximum number of frames to extract
+    resize_to : tuple of (width, height), optional
+        Resize frames to this dimension
+    disable_gpu : bool
+        Force the CPU implementation even if a GPU is available
+
+    Returns
+    -------
+    list
+        List of extracted frames as numpy arrays
+    """
+    return list(
+        iter_frames(
+            video_path,
+            sampling_rate=sampling_rate,
+            change_threshold=change_threshold,
+            periodic_capture_seconds=periodic_capture_seconds,
+            max_frames=max_frames,
+            resize_to=resize_to,
+            disable_gpu=disable_gpu,
+        )
+    )
+
+
+@gpu_accelerated
+def iter_frames(
+    video_path: Union[str, Path],
+    sampling_rate: float = 1.0,
+    change_threshold: float = 0.15,
+    periodic_capture_seconds: float = 30.0,
+    max_frames: Optional[int] = None,
+    resize_to: Optional[Tuple[int, int]] = None,
+    audio_path: Optional[Union[str, Path]] = None,
+    audio_sample_rate: int = 16000,
+) -> Iterator[np.ndarray]:
+    """
+    Stream frames from video based on visual change detection + periodic capture.
 
     Two capture strategies work together:
       1. Change detection: capture when visual difference exceeds threshold
@@ -211,11 +392,20 @@ def extract_frames(
         Maximum number of frames to extract
     resize_to : tuple of (width, height), optional
         Resize frames to this dimension
+    audio_path : str or Path, optional
+        When frames are already decoded through ffmpeg (sampling_rate < 0.5), also
+        write the soundtrack here as mono 16-bit WAV from that same process, so the
+        video is demuxed only once. The file appears only once every frame has been
+        read; it is not written on the OpenCV path, if the video has no audio, or if
+        iteration stops early. Callers extract audio separately when it is missing.
+    audio_sample_rate : int
+        Sample rate for *audio_path*
 
     Returns
     -------
-    list
-        List of extracted frames as numpy arrays
+    iterator
+        Captured frames as numpy arrays, yielded as they are decoded. The video
+        is opened and validated eagerly; decoding starts on first iteration.
     """
     video_path = Path(video_path)
     if not video_path.exists():
@@ -231,6 +421,7 @@ def extract_frames(
 
     # Calculate frame interval based on sampling rate
     if sampling_rate <= 0:
+        cap.release()
         raise ValueError("Sampling rate must be positive")
 
     frame_interval = max(1, int(1 / sampling_rate))
@@ -244,10 +435,45 @@ def extract_frames(
         f"Periodic capture: every {periodic_capture_seconds:.0f}s"
     )
 
-    extracted_frames = []
-    prev_frame = None
-    frame_idx = 0
+    # Sparse sampling: let ffmpeg drop the unsampled frames (and resize) before they
+    # ever reach Python, instead of grabbing every frame through OpenCV. That process
+    # also writes the soundtrack if one is wanted and the video has one.
+    if sampling_rate < 0.5 and shutil.which("ffmpeg"):
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        cap.release()
+        if audio_path is not None and not _has_audio_stream(video_path):
+            audio_path = None
+        frames = _iter_frames_ffmpeg(
+            video_path,
+            frame_interval,
+            resize_to or (width, height),
+            audio_path=Path(audio_path) if audio_path is not None else None,
+            audio_sample_rate=audio_sample_rate,
+        )
+    else:
+        frames = _iter_frames_opencv(cap, frame_interval, resize_to)
+
+    return _capture_frames(
+        frames, frame_count, frame_interval, periodic_interval, change_threshold, max_frames
+    )
+
+
+def _capture_frames(
+    frames: Iterator[Tuple[int, np.ndarray]],
+    frame_count: int,
+    frame_interval: int,
+    periodic_interval: int,
+    change_threshold: float,
+    max_frames: Optional[int],
+) -> Iterator[np.ndarray]:
+    """Yield the sampled frames that pass change detection or periodic capture."""
+    num_extracted = 0
+    # Thumbnail of the last captured frame, kept so it is computed only once
+    prev_gray = None
     last_capture_frame = -periodic_interval  # allow first periodic capture immediately
+    # Resolved once so the per-frame debug message is never formatted when disabled
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     pbar = tqdm(
         total=frame_count,
@@ -256,27 +482,19 @@ def extract_frames(
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
     )
 
-    while cap.isOpened():
-        # Process frame only if it's a sampling point
-        if frame_idx % frame_interval == 0:
-            success, frame = cap.read()
-            if not success:
-                break
-
-            # Resize if specified
-            if resize_to is not None:
-                frame = cv2.resize(frame, resize_to)
-
+    try:
+        for frame_idx, frame in frames:
             should_capture = False
             reason = ""
+            gray = _diff_thumbnail(frame)
 
             # First frame always gets extracted
-            if prev_frame is None:
+            if prev_gray is None:
                 should_capture = True
                 reason = "first"
             else:
                 # Change detection
-                diff = calculate_frame_difference(prev_frame, frame)
+                diff = _frame_diff_gray(prev_gray, gray)
                 if diff > change_threshold:
                     should_capture = True
                     reason = f"change={diff:.3f}"
@@ -289,35 +507,178 @@ def extract_frames(
                     reason = "periodic"
 
             if should_capture:
-                extracted_frames.append(frame)
-                prev_frame = frame
+                yield frame
+                num_extracted += 1
+                prev_gray = gray
                 last_capture_frame = frame_idx
-                logger.debug(f"Frame {frame_idx} extracted ({reason})")
+                if debug_enabled:
+                    logger.debug(f"Frame {frame_idx} extracted ({reason})")
 
-            pbar.set_postfix(extracted=len(extracted_frames))
+            pbar.set_postfix(extracted=num_extracted)
+            pbar.update(frame_interval)
 
             # Check if we've reached the maximum
-            if max_frames is not None and len(extracted_frames) >= max_frames:
+            if max_frames is not None and num_extracted >= max_frames:
                 break
-        else:
-            # Skip frame but advance counter
-            cap.grab()
+    finally:
+        frames.close()
+        pbar.close()
+
+    logger.info(f"Extracted {num_extracted} frames from {frame_count} total frames")
+
+
+def _iter_frames_opencv(
+    cap: cv2.VideoCapture,
+    frame_interval: int,
+    resize_to: Optional[Tuple[int, int]] = None,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Yield (frame_index, frame) for every *frame_interval*-th frame via OpenCV."""
+    frame_idx = 0
+    try:
+        while cap.isOpened():
+            # Process frame only if it's a sampling point
+            if frame_idx % frame_interval == 0:
+                success, frame = cap.read()
+                if not success:
+                    break
+
+                # Resize if specified
+                if resize_to is not None:
+                    frame = cv2.resize(frame, resize_to)
+                yield frame_idx, frame
+            else:
+                # Skip frame but advance counter
+                cap.grab()
+
+            frame_idx += 1
+    finally:
+        cap.release()
 
-        frame_idx += 1
-        pbar.update(frame_interval)
 
-    pbar.close()
-    cap.release()
-    logger.info(f"Extracted {len(extracted_frames)} frames from {frame_count} total frames")
-    return extracted_frames
+def _has_audio_stream(video_path: Path) -> bool:
+    """Whether ffprobe finds an audio stream in *video_path* (False without ffprobe).
 
+    Reads only the container headers, so mapping the soundtrack into the frame
+    decoder never makes ffmpeg fail to start on a silent video.
+    """
+    if not shutil.which("ffprobe"):
+        return False
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "a",
+            "-show_entries", "stream=index", "-of", "csv=p=0", str(video_path),
+        ],
+        capture_output=True,
+        text=True,
+    )  # fmt: skip
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+
+def _iter_frames_ffmpeg(
+    video_path: Path,
+    frame_interval: int,
+    size: Tuple[int, int],
+    audio_path: Optional[Path] = None,
+    audio_sample_rate: int = 16000,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yield (frame_index, frame) for every *frame_interval*-th frame via ffmpeg.
+
+    ffmpeg's select filter discards unsampled frames and scales the rest to
+    *size* (width, height), streaming raw BGR frames over a pipe. With
+    *audio_path*, the same process also writes the soundtrack as mono WAV; it is
+    written to a ``.part`` file and renamed only if ffmpeg finishes cleanly.
+    A non-zero exit is logged with ffmpeg's error output, and if no frame was
+    decoded the video is read through OpenCV instead.
+    """
+    width, height = size
+    frame_bytes = width * height * 3
+    cmd = [
+        "ffmpeg",
+        "-v",
+        "error",
+        "-i",
+        str(video_path),
+        "-vf",
+        f"select='not(mod(n,{frame_interval}))',scale={width}:{height}",
+        "-vsync",
+        "0",
+        "-map",
+        "0:v:0",
+        "-an",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "bgr24",
+        "pipe:1",
+    ]
+    part_path = None
+    if audio_path is not None:
+        audio_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = audio_path.with_name(audio_path.name + ".part")
+        cmd += [
+            "-map",
+            "0:a:0",
+            "-vn",
+            "-acodec",
+            "pcm_s16le",
+            "-ar",
+            str(audio_sample_rate),
+            "-ac",
+            "1",
+            "-f",
+            "wav",
+            "-y",
+            str(part_path),
+        ]
 
-def func_gpu(*args, **kwargs):
-    """GPU-accelerated version of extract_frames."""
+    frame_idx = 0
+    finished = False
+    # stderr goes to a file, not a pipe nobody reads while frames stream
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, bufsize=frame_bytes)
+        try:
+            while True:
+                buf = proc.stdout.read(frame_bytes)
+                if len(buf) < frame_bytes:
+                    break
+                yield frame_idx, np.frombuffer(buf, dtype=np.uint8).reshape(height, width, 3)
+                frame_idx += frame_interval
+            finished = True
+        finally:
+            proc.stdout.close()
+            # ffmpeg closes the pipe before it finalises the WAV and exits, so after a
+            # full read let it finish; kill it only when iteration stopped early
+            if not finished:
+                proc.kill()
+            try:
+                returncode = proc.wait(timeout=_FFMPEG_EXIT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                returncode = proc.wait()
+            if part_path is not None:
+                if finished and returncode == 0:
+                    part_path.replace(audio_path)
+                else:
+                    part_path.unlink(missing_ok=True)
+
+        if returncode != 0:
+            stderr.seek(0)
+            error = stderr.read().decode(errors="replace").strip()
+            logger.warning(f"ffmpeg exited with code {returncode} decoding {video_path}: {error}")
+
+    # Nothing decoded: read the video through OpenCV rather than yield no frames
+    if frame_idx == 0:
+        logger.warning(f"ffmpeg produced no frames for {video_path}, falling back to OpenCV")
+        yield from _iter_frames_opencv(cv2.VideoCapture(str(video_path)), frame_interval, size)
+
+
+def func_gpu(func, *args, **kwargs):
+    """GPU-accelerated version of *func* (the undecorated CPU implementation)."""
     # This would be implemented with CUDA acceleration
     # For now, fall back to the unwrapped CPU version
     logger.info("GPU acceleration not yet implemented, falling back to CPU")
-    return extract_frames.__wrapped__(*args, **kwargs)
+    return func(*args, **kwargs)
 
 
 def save_frames(
@@ -343,10 +704,22 @@ def save_frames(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    saved_paths = []
-    for i, frame in enumerate(frames):
-        output_path = output_dir / f"{base_filename}_{i:04d}.jpg"
-        cv2.imwrite(str(output_path), frame)
-        saved_paths.append(output_path)
+    saved_paths = [output_dir / f"{base_filename}_{i:04d}.jpg" for i in range(len(frames))]
+    jobs = zip(frames, saved_paths)
+
+    # JPEG encoding and disk writes release the GIL, so threads overlap both without
+    # copying frames into worker processes
+    if len(frames) < _PARALLEL_SAVE_MIN_FRAMES:
+        for job in jobs:
+            _write_frame(job)
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            list(executor.map(_write_frame, jobs))
 
     return saved_paths
+
+
+def _write_frame(job: Tuple[np.ndarray, Path]) -> None:
+    """Encode a single frame to disk as JPEG."""
+    frame, output_path = job
+    cv2.imwrite(str(output_path), frame, _JPEG_PARAMS)
@@ -1,14 +1,45 @@
 """Text extraction module for frames and diagrams."""
 
+import bisect
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
+from scipy.sparse.csgraph import connected_components
 
 logger = logging.getLogger(__name__)
 
+# MSER runs on images downscaled so their longest side is at most this
+_MSER_MAX_DIM = 1024
+
+# White gap between region crops stacked into one image for batched OCR
+_OCR_SEPARATOR_PX = 20
+
+# Extractor owned by each OCR worker process, set up by _init_ocr_worker
+_WORKER_EXTRACTOR: Optional["TextExtractor"] = None
+
+
+def _init_ocr_worker(tesseract_path: Optional[str]) -> None:
+    """Configure pytesseract once per worker process."""
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = TextExtractor(tesseract_path=tesseract_path)
+
+
+def _ocr_in_worker(image: np.ndarray, detect_regions: bool) -> str:
+    """Run OCR on one image in a worker process."""
+    return _WORKER_EXTRACTOR.extract_text_from_image(image, detect_regions)
+
+
+def _group_reduce(ufunc: np.ufunc, labels: np.ndarray, n_groups: int, *columns: np.ndarray):
+    """Reduce each column per group label with *ufunc* (np.minimum or np.maximum)."""
+    order = np.argsort(labels, kind="stable")
+    starts = np.searchsorted(labels[order], np.arange(n_groups))
+    return [ufunc.reduceat(column[order], starts) for column in columns]
+
 
 class TextExtractor:
     """Extract text from images, frames, and diagrams."""
@@ -50,25 +81,16 @@ class TextExtractor:
             Preprocessed image
         """
         # Convert to grayscale if not already
-        if len(image.shape) == 3:
+        if image.ndim == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
             gray = image
 
-        # Apply adaptive thresholding
-        thresh = cv2.adaptiveThreshold(
-            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 11, 2
+        # Apply adaptive thresholding: dark text on a white background
+        return cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
         )
 
-        # Noise removal
-        kernel = np.ones((1, 1), np.uint8)
-        opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-
-        # Invert back
-        result = cv2.bitwise_not(opening)
-
-        return result
-
     def extract_text_local(self, image: np.ndarray) -> str:
         """
         Extract text from image using local OCR (Tesseract).
@@ -111,24 +133,29 @@ class TextExtractor:
             List of bounding boxes for text regions (x, y, w, h)
         """
         # Convert to grayscale
-        if len(image.shape) == 3:
+        if image.ndim == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
             gray = image
 
-        # Apply MSER (Maximally Stable Extremal Regions)
-        mser = cv2.MSER_create()
-        regions, _ = mser.detectRegions(gray)
+        # MSER cost grows with pixel count, so cap the working resolution
+        height, width = gray.shape[:2]
+        scale = min(1.0, _MSER_MAX_DIM / max(height, width))
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
 
-        # Convert regions to bounding boxes
-        bboxes = []
-        for region in regions:
-            x, y, w, h = cv2.boundingRect(region.reshape(-1, 1, 2))
+        # Apply MSER (Maximally Stable Extremal Regions); it also returns each
+        # region's bounding box, so no per-region boundingRect is needed
+        mser = cv2.MSER_create()
+        _, rects = mser.detectRegions(gray)
+        rects = np.asarray(rects, dtype=np.int32).reshape(-1, 4)
+        if scale < 1.0:
+            rects = np.rint(rects / scale).astype(np.int32)
 
-            # Apply filtering criteria for text-like regions
-            aspect_ratio = w / float(h)
-            if 0.1 < aspect_ratio < 10 and h > 5 and w > 5:
-                bboxes.append((x, y, w, h))
+        # Apply filtering criteria for text-like regions, in original pixels
+        w, h = rects[:, 2], rects[:, 3]
+        mask = (w > 5) & (h > 5) & (w > 0.1 * h) & (w < 10 * h)
+        bboxes = [tuple(box) for box in rects[mask].tolist()]
 
         # Merge overlapping boxes
         merged_bboxes = self._merge_overlapping_boxes(bboxes)
@@ -155,37 +182,30 @@ class TextExtractor:
         if not boxes:
             return []
 
-        # Sort boxes by x coordinate
-        sorted_boxes = sorted(boxes, key=lambda b: b[0])
-
-        merged = []
-        current = list(sorted_boxes[0])
-
-        for box in sorted_boxes[1:]:
-            # Check if current box overlaps with the next one
-            if (
-                current[0] <= box[0] + box[2]
-                and box[0] <= current[0] + current[2]
-                and current[1] <= box[1] + box[3]
-                and box[1] <= current[1] + current[3]
-            ):
-                # Calculate merged box
-                x1 = min(current[0], box[0])
-                y1 = min(current[1], box[1])
-                x2 = max(current[0] + current[2], box[0] + box[2])
-                y2 = max(current[1] + current[3], box[1] + box[3])
-
-                # Update current box
-                current = [x1, y1, x2 - x1, y2 - y1]
-            else:
-                # Add current box to merged list and update current
-                merged.append(tuple(current))
-                current = list(box)
-
-        # Add the last box
-        merged.append(tuple(current))
-
-        return merged
+        rects = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        x1, y1 = rects[:, 0], rects[:, 1]
+        x2, y2 = x1 + rects[:, 2], y1 + rects[:, 3]
+
+        # Union every group of touching boxes; a merged box can reach boxes none of
+        # its members touched, so repeat until no groups join
+        while True:
+            overlaps = (
+                (x1[:, None] <= x2[None, :])
+                & (x1[None, :] <= x2[:, None])
+                & (y1[:, None] <= y2[None, :])
+                & (y1[None, :] <= y2[:, None])
+            )
+            n_groups, labels = connected_components(overlaps, directed=False)
+            if n_groups == len(x1):
+                break
+            x1, y1 = _group_reduce(np.minimum, labels, n_groups, x1, y1)
+            x2, y2 = _group_reduce(np.maximum, labels, n_groups, x2, y2)
+
+        order = np.argsort(x1, kind="stable")
+        return [
+            (int(a), int(b), int(c - a), int(d - b))
+            for a, b, c, d in zip(x1[order], y1[order], x2[order], y2[order])
+        ]
 
     def extract_text_from_regions(
         self, image: np.ndarray, regions: List[Tuple[int, int, int, int]]
@@ -205,29 +225,93 @@ class TextExtractor:
         dict
             Dictionary of {region: text}
         """
-        results = {}
-
+        rois = []
         for region in regions:
             x, y, w, h = region
 
-            # Extract region
+            # Extract region, skipping empty ones
             roi = image[y : y + h, x : x + w]
+            if roi.size > 0:
+                rois.append((region, roi))
 
-            # Skip empty regions
-            if roi.size == 0:
-                continue
+        if not rois:
+            return {}
+        if not self.use_local_ocr:
+            return {region: "API-based text extraction not yet implemented" for region, _ in rois}
 
-            # Extract text
-            if self.use_local_ocr:
-                text = self.extract_text_local(roi)
-            else:
-                text = "API-based text extraction not yet implemented"
+        texts = self._ocr_stacked(rois)
 
-            # Store non-empty results
-            if text.strip():
-                results[region] = text.strip()
+        # Store non-empty results, in the caller's region order
+        return {region: texts[region] for region, _ in rois if texts.get(region)}
 
-        return results
+    def _ocr_stacked(
+        self, rois: List[Tuple[Tuple[int, int, int, int], np.ndarray]]
+    ) -> Dict[Tuple[int, int, int, int], str]:
+        """
+        OCR many regions with a single tesseract invocation.
+
+        The preprocessed crops are stacked top-to-bottom into one composite with
+        white separators, and each recognised word is mapped back to its region
+        by vertical offset.
+
+        Parameters
+        ----------
+        rois : list
+            List of (region, crop) pairs
+
+        Returns
+        -------
+        dict
+            Dictionary of {region: text}
+        """
+        import pytesseract
+
+        rois = sorted(rois, key=lambda item: (item[0][1], item[0][0]))
+        crops = [self.preprocess_image(roi) for _, roi in rois]
+        width = max(crop.shape[1] for crop in crops)
+
+        tiles = []
+        offsets = []
+        top = 0
+        for crop in crops:
+            offsets.append(top)
+            tiles.append(
+                cv2.copyMakeBorder(
+                    crop,
+                    0,
+                    _OCR_SEPARATOR_PX,
+                    0,
+                    width - crop.shape[1],
+                    cv2.BORDER_CONSTANT,
+                    value=255,
+                )
+            )
+            top += crop.shape[0] + _OCR_SEPARATOR_PX
+        composite = np.vstack(tiles)
+
+        data = pytesseract.image_to_data(
+            composite, output_type=pytesseract.Output.DICT, config="--psm 6"
+        )
+
+        # Group words into lines per region, keyed by tesseract's line numbering
+        lines: Dict[int, Dict[Tuple[int, int, int], List[str]]] = {}
+        for word, word_top, height, block, par, line in zip(
+            data["text"],
+            data["top"],
+            data["height"],
+            data["block_num"],
+            data["par_num"],
+            data["line_num"],
+        ):
+            if not word.strip():
+                continue
+            idx = bisect.bisect_right(offsets, word_top + height // 2) - 1
+            lines.setdefault(idx, {}).setdefault((block, par, line), []).append(word)
+
+        return {
+            rois[idx][0]: "\n".join(" ".join(words) for words in region_lines.values())
+            for idx, region_lines in lines.items()
+        }
 
     def extract_text_from_image(self, image: np.ndarray, detect_regions: bool = True) -> str:
         """
@@ -261,6 +345,42 @@ class TextExtractor:
 
         return text
 
+    def extract_text_batch(
+        self,
+        images: List[np.ndarray],
+        detect_regions: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Extract text from many images, spreading local OCR across processes.
+
+        Tesseract is CPU-bound, so each worker process runs its own tesseract
+        invocations in parallel with the others.
+
+        Parameters
+        ----------
+        images : list
+            Input images
+        detect_regions : bool
+            Whether to detect and process text regions separately
+        max_workers : int, optional
+            Number of worker processes (defaults to the CPU count)
+
+        Returns
+        -------
+        list
+            Extracted text for each image, in input order
+        """
+        if not self.use_local_ocr or len(images) < 2:
+            return [self.extract_text_from_image(image, detect_regions) for image in images]
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_ocr_worker,
+            initargs=(self.tesseract_path,),
+        ) as executor:
+            return list(executor.map(_ocr_in_worker, images, repeat(detect_regions), chunksize=4))
+
     def extract_text_from_file(
         self, image_path: Union[str, Path], detect_regions: bool = True
     ) -> str:
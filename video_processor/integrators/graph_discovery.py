@@ -1,8 +1,12 @@
 """Auto-detect knowledge graph files in the filesystem."""
 
+import functools
 import logging
+import os
+import stat
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -11,21 +15,78 @@ _OUTPUT_SUBDIRS = ["results", "output", "knowledge-base"]
 
 # Filenames we look for, in preference order
 _DB_FILENAMES = ["knowledge_graph.db"]
-_JSON_FILENAMES = ["knowledge_graph.json"]
+_JSON_FILENAMES = ["knowledge_graph.json", "knowledge_graph.json.zst"]
+
+# All candidate names: a tuple for probing in preference order, a set for matching
+_ALL_FILENAMES = tuple(_DB_FILENAMES + _JSON_FILENAMES)
+_ALL_FILENAME_SET = frozenset(_ALL_FILENAMES)
+
+# Directories never worth descending into (dot-directories are skipped as well)
+_SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        "venv",
+        "__pycache__",
+        "build",
+        "dist",
+        "site-packages",
+        "target",
+    }
+)
+
+
+# Files or directories marking a project root; the upward walk stops there
+_ROOT_MARKERS = (".git", "pyproject.toml", "setup.py")
+
+# Path kinds memoized by _path_type
+_MISSING, _FILE, _DIR = 0, 1, 2
+
+
+def _path_type(path: str, cache: Dict[str, int]) -> int:
+    """stat() *path* at most once per search: _FILE, _DIR or _MISSING."""
+    kind = cache.get(path)
+    if kind is None:
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:  # ENOENT, ENOTDIR, EACCES, ...
+            kind = _MISSING
+        else:
+            kind = _FILE if stat.S_ISREG(mode) else _DIR if stat.S_ISDIR(mode) else _MISSING
+        cache[path] = kind
+    return kind
+
+
+def _cached_resolve(path: Path, cache: Dict[Path, Path]) -> Path:
+    """Resolve *path*, memoized in *cache* to avoid repeated realpath() stats."""
+    rp = cache.get(path)
+    if rp is None:
+        rp = cache[path] = path.resolve()
+    return rp
 
 
 def find_knowledge_graphs(
     start_dir: Optional[Path] = None,
     walk_up: bool = True,
     max_depth_down: int = 4,
+    exclude: Optional[Iterable[str]] = None,
+    early_exit: bool = False,
+    max_walk_up: int = 8,
 ) -> List[Path]:
     """Find knowledge graph files near *start_dir*, sorted by proximity.
 
     Search order:
     1. start_dir itself
     2. Common output subdirs (results/, output/, knowledge-base/)
-    3. Recursive walk downward (up to *max_depth_down* levels)
-    4. Walk upward through parent directories (if *walk_up* is True)
+    3. Walk downward (up to *max_depth_down* levels)
+    4. Walk upward through parent directories (if *walk_up* is True), stopping
+       after the project root (a directory holding .git, pyproject.toml or
+       setup.py) or after *max_walk_up* levels
+
+    The downward walk skips dot-directories, dependency/build directories such as
+    node_modules/ and venv/, and any directory names given in *exclude*.
+
+    With *early_exit*, the search stops as soon as a .db file is found at distance
+    0 or 1: the first result is then final, but the list may be incomplete.
 
     Returns .db files first, then .json, each group sorted closest-first.
     """
@@ -33,49 +94,77 @@ def find_knowledge_graphs(
     found_db: List[tuple] = []  # (distance, path)
     found_json: List[tuple] = []
     seen: set = set()
-
-    def _record(path: Path, distance: int) -> None:
-        rp = path.resolve()
-        if rp in seen or not rp.is_file():
+    resolved: Dict[Path, Path] = {}  # realpath() memo for this search
+    stats: Dict[str, int] = {}  # stat() memo for this search
+    skip_dirs = _SKIP_DIRS.union(exclude) if exclude else _SKIP_DIRS
+    nearest_db_found = False
+
+    def _record(path: Path, distance: int, is_file: bool = False) -> None:
+        # Most probes miss, so test existence before paying for resolve(); callers
+        # holding a DirEntry already know the answer
+        nonlocal nearest_db_found
+        if not (is_file or _path_type(str(path), stats) == _FILE):
+            return
+        # A .json.zst is only a compressed copy when the plain .json sits beside it
+        if path.suffix == ".zst" and _path_type(str(path.with_suffix("")), stats) == _FILE:
+            return
+        rp = _cached_resolve(path, resolved)
+        if rp in seen:
             return
         seen.add(rp)
-        bucket = found_db if rp.suffix == ".db" else found_json
-        bucket.append((distance, rp))
+        if rp.suffix == ".db":
+            found_db.append((distance, rp))
+            nearest_db_found = nearest_db_found or (early_exit and distance <= 1)
+        else:
+            found_json.append((distance, rp))
 
     # 1. Direct check in start_dir
-    for name in _DB_FILENAMES + _JSON_FILENAMES:
+    for name in _ALL_FILENAMES:
         _record(start_dir / name, 0)
 
-    # 2. Common output subdirs
-    for subdir in _OUTPUT_SUBDIRS:
-        for name in _DB_FILENAMES + _JSON_FILENAMES:
-            _record(start_dir / subdir / name, 1)
+    def _record_output_subdirs(directory: Path, distance: int) -> None:
+        # One stat per output subdir rules out all of its candidate files at once
+        for subdir in _OUTPUT_SUBDIRS:
+            sub = directory / subdir
+            if _path_type(str(sub), stats) == _DIR:
+                for name in _ALL_FILENAMES:
+                    _record(sub / name, distance)
 
-    # 3. Walk downward
-    def _walk_down(directory: Path, depth: int) -> None:
-        if depth > max_depth_down:
-            return
-        try:
-            for child in sorted(directory.iterdir()):
-                if child.is_file() and child.name in (_DB_FILENAMES + _JSON_FILENAMES):
-                    _record(child, depth)
-                elif child.is_dir() and not child.name.startswith("."):
-                    _walk_down(child, depth + 1)
-        except PermissionError:
-            pass
-
-    _walk_down(start_dir, 1)
-
-    # 4. Walk upward
-    if walk_up:
+    # 2. Common output subdirs
+    _record_output_subdirs(start_dir, 1)
+
+    # 3. Walk downward, pruning dirs in place. os.walk lists each directory once
+    # with scandir; visiting order is irrelevant since results are sorted by distance
+    depths = {str(start_dir): 1}
+    for root, dirs, files in os.walk(start_dir):
+        depth = depths.pop(root)
+        for name in files:
+            if name in _ALL_FILENAME_SET:
+                _record(Path(root, name), depth, is_file=True)
+        if nearest_db_found:
+            break
+        if depth < max_depth_down:
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d not in skip_dirs]
+            for d in dirs:
+                depths[os.path.join(root, d)] = depth + 1
+        else:
+            dirs.clear()
+
+    def _is_project_root(directory: Path) -> bool:
+        return any(
+            _path_type(str(directory / marker), stats) != _MISSING for marker in _ROOT_MARKERS
+        )
+
+    # 4. Walk upward, no further than the enclosing project root
+    if walk_up and not _is_project_root(start_dir):
         parent = start_dir.parent
         distance = 1
-        while parent != parent.parent:
-            for name in _DB_FILENAMES + _JSON_FILENAMES:
+        while parent != parent.parent and distance <= max_walk_up and not nearest_db_found:
+            for name in _ALL_FILENAMES:
                 _record(parent / name, distance)
-            for subdir in _OUTPUT_SUBDIRS:
-                for name in _DB_FILENAMES + _JSON_FILENAMES:
-                    _record(parent / subdir / name, distance + 1)
+            _record_output_subdirs(parent, distance + 1)
+            if _is_project_root(parent):
+                break
             parent = parent.parent
             distance += 1
 
@@ -86,9 +175,30 @@ def find_knowledge_graphs(
 
 
 def find_nearest_graph(start_dir: Optional[Path] = None) -> Optional[Path]:
-    """Return the closest knowledge graph file, or None."""
-    graphs = find_knowledge_graphs(start_dir)
-    return graphs[0] if graphs else None
+    """Return the closest knowledge graph file, or None.
+
+    Results are cached per start directory for the life of the process. A cached
+    graph that has since been deleted triggers a fresh search, but a graph created
+    after a search that found nothing (or found a farther one) is only seen after
+    ``clear_nearest_graph_cache()``.
+    """
+    start = str(Path(start_dir or Path.cwd()).resolve())
+    nearest = _find_nearest_cached(start)
+    if nearest is not None and not os.path.isfile(nearest):
+        _find_nearest_cached.cache_clear()
+        nearest = _find_nearest_cached(start)
+    return Path(nearest) if nearest is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _find_nearest_cached(start_dir: str) -> Optional[str]:
+    graphs = find_knowledge_graphs(Path(start_dir), early_exit=True)
+    return str(graphs[0]) if graphs else None
+
+
+def clear_nearest_graph_cache() -> None:
+    """Forget cached find_nearest_graph() results."""
+    _find_nearest_cached.cache_clear()
 
 
 def describe_graph(db_path: Path) -> Dict:
@@ -96,45 +206,35 @@ def describe_graph(db_path: Path) -> Dict:
 
     Returns dict with: entity_count, relationship_count, entity_types, store_type.
     """
-    from video_processor.integrators.graph_store import (
-        FalkorDBStore,
-        InMemoryStore,
-        create_store,
-    )
+    from video_processor.integrators.graph_store import FalkorDBStore, create_store
 
     db_path = Path(db_path)
 
-    if db_path.suffix == ".json":
-        import json
-
-        data = json.loads(db_path.read_text())
-        store = InMemoryStore()
-        for node in data.get("nodes", []):
-            store.merge_entity(
-                node.get("name", ""),
-                node.get("type", "concept"),
-                node.get("descriptions", []),
-            )
-        for rel in data.get("relationships", []):
-            store.add_relationship(
-                rel.get("source", ""),
-                rel.get("target", ""),
-                rel.get("type", "related_to"),
-            )
+    if db_path.suffix in (".json", ".zst"):
+        from video_processor.utils.json_stream import iter_json_arrays
+
+        # Counts straight from the stream; like the store, names merge case-insensitively
+        # and the first type seen wins
+        node_types: Dict[str, str] = {}
+        relationship_count = 0
+        for key, item in iter_json_arrays(db_path, "nodes", "relationships"):
+            if key == "nodes":
+                node_types.setdefault(item.get("name", "").lower(), item.get("type", "concept"))
+            else:
+                relationship_count += 1
+        entity_count = len(node_types)
+        entity_types = dict(Counter(node_types.values()))
         store_type = "json"
     else:
         store = create_store(db_path)
         store_type = "falkordb" if isinstance(store, FalkorDBStore) else "inmemory"
-
-    entities = store.get_all_entities()
-    entity_types = {}
-    for e in entities:
-        t = e.get("type", "concept")
-        entity_types[t] = entity_types.get(t, 0) + 1
+        entity_count = store.get_entity_count()
+        relationship_count = store.get_relationship_count()
+        entity_types = dict(Counter(e.get("type", "concept") for e in store.get_all_entities()))
 
     return {
-        "entity_count": store.get_entity_count(),
-        "relationship_count": store.get_relationship_count(),
+        "entity_count": entity_count,
+        "relationship_count": relationship_count,
         "entity_types": entity_types,
         "store_type": store_type,
     }
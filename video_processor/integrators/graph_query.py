@@ -1,16 +1,23 @@
 """Query engine for PlanOpticon knowledge graphs."""
 
+import functools
 import json
 import logging
+import re
+import sys
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pydantic_core
 
 from video_processor.integrators.graph_store import (
     GraphStore,
     InMemoryStore,
     create_store,
 )
+from video_processor.utils.json_stream import iter_json_arrays
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +57,7 @@ class QueryResult:
                         lines.append(f"  {item['source']} --[{rtype}]--> {item['target']}")
                     elif item.get("name") and item.get("type"):
                         descs = item.get("descriptions", [])
-                        if isinstance(descs, set):
+                        if isinstance(descs, (set, tuple)):
                             descs = list(descs)
                         desc_str = "; ".join(descs[:3]) if descs else ""
                         line = f"  [{item['type']}] {item['name']}"
@@ -74,12 +81,12 @@ class QueryResult:
             "explanation": self.explanation,
             "data": self.data,
         }
-        return json.dumps(payload, indent=2, default=str)
+        # pydantic-core encodes sets and tuples as lists rather than their repr
+        return pydantic_core.to_json(payload, indent=2, fallback=str).decode()
 
     def to_mermaid(self) -> str:
         """Mermaid diagram output from result data."""
-        lines = ["graph LR"]
-        seen_nodes = set()
+        node_types: Dict[str, Optional[str]] = {}  # name -> type, None if only an endpoint
         edges = []
 
         items = self.data if isinstance(self.data, list) else [self.data]
@@ -89,38 +96,40 @@ class QueryResult:
                 continue
             # Entity node
             if "name" in item and "type" in item:
-                name = item["name"]
-                if name not in seen_nodes:
-                    safe_id = _mermaid_id(name)
-                    safe_name = name.replace('"', "'")
-                    ntype = item.get("type", "concept")
-                    lines.append(f'    {safe_id}["{safe_name}"]:::{ntype}')
-                    seen_nodes.add(name)
+                node_types[item["name"]] = item.get("type", "concept")
             # Relationship edge
             if "source" in item and "target" in item:
                 src = item["source"]
                 tgt = item["target"]
-                rtype = item.get("type", "related_to")
-                for n in (src, tgt):
-                    if n not in seen_nodes:
-                        safe_id = _mermaid_id(n)
-                        lines.append(f'    {safe_id}["{n.replace(chr(34), chr(39))}"]')
-                        seen_nodes.add(n)
-                edges.append((src, tgt, rtype))
+                node_types.setdefault(src, None)
+                node_types.setdefault(tgt, None)
+                edges.append((src, tgt, item.get("type", "related_to")))
 
+        lines = ["graph LR"]
+        for name, ntype in node_types.items():
+            node = f'    {_mermaid_id(name)}["{name.replace(chr(34), chr(39))}"]'
+            lines.append(f"{node}:::{ntype}" if ntype else node)
         for src, tgt, rtype in edges:
             lines.append(f'    {_mermaid_id(src)} -- "{rtype}" --> {_mermaid_id(tgt)}')
-
-        lines.append("    classDef person fill:#f9d5e5,stroke:#333")
-        lines.append("    classDef concept fill:#eeeeee,stroke:#333")
-        lines.append("    classDef technology fill:#d5e5f9,stroke:#333")
-        lines.append("    classDef organization fill:#f9e5d5,stroke:#333")
+        lines += _MERMAID_CLASS_DEFS
 
         return "\n".join(lines)
 
 
+_MERMAID_CLASS_DEFS = [
+    "    classDef person fill:#f9d5e5,stroke:#333",
+    "    classDef concept fill:#eeeeee,stroke:#333",
+    "    classDef technology fill:#d5e5f9,stroke:#333",
+    "    classDef organization fill:#f9e5d5,stroke:#333",
+]
+
+# \W is exactly "not str.isalnum() and not underscore" for str patterns
+_MERMAID_UNSAFE = re.compile(r"\W")
+
+
+@functools.lru_cache(maxsize=4096)
 def _mermaid_id(name: str) -> str:
-    return "".join(c if c.isalnum() or c == "_" else "_" for c in name)
+    return _MERMAID_UNSAFE.sub("_", name)
 
 
 class GraphQueryEngine:
@@ -129,6 +138,8 @@ class GraphQueryEngine:
     def __init__(self, store: GraphStore, provider_manager=None):
         self.store = store
         self.pm = provider_manager
+        self._cache: Dict[Any, Any] = {}
+        self._cache_token: Optional[Tuple[int, int]] = None
 
     @classmethod
     def from_db_path(cls, path: Path, provider_manager=None) -> "GraphQueryEngine":
@@ -138,32 +149,56 @@ class GraphQueryEngine:
 
     @classmethod
     def from_json_path(cls, path: Path, provider_manager=None) -> "GraphQueryEngine":
-        """Load a .json knowledge graph file and create a query engine."""
-        data = json.loads(Path(path).read_text())
+        """Load a .json (or zstd-compressed .json.zst) knowledge graph file.
+
+        Nodes and relationships are streamed into the store when ijson is installed.
+        """
         store = InMemoryStore()
-        for node in data.get("nodes", []):
-            store.merge_entity(
-                node.get("name", ""),
-                node.get("type", "concept"),
-                node.get("descriptions", []),
-            )
-            for occ in node.get("occurrences", []):
-                store.add_occurrence(
-                    node.get("name", ""),
-                    occ.get("source", ""),
-                    occ.get("timestamp"),
-                    occ.get("text"),
+        for key, item in iter_json_arrays(path, "nodes", "relationships"):
+            if key == "nodes":
+                store.merge_entity(
+                    item.get("name", ""),
+                    item.get("type", "concept"),
+                    item.get("descriptions", []),
+                )
+                for occ in item.get("occurrences", []):
+                    store.add_occurrence(
+                        item.get("name", ""),
+                        occ.get("source", ""),
+                        occ.get("timestamp"),
+                        occ.get("text"),
+                    )
+            else:
+                store.add_relationship(
+                    item.get("source", ""),
+                    item.get("target", ""),
+                    item.get("type", "related_to"),
+                    content_source=item.get("content_source"),
+                    timestamp=item.get("timestamp"),
                 )
-        for rel in data.get("relationships", []):
-            store.add_relationship(
-                rel.get("source", ""),
-                rel.get("target", ""),
-                rel.get("type", "related_to"),
-                content_source=rel.get("content_source"),
-                timestamp=rel.get("timestamp"),
-            )
         return cls(store, provider_manager)
 
+    # ── Result cache ──
+
+    def _cached(self, key: Any, fn: Callable[[], Any]) -> Any:
+        """Return the memoized result of *fn* for *key*.
+
+        Entries are dropped whenever the store's (entity, relationship) counts change;
+        call invalidate() after in-place edits that leave the counts unchanged.
+        """
+        token = (self.store.get_entity_count(), self.store.get_relationship_count())
+        if token != self._cache_token:
+            self._cache.clear()
+            self._cache_token = token
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    def invalidate(self) -> None:
+        """Drop all cached store reads."""
+        self._cache.clear()
+        self._cache_token = None
+
     # ── Direct mode methods (no LLM required) ──
 
     def entities(
@@ -173,16 +208,10 @@ class GraphQueryEngine:
         limit: int = 50,
     ) -> QueryResult:
         """Filter entities by name substring and/or type."""
-        all_entities = self.store.get_all_entities()
-        results = []
-        for e in all_entities:
-            if name and name.lower() not in e.get("name", "").lower():
-                continue
-            if entity_type and entity_type.lower() != e.get("type", "").lower():
-                continue
-            results.append(e)
-            if len(results) >= limit:
-                break
+        results = self._cached(
+            ("entities", name, entity_type, limit),
+            lambda: self.store.find_entities(name=name, entity_type=entity_type, limit=limit),
+        )
 
         raw = f"entities(name={name!r}, entity_type={entity_type!r}, limit={limit})"
         return QueryResult(
@@ -200,18 +229,12 @@ class GraphQueryEngine:
         limit: int = 50,
     ) -> QueryResult:
         """Filter relationships by source, target, and/or type."""
-        all_rels = self.store.get_all_relationships()
-        results = []
-        for r in all_rels:
-            if source and source.lower() not in r.get("source", "").lower():
-                continue
-            if target and target.lower() not in r.get("target", "").lower():
-                continue
-            if rel_type and rel_type.lower() not in r.get("type", "").lower():
-                continue
-            results.append(r)
-            if len(results) >= limit:
-                break
+        results = self._cached(
+            ("relationships", source, target, rel_type, limit),
+            lambda: self.store.find_relationships(
+                source=source, target=target, rel_type=rel_type, limit=limit
+            ),
+        )
 
         raw = f"relationships(source={source!r}, target={target!r}, rel_type={rel_type!r})"
         return QueryResult(
@@ -232,27 +255,31 @@ class GraphQueryEngine:
                 explanation=f"Entity '{entity_name}' not found",
             )
 
-        visited = {entity_name.lower()}
+        start = sys.intern(entity_name.lower())
+        visited = {start}
         result_entities = [entity]
         result_rels = []
-        frontier = {entity_name.lower()}
+        frontier = {start}
 
-        all_rels = self.store.get_all_relationships()
+        adjacency = self._adjacency()
 
         for _ in range(depth):
+            # Touched relationships keep their store order, as in a full scan
+            touched = {}
+            for node in frontier:
+                for idx, src_lower, tgt_lower, rel in adjacency.get(node, ()):
+                    touched[idx] = (src_lower, tgt_lower, rel)
             next_frontier = set()
-            for rel in all_rels:
-                src_lower = rel["source"].lower()
-                tgt_lower = rel["target"].lower()
-                if src_lower in frontier or tgt_lower in frontier:
-                    result_rels.append(rel)
-                    for n in (src_lower, tgt_lower):
-                        if n not in visited:
-                            visited.add(n)
-                            next_frontier.add(n)
-                            e = self.store.get_entity(n)
-                            if e:
-                                result_entities.append(e)
+            for idx in sorted(touched):
+                src_lower, tgt_lower, rel = touched[idx]
+                result_rels.append(rel)
+                for n in (src_lower, tgt_lower):
+                    if n not in visited:
+                        visited.add(n)
+                        next_frontier.add(n)
+                        e = self.store.get_entity(n)
+                        if e:
+                            result_entities.append(e)
             frontier = next_frontier
 
         # Combine entities + relationships into output
@@ -266,17 +293,34 @@ class GraphQueryEngine:
             ),
         )
 
+    def _adjacency(self) -> Dict[str, List[tuple]]:
+        """Map lower-cased entity name to (index, src_lower, tgt_lower, rel) entries."""
+        return self._cached("adjacency", self._build_adjacency)
+
+    def _build_adjacency(self) -> Dict[str, List[tuple]]:
+        adjacency = defaultdict(list)
+        for idx, rel in enumerate(self.store.get_all_relationships()):
+            # Interned so frontier/visited lookups compare by identity first
+            entry = (
+                idx,
+                sys.intern(rel["source"].lower()),
+                sys.intern(rel["target"].lower()),
+                rel,
+            )
+            adjacency[entry[1]].append(entry)
+            if entry[2] != entry[1]:
+                adjacency[entry[2]].append(entry)
+        return dict(adjacency)
+
     def stats(self) -> QueryResult:
         """Return entity count, relationship count, type breakdown."""
-        all_entities = self.store.get_all_entities()
-        type_breakdown = {}
-        for e in all_entities:
-            t = e.get("type", "concept")
-            type_breakdown[t] = type_breakdown.get(t, 0) + 1
+        all_entities = self._cached("all_entities", self.store.get_all_entities)
+        entity_count, relationship_count = self._cache_token
+        type_breakdown = dict(Counter(e.get("type", "concept") for e in all_entities))
 
         data = {
-            "entity_count": self.store.get_entity_count(),
-            "relationship_count": self.store.get_relationship_count(),
+            "entity_count": entity_count,
+            "relationship_count": relationship_count,
             "entity_types": type_breakdown,
         }
         return QueryResult(
@@ -418,20 +462,18 @@ class GraphQueryEngine:
         )
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _parse_json(text: str) -> Optional[Dict]:
-    """Try to extract a JSON object from LLM output."""
-    text = text.strip()
-    # Try direct parse first
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-    # Try to find JSON between braces
+    """Try to extract a JSON object from LLM output.
+
+    Decodes the first balanced ``{...}`` that parses, ignoring surrounding prose.
+    """
     start = text.find("{")
-    end = text.rfind("}")
-    if start >= 0 and end > start:
+    while start >= 0:
         try:
-            return json.loads(text[start : end + 1])
+            return _JSON_DECODER.raw_decode(text, start)[0]
         except json.JSONDecodeError:
-            pass
+            start = text.find("{", start + 1)
     return None
@@ -1,12 +1,177 @@
 """Graph storage backends for PlanOpticon knowledge graphs."""
 
+import functools
 import logging
+import re
+import sys
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pydantic_core
 
 logger = logging.getLogger(__name__)
 
+# Above this many entities InMemoryStore filters with NumPy string ufuncs
+_VECTORIZE_MIN_ENTITIES = 10_000
+
+
+@dataclass(slots=True)
+class RelationshipRow:
+    """Compact, attribute-access view of one relationship for bulk consumers."""
+
+    source: str
+    target: str
+    type: str
+    content_source: Optional[str] = None
+    timestamp: Optional[float] = None
+
+
+@dataclass(slots=True)
+class NodeRecord:
+    """One InMemoryStore entity; entity dicts are built from it on read."""
+
+    name: str
+    type: str
+    descriptions: Tuple[str, ...]  # sorted and de-duplicated
+    occurrences: List[Dict[str, Any]]
+    source: Optional[str] = None
+    # Keys set through set_entity_properties() that aren't fields above
+    extra: Optional[Dict[str, Any]] = None
+    # Position in InMemoryStore's column arrays (_rows, _names_lc, _type_codes)
+    row: int = -1
+
+    def to_dict(self) -> Dict[str, Any]:
+        entity = {
+            "id": self.name,
+            "name": self.name,
+            "type": self.type,
+            "descriptions": self.descriptions,
+            "occurrences": self.occurrences,
+            "source": self.source,
+        }
+        if self.extra:
+            entity.update(self.extra)
+        return entity
+
+
+_NODE_FIELDS = frozenset(f.name for f in fields(NodeRecord)) - {"extra", "row"}
+
+
+@dataclass(frozen=True, slots=True)
+class AdjacencyCSR:
+    """Compressed sparse row snapshot of a store's relationships.
+
+    Entity ids are dense ints; the out-edges of id ``u`` are
+    ``neighbors[offsets[u]:offsets[u + 1]]``, with ``edge_type`` parallel to
+    ``neighbors`` indexing into ``labels``.
+    """
+
+    names: Tuple[str, ...]  # id -> lower-cased name
+    id_of: Dict[str, int]  # lower-cased name -> id
+    offsets: np.ndarray  # int32, len(names) + 1
+    neighbors: np.ndarray  # int32, one per relationship, grouped by source id
+    edge_type: np.ndarray  # smallest unsigned int dtype that fits len(labels)
+    labels: Tuple[str, ...]
+
+
+def _bfs(offsets: np.ndarray, neighbors: np.ndarray, src: int) -> np.ndarray:
+    """Hop distance from *src* to every CSR id along out-edges, -1 where unreachable."""
+    n = offsets.shape[0] - 1
+    dist = np.full(n, -1, dtype=np.int32)
+    queue = np.empty(n, dtype=np.int32)
+    dist[src] = 0
+    queue[0] = src
+    head, tail = 0, 1
+    while head < tail:
+        u = queue[head]
+        head += 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = neighbors[k]
+            if dist[v] < 0:
+                dist[v] = dist[u] + 1
+                queue[tail] = v
+                tail += 1
+    return dist
+
+
+def _pagerank(
+    offsets: np.ndarray, neighbors: np.ndarray, n: int, d: float = 0.85, iters: int = 20
+) -> np.ndarray:
+    """Power-iteration PageRank over a CSR graph; dangling rank is spread evenly."""
+    rank = np.full(n, 1.0 / n)
+    for _ in range(iters):
+        incoming = np.zeros(n)
+        dangling = 0.0
+        for u in range(n):
+            degree = offsets[u + 1] - offsets[u]
+            if degree == 0:
+                dangling += rank[u]
+                continue
+            share = rank[u] / degree
+            for k in range(offsets[u], offsets[u + 1]):
+                incoming[neighbors[k]] += share
+        base = (1.0 - d) / n + d * dangling / n
+        for v in range(n):
+            rank[v] = base + d * incoming[v]
+    return rank
+
+
+@functools.lru_cache(maxsize=None)
+def _graph_kernels() -> tuple:
+    """(bfs, pagerank) kernels, JIT-compiled by numba on first use when available.
+
+    numba arrives with librosa, but is imported lazily so loading the store does not
+    pay for it; without it the same loops run as plain Python.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        logger.debug("numba not installed, graph kernels run as plain Python")
+        return _bfs, _pagerank
+    return njit(cache=True)(_bfs), njit(cache=True)(_pagerank)
+
+
+class _LabelEncoder:
+    """Two-way table between low-cardinality labels and dense int codes."""
+
+    __slots__ = ("s2i", "i2s")
+
+    def __init__(self) -> None:
+        self.s2i: Dict[str, int] = {}
+        self.i2s: List[str] = []
+
+    def encode(self, label: str) -> int:
+        code = self.s2i.get(label)
+        if code is None:
+            code = self.s2i[label] = len(self.i2s)
+            self.i2s.append(label)
+        return code
+
+    def decode(self, code: int) -> str:
+        return self.i2s[code]
+
+
+def _label(label: Optional[str]) -> Optional[str]:
+    """Shared copy of an entity type or edge label; every node and edge holding the
+    same label then points at one string instead of its own parsed copy."""
+    return sys.intern(label) if label else label
+
+
+def _ci(name: str) -> str:
+    """Interned lower-cased form of *name*: the key InMemoryStore stores it under.
+
+    lower(), like FalkorDBStore's persisted name_lower, so both backends agree on
+    which names are the same entity. Interning lets the node dict, the filter
+    columns and the relationship indexes share one string per name; lookups call
+    lower() directly, which is about 4x cheaper than interning a throwaway key.
+    """
+    return sys.intern(name.lower())
+
 
 class GraphStore(ABC):
     """Abstract interface for knowledge graph storage backends."""
@@ -22,6 +187,17 @@ class GraphStore(ABC):
         """Upsert an entity by case-insensitive name."""
         ...
 
+    def merge_entities_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        """Upsert many entities at once.
+
+        Each row holds ``name``, ``type`` and optionally ``descriptions`` and ``source``,
+        as for merge_entity. The default merges them one by one.
+        """
+        for row in rows:
+            self.merge_entity(
+                row["name"], row["type"], row.get("descriptions", []), source=row.get("source")
+            )
+
     @abstractmethod
     def add_occurrence(
         self,
@@ -33,6 +209,16 @@ class GraphStore(ABC):
         """Add an occurrence record to an existing entity."""
         ...
 
+    def add_occurrences_bulk(
+        self, rows: Iterable[Tuple[str, str, Optional[float], Optional[str]]]
+    ) -> None:
+        """Add many (entity_name, source, timestamp, text) occurrence records.
+
+        The default adds them one by one.
+        """
+        for entity_name, source, timestamp, text in rows:
+            self.add_occurrence(entity_name, source, timestamp, text)
+
     @abstractmethod
     def add_relationship(
         self,
@@ -45,6 +231,16 @@ class GraphStore(ABC):
         """Add a relationship between two entities (both must already exist)."""
         ...
 
+    def add_relationships_bulk(
+        self, rows: Iterable[Tuple[str, str, str, Optional[str], Optional[float]]]
+    ) -> None:
+        """Add many (source, target, rel_type, content_source, timestamp) relationships.
+
+        The default adds them one by one.
+        """
+        for source, target, rel_type, content_source, timestamp in rows:
+            self.add_relationship(source, target, rel_type, content_source, timestamp)
+
     @abstractmethod
     def get_entity(self, name: str) -> Optional[Dict[str, Any]]:
         """Get an entity by case-insensitive name, or None."""
@@ -60,6 +256,40 @@ class GraphStore(ABC):
         """Return all relationships as dicts."""
         ...
 
+    def iter_entities(self) -> Iterator[Dict[str, Any]]:
+        """Yield entities lazily. Defaults to iterating get_all_entities()."""
+        yield from self.get_all_entities()
+
+    def iter_relationships(self) -> Iterator[Dict[str, Any]]:
+        """Yield relationships lazily. Defaults to iterating get_all_relationships()."""
+        yield from self.get_all_relationships()
+
+    def iter_relationship_rows(self) -> Iterator[RelationshipRow]:
+        """Yield relationships as slotted RelationshipRow records."""
+        for r in self.iter_relationships():
+            yield RelationshipRow(
+                r["source"],
+                r["target"],
+                r.get("type", "related_to"),
+                r.get("content_source"),
+                r.get("timestamp"),
+            )
+
+    def get_relationships_columnar(self) -> Dict[str, List[Any]]:
+        """Return all relationships as parallel lists keyed by RelationshipRow field.
+
+        Row ``i`` is ``{k: cols[k][i] for k in cols}``; for bulk consumers that
+        don't need a dict per relationship.
+        """
+        rows = list(self.iter_relationship_rows())
+        return {
+            "source": [r.source for r in rows],
+            "target": [r.target for r in rows],
+            "type": [r.type for r in rows],
+            "content_source": [r.content_source for r in rows],
+            "timestamp": [r.timestamp for r in rows],
+        }
+
     @abstractmethod
     def get_entity_count(self) -> int: ...
 
@@ -71,6 +301,10 @@ class GraphStore(ABC):
         """Check if an entity exists (case-insensitive)."""
         ...
 
+    def existing_entities(self, names: Iterable[str]) -> Set[str]:
+        """Return the subset of *names* that exist as entities (case-insensitive)."""
+        return {name for name in names if self.has_entity(name)}
+
     @abstractmethod
     def add_typed_relationship(
         self,
@@ -94,7 +328,8 @@ class GraphStore(ABC):
     ) -> bool:
         """Set arbitrary key/value properties on an existing entity.
 
-        Returns True if the entity was found and updated, False otherwise.
+        Returns True if the entity was found and updated, False otherwise. The
+        name is the entity's key and cannot be changed here (ValueError).
         """
         ...
 
@@ -111,6 +346,58 @@ class GraphStore(ABC):
         """
         ...
 
+    def find_entities(
+        self,
+        name: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Return up to *limit* entities whose name contains *name* and whose type equals
+        *entity_type* (both case-insensitive).
+
+        The default scans iter_entities() and stops at *limit*; backends with a query
+        language override this to filter server-side.
+        """
+        preds = []
+        if name:
+            name_lc = name.lower()
+            preds.append(lambda e: name_lc in e.get("name", "").lower())
+        if entity_type:
+            type_lc = entity_type.lower()
+            preds.append(lambda e: type_lc == e.get("type", "").lower())
+
+        matches = (e for e in self.iter_entities() if all(p(e) for p in preds))
+        return list(islice(matches, limit))
+
+    def get_entities_by_names(self, names: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return ``{"name", "type"}`` records for the stored entities among *names*
+        (case-insensitive), in store order, without occurrences or descriptions.
+        """
+        wanted = {name.lower() for name in names}
+        return [
+            {"name": e["name"], "type": e.get("type") or "concept"}
+            for e in self.iter_entities()
+            if e["name"].lower() in wanted
+        ]
+
+    def find_relationships(
+        self,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        rel_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Return up to *limit* relationships whose source, target and type contain the
+        given substrings (case-insensitive).
+        """
+        preds = []
+        for key, value in (("source", source), ("target", target), ("type", rel_type)):
+            if value:
+                preds.append(lambda r, k=key, v=value.lower(): v in r.get(k, "").lower())
+
+        matches = (r for r in self.iter_relationships() if all(p(r) for p in preds))
+        return list(islice(matches, limit))
+
     def raw_query(self, query_string: str) -> Any:
         """Execute a raw query against the backend (e.g. Cypher for FalkorDB).
 
@@ -118,32 +405,87 @@ class GraphStore(ABC):
         """
         raise NotImplementedError(f"{type(self).__name__} does not support raw queries")
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Export to JSON-compatible dict matching knowledge_graph.json format."""
-        entities = self.get_all_entities()
-        nodes = []
-        for e in entities:
+    def iter_nodes(self) -> Iterator[Dict[str, Any]]:
+        """Yield entities as knowledge_graph.json node dicts, one at a time."""
+        for e in self.iter_entities():
             descs = e.get("descriptions", [])
-            if isinstance(descs, set):
+            if isinstance(descs, (set, tuple)):
                 descs = list(descs)
-            nodes.append(
-                {
-                    "id": e.get("id", e["name"]),
-                    "name": e["name"],
-                    "type": e.get("type", "concept"),
-                    "descriptions": descs,
-                    "occurrences": e.get("occurrences", []),
-                }
-            )
-        return {"nodes": nodes, "relationships": self.get_all_relationships()}
+            yield {
+                "id": e.get("id", e["name"]),
+                "name": e["name"],
+                "type": e.get("type", "concept"),
+                "descriptions": descs,
+                "occurrences": e.get("occurrences", []),
+            }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export to JSON-compatible dict matching knowledge_graph.json format."""
+        return {"nodes": list(self.iter_nodes()), "relationships": self.get_all_relationships()}
+
+    def to_json_stream(self, fp: BinaryIO) -> None:
+        """Write knowledge_graph.json to binary *fp*, one record at a time.
+
+        The bytes match KnowledgeGraphData.model_dump_json(indent=2). Neither the
+        models nor the whole document are held in memory; each record is encoded
+        by pydantic-core and re-indented to its depth in the document.
+        """
+
+        def write_array(key: bytes, records: Iterable[Dict[str, Any]], last: bool) -> None:
+            fp.write(b'  "' + key + b'": [')
+            empty = True
+            for record in records:
+                fp.write(b"\n    " if empty else b",\n    ")
+                fp.write(pydantic_core.to_json(record, indent=2).replace(b"\n", b"\n    "))
+                empty = False
+            fp.write(b"]" if empty else b"\n  ]")
+            fp.write(b"\n" if last else b",\n")
+
+        nodes = (
+            {
+                "name": e["name"],
+                "type": e.get("type", "concept"),
+                "descriptions": list(e.get("descriptions", [])),
+                "source": None,  # Entity.source is not exported, as in to_data()
+                "occurrences": e.get("occurrences", []),
+            }
+            for e in self.iter_entities()
+        )
+        rels = (
+            {
+                "source": r.source,
+                "target": r.target,
+                "type": r.type,
+                "content_source": r.content_source,
+                # Relationship.timestamp is a float field; match its coercion
+                "timestamp": None if r.timestamp is None else float(r.timestamp),
+            }
+            for r in self.iter_relationship_rows()
+        )
+        fp.write(b"{\n")
+        write_array(b"nodes", nodes, last=False)
+        write_array(b"relationships", rels, last=True)
+        fp.write(b"}")
 
 
 class InMemoryStore(GraphStore):
     """In-memory graph store using Python dicts. Default fallback."""
 
     def __init__(self) -> None:
-        self._nodes: Dict[str, Dict[str, Any]] = {}  # keyed by name.lower()
+        self._nodes: Dict[str, NodeRecord] = {}  # keyed by _ci(name)
         self._relationships: List[Dict[str, Any]] = []
+        # Column-wise mirror of _nodes in insertion order, for filtering
+        self._rows: List[NodeRecord] = []
+        self._names_lc: List[str] = []
+        # Entity types are few, so the type column holds codes of their lower-cased form
+        self._type_enc = _LabelEncoder()
+        self._type_codes: List[int] = []
+        self._column_arrays: Optional[tuple] = None
+        # Lowercased (source, target, type) per relationship, parallel to _relationships
+        self._rel_keys_lc: List[tuple] = []
+        # (src_lower, tgt_lower) -> edge types present, for has_relationship
+        self._rel_index: Dict[Tuple[str, str], Set[Optional[str]]] = defaultdict(set)
+        self._csr: Optional[AdjacencyCSR] = None
 
     def merge_entity(
         self,
@@ -155,16 +497,27 @@ class InMemoryStore(GraphStore):
         key = name.lower()
         if key in self._nodes:
             if descriptions:
-                self._nodes[key]["descriptions"].update(descriptions)
+                node = self._nodes[key]
+                merged = tuple(sorted({*node.descriptions, *descriptions}))
+                if merged != node.descriptions:
+                    node.descriptions = merged
         else:
-            self._nodes[key] = {
-                "id": name,
-                "name": name,
-                "type": entity_type,
-                "descriptions": set(descriptions),
-                "occurrences": [],
-                "source": source,
-            }
+            # Sorted, de-duplicated descriptions: cheap to compare, stable export order
+            node = NodeRecord(
+                name,
+                _label(entity_type),
+                tuple(sorted(set(descriptions))),
+                [],
+                source,
+                row=len(self._rows),
+            )
+            key = _ci(name)
+            self._nodes[key] = node
+            self._rows.append(node)
+            self._names_lc.append(key)
+            self._type_codes.append(self._type_enc.encode((entity_type or "").lower()))
+            self._column_arrays = None
+            self._csr = None
 
     def add_occurrence(
         self,
@@ -175,7 +528,7 @@ class InMemoryStore(GraphStore):
     ) -> None:
         key = entity_name.lower()
         if key in self._nodes:
-            self._nodes[key]["occurrences"].append(
+            self._nodes[key].occurrences.append(
                 {"source": source, "timestamp": timestamp, "text": text}
             )
 
@@ -187,25 +540,40 @@ class InMemoryStore(GraphStore):
         content_source: Optional[str] = None,
         timestamp: Optional[float] = None,
     ) -> None:
-        self._relationships.append(
+        self._append_relationship(
             {
                 "source": source,
                 "target": target,
-                "type": rel_type,
+                "type": _label(rel_type),
                 "content_source": content_source,
                 "timestamp": timestamp,
             }
         )
 
+    def _append_relationship(self, rel: Dict[str, Any]) -> None:
+        src_lower, tgt_lower = _ci(rel["source"]), _ci(rel["target"])
+        self._relationships.append(rel)
+        self._rel_keys_lc.append((src_lower, tgt_lower, _ci(rel["type"] or "")))
+        self._rel_index[(src_lower, tgt_lower)].add(rel["type"])
+        self._csr = None
+
     def get_entity(self, name: str) -> Optional[Dict[str, Any]]:
-        return self._nodes.get(name.lower())
+        node = self._nodes.get(name.lower())
+        return node.to_dict() if node is not None else None
 
     def get_all_entities(self) -> List[Dict[str, Any]]:
-        return list(self._nodes.values())
+        return [node.to_dict() for node in self._nodes.values()]
 
     def get_all_relationships(self) -> List[Dict[str, Any]]:
         return list(self._relationships)
 
+    def iter_entities(self) -> Iterator[Dict[str, Any]]:
+        for node in self._nodes.values():
+            yield node.to_dict()
+
+    def iter_relationships(self) -> Iterator[Dict[str, Any]]:
+        yield from self._relationships
+
     def get_entity_count(self) -> int:
         return len(self._nodes)
 
@@ -215,6 +583,152 @@ class InMemoryStore(GraphStore):
     def has_entity(self, name: str) -> bool:
         return name.lower() in self._nodes
 
+    def existing_entities(self, names: Iterable[str]) -> Set[str]:
+        return {name for name in names if name.lower() in self._nodes}
+
+    def freeze(self) -> AdjacencyCSR:
+        """Return a CSR snapshot of the relationships, rebuilt only after writes.
+
+        Entities keep their insertion index as id; relationship endpoints that were
+        never merged as entities get ids after them.
+        """
+        if self._csr is not None:
+            return self._csr
+
+        names = list(self._names_lc)
+        id_of = {name: i for i, name in enumerate(names)}
+        labels = _LabelEncoder()
+        src, dst, types = [], [], []
+        for rel, (src_lc, tgt_lc, _) in zip(self._relationships, self._rel_keys_lc):
+            for name in (src_lc, tgt_lc):
+                if name not in id_of:
+                    id_of[name] = len(names)
+                    names.append(name)
+            src.append(id_of[src_lc])
+            dst.append(id_of[tgt_lc])
+            types.append(labels.encode(rel["type"]))
+
+        src_ids = np.array(src, dtype=np.int32)
+        order = np.argsort(src_ids, kind="stable")
+        offsets = np.zeros(len(names) + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src_ids, minlength=len(names)), out=offsets[1:])
+        type_dtype = np.min_scalar_type(max(len(labels.i2s) - 1, 0))
+        self._csr = AdjacencyCSR(
+            names=tuple(names),
+            id_of=id_of,
+            offsets=offsets,
+            neighbors=np.array(dst, dtype=np.int32)[order],
+            edge_type=np.array(types, dtype=type_dtype)[order],
+            labels=tuple(labels.i2s),
+        )
+        return self._csr
+
+    def out_neighbors(self, name: str) -> np.ndarray:
+        """CSR ids of the targets of *name*'s outgoing relationships, one per edge."""
+        csr = self.freeze()
+        u = csr.id_of.get(name.lower())
+        if u is None:
+            return csr.neighbors[:0]
+        return csr.neighbors[csr.offsets[u] : csr.offsets[u + 1]]
+
+    def degree(self, name: str) -> int:
+        """Number of outgoing relationships of *name*."""
+        return len(self.out_neighbors(name))
+
+    def bfs(self, name: str) -> np.ndarray:
+        """Hop distance from *name* to every CSR id along outgoing relationships.
+
+        Indexed like ``freeze().names``; -1 marks ids that can't be reached.
+        """
+        csr = self.freeze()
+        src = csr.id_of.get(name.lower())
+        if src is None:
+            return np.full(len(csr.names), -1, dtype=np.int32)
+        bfs, _ = _graph_kernels()
+        return bfs(csr.offsets, csr.neighbors, src)
+
+    def pagerank(self, damping: float = 0.85, iterations: int = 20) -> np.ndarray:
+        """PageRank of every CSR id, indexed like ``freeze().names``."""
+        csr = self.freeze()
+        if not csr.names:
+            return np.zeros(0)
+        _, pagerank = _graph_kernels()
+        return pagerank(csr.offsets, csr.neighbors, len(csr.names), damping, iterations)
+
+    def filter_indices(
+        self,
+        name_lc: Optional[str] = None,
+        type_lc: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """Return insertion-order indices of entities whose lower-cased name contains
+        *name_lc* and whose lower-cased type equals *type_lc*.
+        """
+        type_code = None
+        if type_lc:
+            type_code = self._type_enc.s2i.get(type_lc)
+            if type_code is None:
+                return []
+
+        if len(self._rows) >= _VECTORIZE_MIN_ENTITIES:
+            if self._column_arrays is None:
+                self._column_arrays = (
+                    np.array(self._names_lc),
+                    np.array(self._type_codes, dtype=np.int32),
+                )
+            names, types = self._column_arrays
+            mask = np.ones(len(names), dtype=bool)
+            if name_lc:
+                mask &= np.char.find(names, name_lc) >= 0
+            if type_code is not None:
+                mask &= types == type_code
+            return np.flatnonzero(mask)[:limit].tolist()
+
+        hits = (
+            i
+            for i, (n, t) in enumerate(zip(self._names_lc, self._type_codes))
+            if (not name_lc or name_lc in n) and (type_code is None or t == type_code)
+        )
+        return list(islice(hits, limit))
+
+    def find_entities(
+        self,
+        name: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        indices = self.filter_indices(
+            name.lower() if name else None,
+            entity_type.lower() if entity_type else None,
+            limit,
+        )
+        return [self._rows[i].to_dict() for i in indices]
+
+    def get_entities_by_names(self, names: Iterable[str]) -> List[Dict[str, Any]]:
+        wanted = {name.lower() for name in names}
+        return [
+            {"name": row.name, "type": row.type or "concept"}
+            for key, row in zip(self._names_lc, self._rows)
+            if key in wanted
+        ]
+
+    def find_relationships(
+        self,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        rel_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        src_q = source.lower() if source else ""
+        tgt_q = target.lower() if target else ""
+        type_q = rel_type.lower() if rel_type else ""
+        hits = (
+            rel
+            for rel, (src_lc, tgt_lc, type_lc) in zip(self._relationships, self._rel_keys_lc)
+            if src_q in src_lc and tgt_q in tgt_lc and type_q in type_lc
+        )
+        return list(islice(hits, limit))
+
     def add_typed_relationship(
         self,
         source: str,
@@ -225,21 +739,37 @@ class InMemoryStore(GraphStore):
         entry: Dict[str, Any] = {
             "source": source,
             "target": target,
-            "type": edge_label,
+            "type": _label(edge_label),
         }
         if properties:
             entry.update(properties)
-        self._relationships.append(entry)
+        self._append_relationship(entry)
 
     def set_entity_properties(
         self,
         name: str,
         properties: Dict[str, Any],
     ) -> bool:
+        if "name" in properties:
+            raise ValueError("set_entity_properties cannot rename an entity")
         key = name.lower()
         if key not in self._nodes:
             return False
-        self._nodes[key].update(properties)
+        node = self._nodes[key]
+        for prop, value in properties.items():
+            if prop == "descriptions":
+                # Keep the sorted, de-duplicated tuple merge_entity relies on
+                node.descriptions = tuple(sorted(set(value or ())))
+            elif prop in _NODE_FIELDS:
+                setattr(node, prop, value)
+            else:
+                if node.extra is None:
+                    node.extra = {}
+                node.extra[prop] = value
+        if "type" in properties:
+            node.type = _label(properties["type"])
+            self._type_codes[node.row] = self._type_enc.encode((properties["type"] or "").lower())
+            self._column_arrays = None
         return True
 
     def has_relationship(
@@ -248,13 +778,162 @@ class InMemoryStore(GraphStore):
         target: str,
         edge_label: Optional[str] = None,
     ) -> bool:
-        src_lower = source.lower()
-        tgt_lower = target.lower()
-        for rel in self._relationships:
-            if rel["source"].lower() == src_lower and rel["target"].lower() == tgt_lower:
-                if edge_label is None or rel.get("type") == edge_label:
-                    return True
-        return False
+        labels = self._rel_index.get((source.lower(), target.lower()))
+        return bool(labels) and (edge_label is None or edge_label in labels)
+
+
+# Tail of an entity query with `e` bound: one row per entity, occurrences collected
+# inline rather than fetched per entity. collect() drops the NULLs from entities
+# without occurrences. Columns: name, name_lower, type, descriptions, source, occs, id
+_ENTITY_WITH_OCCURRENCES = (
+    "OPTIONAL MATCH (e)-[:OCCURRED_IN]->(o:Occurrence) "
+    "WITH e, collect(CASE WHEN o IS NULL THEN NULL "
+    "ELSE [o.source, o.timestamp, o.text] END) AS occs "
+    "RETURN e.name, e.name_lower, e.type, e.descriptions, e.source, occs, id(e) AS node_id"
+)
+
+# FalkorDBStore's fixed queries, built once so every call sends identical text
+_Q_LIST_INDEXES = "CALL db.indexes() YIELD label, properties"
+_Q_CREATE_INDEXES = {
+    ("Entity", prop): f"CREATE INDEX FOR (e:Entity) ON (e.{prop})"
+    for prop in ("name_lower", "type", "dag_id")
+}
+_Q_MERGE_ENTITY = (
+    "MERGE (e:Entity {name_lower: $name_lower}) "
+    "ON CREATE SET e.name = $name, e.type = $type, "
+    "e.descriptions = $descs, e.source = $source "
+    "ON MATCH SET e.descriptions = coalesce(e.descriptions, []) + "
+    "[x IN $descs WHERE NOT x IN coalesce(e.descriptions, [])]"
+)
+# Re-asserting an entity with nothing to add: create it if missing, never touch lists
+_Q_MERGE_ENTITY_BARE = (
+    "MERGE (e:Entity {name_lower: $name_lower}) "
+    "ON CREATE SET e.name = $name, e.type = $type, e.descriptions = [], e.source = $source"
+)
+_Q_MERGE_ENTITIES_BULK = (
+    "UNWIND $rows AS r "
+    "MERGE (e:Entity {name_lower: r.name_lower}) "
+    "ON CREATE SET e.name = r.name, e.type = r.type, "
+    "e.descriptions = r.descs, e.source = r.source "
+    "ON MATCH SET e.descriptions = coalesce(e.descriptions, []) + "
+    "[x IN r.descs WHERE NOT x IN coalesce(e.descriptions, [])]"
+)
+_Q_ADD_OCCURRENCE = (
+    "MATCH (e:Entity {name_lower: $name_lower}) "
+    "CREATE (o:Occurrence {source: $source, timestamp: $timestamp, text: $text}) "
+    "CREATE (e)-[:OCCURRED_IN]->(o)"
+)
+_Q_ADD_OCCURRENCES_BULK = (
+    "UNWIND $rows AS r "
+    "MATCH (e:Entity {name_lower: r.name_lower}) "
+    "CREATE (o:Occurrence {source: r.source, timestamp: r.ts, text: r.text}) "
+    "CREATE (e)-[:OCCURRED_IN]->(o)"
+)
+_Q_ADD_RELATIONSHIP = (
+    "MATCH (a:Entity {name_lower: $src_lower}) "
+    "MATCH (b:Entity {name_lower: $tgt_lower}) "
+    "CREATE (a)-[:RELATED_TO {"
+    "rel_type: $rel_type, content_source: $content_source, timestamp: $timestamp"
+    "}]->(b)"
+)
+_Q_GET_ENTITY = "MATCH (e:Entity {name_lower: $name_lower}) " + _ENTITY_WITH_OCCURRENCES
+_Q_ADD_RELATIONSHIPS_BULK = (
+    "UNWIND $rows AS r "
+    "MATCH (a:Entity {name_lower: r.src_lower}) "
+    "MATCH (b:Entity {name_lower: r.tgt_lower}) "
+    "CREATE (a)-[:RELATED_TO {"
+    "rel_type: r.rel_type, content_source: r.content_source, timestamp: r.ts"
+    "}]->(b)"
+)
+_Q_ALL_ENTITIES = "MATCH (e:Entity) " + _ENTITY_WITH_OCCURRENCES
+_Q_ENTITY_PAGE = (
+    "MATCH (e:Entity) WHERE id(e) > $last_id "
+    "WITH e ORDER BY id(e) LIMIT $page_size " + _ENTITY_WITH_OCCURRENCES + " ORDER BY node_id"
+)
+_RELATIONSHIP_COLUMNS = "RETURN a.name, b.name, r.rel_type, r.content_source, r.timestamp"
+_Q_ALL_RELATIONSHIPS = "MATCH (a:Entity)-[r:RELATED_TO]->(b:Entity) " + _RELATIONSHIP_COLUMNS
+_Q_ENTITIES_BY_NAME = (
+    "MATCH (e:Entity) WHERE e.name_lower IN $names RETURN e.name, e.type ORDER BY id(e)"
+)
+_Q_ENTITY_COUNT = "MATCH (e:Entity) RETURN count(e)"
+# Occurrence edges are internal bookkeeping, not relationships
+_Q_RELATIONSHIP_COUNT = "MATCH ()-[r]->() WHERE type(r) <> 'OCCURRED_IN' RETURN count(r)"
+_Q_ENTITY_NAMES = "MATCH (e:Entity) RETURN e.name_lower"
+_Q_EXISTING_NAMES = "UNWIND $names AS n MATCH (e:Entity {name_lower: n}) RETURN e.name_lower"
+
+
+# Rows sent per UNWIND query by FalkorDBStore.add_occurrences_bulk and
+# add_relationships_bulk
+_OCCURRENCE_BATCH_SIZE = 500
+_RELATIONSHIP_BATCH_SIZE = 500
+
+_CYPHER_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _cypher_name(name: str) -> str:
+    """Validate an edge label or property key before it is spliced into Cypher."""
+    if not _CYPHER_NAME.fullmatch(name):
+        raise ValueError(f"Invalid Cypher identifier: {name!r}")
+    return name
+
+
+# FalkorDB requires static relationship types, so labels can't be parameters. Each
+# (label, property keys) shape gets one query string, reused so the server's plan
+# cache sees the same text every time.
+@functools.lru_cache(maxsize=256)
+def _typed_relationship_query(edge_label: str, prop_keys: Tuple[str, ...]) -> str:
+    query = (
+        "MATCH (a:Entity {name_lower: $src_lower}) "
+        "MATCH (b:Entity {name_lower: $tgt_lower}) "
+        f"CREATE (a)-[r:{_cypher_name(edge_label)}]->(b)"
+    )
+    if prop_keys:
+        query += " SET " + ", ".join(
+            f"r.{_cypher_name(k)} = $prop_{i}" for i, k in enumerate(prop_keys)
+        )
+    return query
+
+
+@functools.lru_cache(maxsize=None)
+def _find_entities_query(by_name: bool, by_type: bool) -> str:
+    where = []
+    if by_name:
+        where.append("e.name_lower CONTAINS $name")
+    if by_type:
+        where.append("toLower(coalesce(e.type, 'concept')) = $type")
+    where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+    return f"MATCH (e:Entity) {where_clause}WITH e LIMIT $limit " + _ENTITY_WITH_OCCURRENCES
+
+
+@functools.lru_cache(maxsize=None)
+def _find_relationships_query(by_source: bool, by_target: bool, by_type: bool) -> str:
+    where = []
+    if by_source:
+        where.append("a.name_lower CONTAINS $source")
+    if by_target:
+        where.append("b.name_lower CONTAINS $target")
+    if by_type:
+        where.append("toLower(coalesce(r.rel_type, 'related_to')) CONTAINS $rel_type")
+    where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+    return (
+        f"MATCH (a:Entity)-[r:RELATED_TO]->(b:Entity) {where_clause}"
+        f"{_RELATIONSHIP_COLUMNS} LIMIT $limit"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _set_properties_query(prop_keys: Tuple[str, ...]) -> str:
+    set_parts = ", ".join(f"e.{_cypher_name(k)} = $prop_{i}" for i, k in enumerate(prop_keys))
+    return f"MATCH (e:Entity {{name_lower: $name_lower}}) SET {set_parts}"
+
+
+@functools.lru_cache(maxsize=256)
+def _has_relationship_query(edge_label: Optional[str]) -> str:
+    rel = f"[:{_cypher_name(edge_label)}]" if edge_label else "[]"
+    return (
+        f"MATCH (a:Entity {{name_lower: $src_lower}})-{rel}->"
+        "(b:Entity {name_lower: $tgt_lower}) RETURN 1 LIMIT 1"
+    )
 
 
 class FalkorDBStore(GraphStore):
@@ -273,13 +952,34 @@ class FalkorDBStore(GraphStore):
         self._db = FalkorDB(self._db_path)
         self._graph = self._db.select_graph("knowledge")
         self._ensure_indexes()
+        # Counts are queried once, then kept current from each write's statistics.
+        # None means unknown (not yet queried, or invalidated by raw_query).
+        self._entity_count: Optional[int] = None
+        self._rel_count: Optional[int] = None
+        # name_lower of every entity, loaded on first has_entity() and kept in step
+        # with merges, so existence checks (mostly misses during ingest) stay local
+        self._entity_names: Optional[Set[str]] = None
+
+    def _track_created(self, result: Any, nodes: bool = False, edges: bool = False) -> None:
+        """Advance the cached counts by what a write query reports it created."""
+        if nodes and self._entity_count is not None:
+            created = getattr(result, "nodes_created", None)
+            self._entity_count = None if created is None else self._entity_count + created
+        if edges and self._rel_count is not None:
+            created = getattr(result, "relationships_created", None)
+            self._rel_count = None if created is None else self._rel_count + created
 
     def _ensure_indexes(self) -> None:
-        for query in [
-            "CREATE INDEX FOR (e:Entity) ON (e.name_lower)",
-            "CREATE INDEX FOR (e:Entity) ON (e.type)",
-            "CREATE INDEX FOR (e:Entity) ON (e.dag_id)",
-        ]:
+        # Reopening an existing graph is the common case: list what is indexed
+        # and only create what is missing
+        try:
+            rows = self._graph.query(_Q_LIST_INDEXES).result_set
+            existing = {(label, prop) for label, props in rows for prop in props}
+        except Exception:
+            existing = set()  # can't list; fall back to create-and-ignore
+        for key, query in _Q_CREATE_INDEXES.items():
+            if key in existing:
+                continue
             try:
                 self._graph.query(query)
             except Exception:
@@ -292,37 +992,48 @@ class FalkorDBStore(GraphStore):
         descriptions: List[str],
         source: Optional[str] = None,
     ) -> None:
-        name_lower = name.lower()
-
-        # Check if entity exists
-        result = self._graph.query(
-            "MATCH (e:Entity {name_lower: $name_lower}) RETURN e.descriptions",
-            params={"name_lower": name_lower},
-        )
-
-        if result.result_set:
-            # Entity exists — merge descriptions
-            existing_descs = result.result_set[0][0] or []
-            merged = list(set(existing_descs + descriptions))
-            self._graph.query(
-                "MATCH (e:Entity {name_lower: $name_lower}) SET e.descriptions = $descs",
-                params={"name_lower": name_lower, "descs": merged},
-            )
+        params = {
+            "name": name,
+            "name_lower": name.lower(),
+            "type": entity_type,
+            "source": source,
+        }
+        if descriptions:
+            # One round-trip whether or not the entity exists; only unseen
+            # descriptions are appended, server-side
+            params["descs"] = list(dict.fromkeys(descriptions))
+            result = self._graph.query(_Q_MERGE_ENTITY, params=params)
+        elif self.has_entity(name):
+            return  # a bare re-mention changes nothing
         else:
-            # Create new entity
-            self._graph.query(
-                "CREATE (e:Entity {"
-                "name: $name, name_lower: $name_lower, type: $type, "
-                "descriptions: $descs, source: $source"
-                "})",
-                params={
-                    "name": name,
+            result = self._graph.query(_Q_MERGE_ENTITY_BARE, params=params)
+        self._track_created(result, nodes=True)
+        if self._entity_names is not None:
+            self._entity_names.add(name.lower())
+
+    def merge_entities_bulk(self, rows: List[Dict[str, Any]]) -> None:
+        # Fold same-name rows together first; MERGE then upserts the batch in one query
+        batch: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            name_lower = row["name"].lower()
+            descs = row.get("descriptions") or []
+            if name_lower in batch:
+                merged = batch[name_lower]["descs"]
+                merged.extend(d for d in descs if d not in merged)
+            else:
+                batch[name_lower] = {
+                    "name": row["name"],
                     "name_lower": name_lower,
-                    "type": entity_type,
-                    "descs": descriptions,
-                    "source": source,
-                },
-            )
+                    "type": row["type"],
+                    "descs": list(dict.fromkeys(descs)),
+                    "source": row.get("source"),
+                }
+        if not batch:
+            return
+        result = self._graph.query(_Q_MERGE_ENTITIES_BULK, params={"rows": list(batch.values())})
+        self._track_created(result, nodes=True)
+        if self._entity_names is not None:
+            self._entity_names.update(batch)
 
     def add_occurrence(
         self,
@@ -333,9 +1044,7 @@ class FalkorDBStore(GraphStore):
     ) -> None:
         name_lower = entity_name.lower()
         self._graph.query(
-            "MATCH (e:Entity {name_lower: $name_lower}) "
-            "CREATE (o:Occurrence {source: $source, timestamp: $timestamp, text: $text}) "
-            "CREATE (e)-[:OCCURRED_IN]->(o)",
+            _Q_ADD_OCCURRENCE,
             params={
                 "name_lower": name_lower,
                 "source": source,
@@ -344,6 +1053,23 @@ class FalkorDBStore(GraphStore):
             },
         )
 
+    def add_occurrences_bulk(
+        self, rows: Iterable[Tuple[str, str, Optional[float], Optional[str]]]
+    ) -> None:
+        batch = []
+        for entity_name, source, timestamp, text in rows:
+            batch.append(
+                {"name_lower": entity_name.lower(), "source": source, "ts": timestamp, "text": text}
+            )
+            if len(batch) >= _OCCURRENCE_BATCH_SIZE:
+                self._create_occurrences(batch)
+                batch = []
+        if batch:
+            self._create_occurrences(batch)
+
+    def _create_occurrences(self, batch: List[Dict[str, Any]]) -> None:
+        self._graph.query(_Q_ADD_OCCURRENCES_BULK, params={"rows": batch})
+
     def add_relationship(
         self,
         source: str,
@@ -352,12 +1078,8 @@ class FalkorDBStore(GraphStore):
         content_source: Optional[str] = None,
         timestamp: Optional[float] = None,
     ) -> None:
-        self._graph.query(
-            "MATCH (a:Entity {name_lower: $src_lower}) "
-            "MATCH (b:Entity {name_lower: $tgt_lower}) "
-            "CREATE (a)-[:RELATED_TO {"
-            "rel_type: $rel_type, content_source: $content_source, timestamp: $timestamp"
-            "}]->(b)",
+        result = self._graph.query(
+            _Q_ADD_RELATIONSHIP,
             params={
                 "src_lower": source.lower(),
                 "tgt_lower": target.lower(),
@@ -366,71 +1088,84 @@ class FalkorDBStore(GraphStore):
                 "timestamp": timestamp,
             },
         )
+        self._track_created(result, edges=True)
+
+    def add_relationships_bulk(
+        self, rows: Iterable[Tuple[str, str, str, Optional[str], Optional[float]]]
+    ) -> None:
+        batch = []
+        for source, target, rel_type, content_source, timestamp in rows:
+            batch.append(
+                {
+                    "src_lower": source.lower(),
+                    "tgt_lower": target.lower(),
+                    "rel_type": rel_type,
+                    "content_source": content_source,
+                    "ts": timestamp,
+                }
+            )
+            if len(batch) >= _RELATIONSHIP_BATCH_SIZE:
+                self._create_relationships(batch)
+                batch = []
+        if batch:
+            self._create_relationships(batch)
+
+    def _create_relationships(self, batch: List[Dict[str, Any]]) -> None:
+        result = self._graph.query(_Q_ADD_RELATIONSHIPS_BULK, params={"rows": batch})
+        self._track_created(result, edges=True)
 
     def get_entity(self, name: str) -> Optional[Dict[str, Any]]:
-        result = self._graph.query(
-            "MATCH (e:Entity {name_lower: $name_lower}) "
-            "RETURN e.name, e.type, e.descriptions, e.source",
-            params={"name_lower": name.lower()},
-        )
-        if not result.result_set:
-            return None
+        result = self._graph.query(_Q_GET_ENTITY, params={"name_lower": name.lower()})
+        entities = self._entities_from_rows(result.result_set)
+        return entities[0] if entities else None
 
-        row = result.result_set[0]
-        entity_name = row[0]
+    def get_all_entities(self) -> List[Dict[str, Any]]:
+        result = self._graph.query(_Q_ALL_ENTITIES)
+        return self._entities_from_rows(result.result_set)
 
-        # Fetch occurrences
-        occ_result = self._graph.query(
-            "MATCH (e:Entity {name_lower: $name_lower})-[:OCCURRED_IN]->(o:Occurrence) "
-            "RETURN o.source, o.timestamp, o.text",
-            params={"name_lower": name.lower()},
-        )
-        occurrences = [
-            {"source": o[0], "timestamp": o[1], "text": o[2]} for o in occ_result.result_set
+    @staticmethod
+    def _entities_from_rows(rows: List[list]) -> List[Dict[str, Any]]:
+        """Build entity dicts from rows returned by _ENTITY_WITH_OCCURRENCES."""
+        return [
+            {
+                "id": row[0],
+                "name": row[0],
+                "type": row[2] or "concept",
+                "descriptions": row[3] or [],
+                "occurrences": [
+                    {"source": o[0], "timestamp": o[1], "text": o[2]} for o in row[5] if o
+                ],
+                "source": row[4],
+            }
+            for row in rows
         ]
 
-        return {
-            "id": entity_name,
-            "name": entity_name,
-            "type": row[1] or "concept",
-            "descriptions": row[2] or [],
-            "occurrences": occurrences,
-            "source": row[3],
-        }
+    def get_all_relationships(self) -> List[Dict[str, Any]]:
+        result = self._graph.query(_Q_ALL_RELATIONSHIPS)
+        return self._relationships_from_rows(result.result_set)
 
-    def get_all_entities(self) -> List[Dict[str, Any]]:
-        result = self._graph.query(
-            "MATCH (e:Entity) RETURN e.name, e.name_lower, e.type, e.descriptions, e.source"
-        )
-        entities = []
+    def iter_relationship_rows(self) -> Iterator[RelationshipRow]:
+        # Built straight from the result rows, skipping the per-row dicts
+        result = self._graph.query(_Q_ALL_RELATIONSHIPS)
         for row in result.result_set:
-            name_lower = row[1]
-            # Fetch occurrences for this entity
-            occ_result = self._graph.query(
-                "MATCH (e:Entity {name_lower: $name_lower})-[:OCCURRED_IN]->(o:Occurrence) "
-                "RETURN o.source, o.timestamp, o.text",
-                params={"name_lower": name_lower},
-            )
-            occurrences = [
-                {"source": o[0], "timestamp": o[1], "text": o[2]} for o in occ_result.result_set
-            ]
-            entities.append(
-                {
-                    "id": row[0],
-                    "name": row[0],
-                    "type": row[2] or "concept",
-                    "descriptions": row[3] or [],
-                    "occurrences": occurrences,
-                    "source": row[4],
-                }
-            )
-        return entities
+            yield RelationshipRow(row[0], row[1], row[2] or "related_to", row[3], row[4])
 
-    def get_all_relationships(self) -> List[Dict[str, Any]]:
-        result = self._graph.query(
-            "MATCH (a:Entity)-[r:RELATED_TO]->(b:Entity) "
-            "RETURN a.name, b.name, r.rel_type, r.content_source, r.timestamp"
+    def get_relationships_columnar(self) -> Dict[str, List[Any]]:
+        # One query, transposed in C by zip(*rows)
+        rows = self._graph.query(_Q_ALL_RELATIONSHIPS).result_set
+        sources, targets, types, content_sources, timestamps = (
+            map(list, zip(*rows)) if rows else ([], [], [], [], [])
         )
+        return {
+            "source": sources,
+            "target": targets,
+            "type": [t or "related_to" for t in types],
+            "content_source": content_sources,
+            "timestamp": timestamps,
+        }
+
+    @staticmethod
+    def _relationships_from_rows(rows: List[list]) -> List[Dict[str, Any]]:
         return [
             {
                 "source": row[0],
@@ -439,30 +1174,98 @@ class FalkorDBStore(GraphStore):
                 "content_source": row[3],
                 "timestamp": row[4],
             }
-            for row in result.result_set
+            for row in rows
         ]
 
+    def find_entities(
+        self,
+        name: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"limit": limit}
+        if name:
+            params["name"] = name.lower()
+        if entity_type:
+            params["type"] = entity_type.lower()
+        query = _find_entities_query(bool(name), bool(entity_type))
+        result = self._graph.query(query, params=params)
+        return self._entities_from_rows(result.result_set)
+
+    def get_entities_by_names(self, names: Iterable[str]) -> List[Dict[str, Any]]:
+        names_lower = list({name.lower() for name in names})
+        if not names_lower:
+            return []
+        result = self._graph.query(_Q_ENTITIES_BY_NAME, params={"names": names_lower})
+        return [{"name": row[0], "type": row[1] or "concept"} for row in result.result_set]
+
+    def find_relationships(
+        self,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        rel_type: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"limit": limit}
+        if source:
+            params["source"] = source.lower()
+        if target:
+            params["target"] = target.lower()
+        if rel_type:
+            params["rel_type"] = rel_type.lower()
+        query = _find_relationships_query(bool(source), bool(target), bool(rel_type))
+        result = self._graph.query(query, params=params)
+        return self._relationships_from_rows(result.result_set)
+
+    def iter_entities(self, page_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yield entities a page at a time, keyed on internal node id."""
+        last_id = -1
+        while True:
+            result = self._graph.query(
+                _Q_ENTITY_PAGE, params={"last_id": last_id, "page_size": page_size}
+            )
+            rows = result.result_set
+            yield from self._entities_from_rows(rows)
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][6]
+
     def get_entity_count(self) -> int:
-        result = self._graph.query("MATCH (e:Entity) RETURN count(e)")
-        return result.result_set[0][0] if result.result_set else 0
+        if self._entity_count is None:
+            result = self._graph.query(_Q_ENTITY_COUNT)
+            self._entity_count = result.result_set[0][0] if result.result_set else 0
+        return self._entity_count
 
     def get_relationship_count(self) -> int:
-        result = self._graph.query("MATCH ()-[r]->() RETURN count(r)")
-        count = result.result_set[0][0] if result.result_set else 0
-        # Subtract occurrence edges which are internal bookkeeping
-        occ_result = self._graph.query("MATCH ()-[r:OCCURRED_IN]->() RETURN count(r)")
-        occ_count = occ_result.result_set[0][0] if occ_result.result_set else 0
-        return count - occ_count
+        if self._rel_count is None:
+            result = self._graph.query(_Q_RELATIONSHIP_COUNT)
+            self._rel_count = result.result_set[0][0] if result.result_set else 0
+        return self._rel_count
 
     def has_entity(self, name: str) -> bool:
-        result = self._graph.query(
-            "MATCH (e:Entity {name_lower: $name_lower}) RETURN count(e)",
-            params={"name_lower": name.lower()},
-        )
-        return result.result_set[0][0] > 0 if result.result_set else False
+        if self._entity_names is None:
+            result = self._graph.query(_Q_ENTITY_NAMES)
+            self._entity_names = {row[0] for row in result.result_set}
+        return name.lower() in self._entity_names
+
+    def existing_entities(self, names: Iterable[str]) -> Set[str]:
+        names = set(names)
+        if self._entity_names is not None:
+            return {name for name in names if name.lower() in self._entity_names}
+        # Name set not loaded yet: look up just these names, in one query
+        by_lower: Dict[str, List[str]] = defaultdict(list)
+        for name in names:
+            by_lower[name.lower()].append(name)
+        if not by_lower:
+            return set()
+        result = self._graph.query(_Q_EXISTING_NAMES, params={"names": list(by_lower)})
+        return {name for row in result.result_set for name in by_lower[row[0]]}
 
     def raw_query(self, query_string: str) -> Any:
         """Execute a raw Cypher query and return the result set."""
+        # The query may write anything, so recount and reload names on next access
+        self._entity_count = self._rel_count = None
+        self._entity_names = None
         result = self._graph.query(query_string)
         return result.result_set
 
@@ -474,53 +1277,35 @@ class FalkorDBStore(GraphStore):
         properties: Optional[Dict[str, Any]] = None,
     ) -> None:
         props = properties or {}
-        # Build property string for Cypher SET clause
-        prop_assignments = []
         params: Dict[str, Any] = {
             "src_lower": source.lower(),
             "tgt_lower": target.lower(),
         }
-        for i, (k, v) in enumerate(props.items()):
-            param_name = f"prop_{i}"
-            prop_assignments.append(f"r.{k} = ${param_name}")
-            params[param_name] = v
-
-        set_clause = ""
-        if prop_assignments:
-            set_clause = " SET " + ", ".join(prop_assignments)
-
-        # FalkorDB requires static relationship types in CREATE, so we use
-        # a parameterized approach with specific known labels
-        query = (
-            f"MATCH (a:Entity {{name_lower: $src_lower}}) "
-            f"MATCH (b:Entity {{name_lower: $tgt_lower}}) "
-            f"CREATE (a)-[r:{edge_label}]->(b)"
-            f"{set_clause}"
-        )
-        self._graph.query(query, params=params)
+        for i, v in enumerate(props.values()):
+            params[f"prop_{i}"] = v
+        query = _typed_relationship_query(edge_label, tuple(props))
+        result = self._graph.query(query, params=params)
+        self._track_created(result, edges=True)
 
     def set_entity_properties(
         self,
         name: str,
         properties: Dict[str, Any],
     ) -> bool:
+        if "name" in properties:
+            raise ValueError("set_entity_properties cannot rename an entity")
         name_lower = name.lower()
         # Check entity exists
         if not self.has_entity(name):
             return False
 
-        params: Dict[str, Any] = {"name_lower": name_lower}
-        set_parts = []
-        for i, (k, v) in enumerate(properties.items()):
-            param_name = f"prop_{i}"
-            set_parts.append(f"e.{k} = ${param_name}")
-            params[param_name] = v
-
-        if not set_parts:
+        if not properties:
             return True
 
-        query = f"MATCH (e:Entity {{name_lower: $name_lower}}) SET {', '.join(set_parts)}"
-        self._graph.query(query, params=params)
+        params: Dict[str, Any] = {"name_lower": name_lower}
+        for i, v in enumerate(properties.values()):
+            params[f"prop_{i}"] = v
+        self._graph.query(_set_properties_query(tuple(properties)), params=params)
         return True
 
     def has_relationship(
@@ -533,22 +1318,9 @@ class FalkorDBStore(GraphStore):
             "src_lower": source.lower(),
             "tgt_lower": target.lower(),
         }
-        if edge_label:
-            query = (
-                f"MATCH (a:Entity {{name_lower: $src_lower}})"
-                f"-[:{edge_label}]->"
-                f"(b:Entity {{name_lower: $tgt_lower}}) "
-                f"RETURN count(*)"
-            )
-        else:
-            query = (
-                "MATCH (a:Entity {name_lower: $src_lower})"
-                "-[]->"
-                "(b:Entity {name_lower: $tgt_lower}) "
-                "RETURN count(*)"
-            )
+        query = _has_relationship_query(edge_label or None)
         result = self._graph.query(query, params=params)
-        return result.result_set[0][0] > 0 if result.result_set else False
+        return bool(result.result_set)
 
     def close(self) -> None:
         """Release references. FalkorDB Lite handles persistence automatically."""
@@ -1,6 +1,10 @@
 """Knowledge graph integration for organizing extracted content."""
 
+import heapq
 import logging
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -9,10 +13,17 @@ from tqdm import tqdm
 from video_processor.integrators.graph_store import GraphStore, create_store
 from video_processor.models import Entity, KnowledgeGraphData, Relationship
 from video_processor.providers.manager import ProviderManager
+from video_processor.utils.compression import compress_file
 from video_processor.utils.json_parsing import parse_json_from_response
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in a mermaid node id (anything but str.isalnum() and "_")
+_MERMAID_UNSAFE = re.compile(r"\W")
+
+# Concurrent extraction requests in process_transcript/process_diagrams
+_LLM_WORKERS = 8
+
 
 class KnowledgeGraph:
     """Integrates extracted content into a structured knowledge graph."""
@@ -30,14 +41,14 @@ class KnowledgeGraph:
     def nodes(self) -> Dict[str, dict]:
         """Backward-compatible read access to nodes as a dict keyed by entity name."""
         result = {}
-        for entity in self._store.get_all_entities():
+        for entity in self._store.iter_entities():
             name = entity["name"]
             descs = entity.get("descriptions", [])
             result[name] = {
                 "id": entity.get("id", name),
                 "name": name,
                 "type": entity.get("type", "concept"),
-                "descriptions": set(descs) if isinstance(descs, list) else descs,
+                "descriptions": set(descs),
                 "occurrences": entity.get("occurrences", []),
             }
         return result
@@ -57,11 +68,10 @@ class KnowledgeGraph:
             temperature=temperature,
         )
 
-    def extract_entities_and_relationships(
-        self, text: str
-    ) -> tuple[List[Entity], List[Relationship]]:
-        """Extract entities and relationships in a single LLM call."""
-        prompt = (
+    @staticmethod
+    def _extraction_prompt(text: str) -> str:
+        """The prompt asking for entities and relationships in *text* as JSON."""
+        return (
             "Extract all notable entities and relationships from the following content.\n\n"
             f"CONTENT:\n{text}\n\n"
             "Return a JSON object with two keys:\n"
@@ -73,7 +83,16 @@ class KnowledgeGraph:
             '"type": "relationship description"}\n\n'
             "Return ONLY the JSON object."
         )
-        raw = self._chat(prompt)
+
+    def extract_entities_and_relationships(
+        self, text: str
+    ) -> tuple[List[Entity], List[Relationship]]:
+        """Extract entities and relationships in a single LLM call."""
+        return self._parse_extraction(self._chat(self._extraction_prompt(text)))
+
+    @staticmethod
+    def _parse_extraction(raw: str) -> tuple[List[Entity], List[Relationship]]:
+        """Parse an extraction response into entities and relationships."""
         parsed = parse_json_from_response(raw)
 
         entities = []
@@ -89,7 +108,6 @@ class KnowledgeGraph:
                             descriptions=[item["description"]] if item.get("description") else [],
                         )
                     )
-            {e.name for e in entities}
             for item in parsed.get("relationships", []):
                 if isinstance(item, dict) and "source" in item and "target" in item:
                     rels.append(
@@ -116,97 +134,211 @@ class KnowledgeGraph:
     def add_content(self, text: str, source: str, timestamp: Optional[float] = None) -> None:
         """Add content to knowledge graph by extracting entities and relationships."""
         entities, relationships = self.extract_entities_and_relationships(text)
-
+        self._add_extracted(text, source, timestamp, entities, relationships)
+
+    def _extract_or_skip(self, text: str) -> tuple[List[Entity], List[Relationship]]:
+        """Extract from one batch, logging a failure as an empty result.
+
+        Batches run concurrently, so one failed LLM call must not discard the rest.
+        """
+        try:
+            return self.extract_entities_and_relationships(text)
+        except Exception as e:
+            logger.warning(f"Entity extraction failed, skipping batch: {e}")
+            return [], []
+
+    def _extract_batch(
+        self, texts: List[str]
+    ) -> Optional[List[Optional[tuple[List[Entity], List[Relationship]]]]]:
+        """Extract from all texts in one provider batch job.
+
+        Returns None if there is no provider, it has no batch API, or the job
+        fails (e.g. ends expired or cancelled), so the caller can fall back to
+        individual requests. Within a finished job, a request that failed is
+        None in the result list.
+        """
+        if not self.pm or not hasattr(self.pm, "chat_batch"):
+            return None
+        try:
+            raws = self.pm.chat_batch(
+                [[{"role": "user", "content": self._extraction_prompt(t)}] for t in texts],
+                max_tokens=4096,
+                temperature=0.3,
+            )
+        except NotImplementedError as e:
+            logger.info(f"{e}, extracting batches individually")
+            return None
+        except Exception as e:
+            logger.warning(f"Batch extraction failed, extracting batches individually: {e}")
+            return None
+        return [None if raw is None else self._parse_extraction(raw) for raw in raws]
+
+    def _add_extracted(
+        self,
+        text: str,
+        source: str,
+        timestamp: Optional[float],
+        entities: List[Entity],
+        relationships: List[Relationship],
+    ) -> None:
+        """Write one extraction result to the store."""
         snippet = text[:100] + "..." if len(text) > 100 else text
 
-        for entity in entities:
-            self._store.merge_entity(entity.name, entity.type, entity.descriptions, source=source)
-            self._store.add_occurrence(entity.name, source, timestamp, snippet)
-
-        for rel in relationships:
-            if self._store.has_entity(rel.source) and self._store.has_entity(rel.target):
-                self._store.add_relationship(
-                    rel.source,
-                    rel.target,
-                    rel.type,
-                    content_source=source,
-                    timestamp=timestamp,
-                )
-
-    def process_transcript(self, transcript: Dict, batch_size: int = 10) -> None:
-        """Process transcript segments into knowledge graph, batching for efficiency."""
+        self._store.merge_entities_bulk(
+            [
+                {"name": e.name, "type": e.type, "descriptions": e.descriptions, "source": source}
+                for e in entities
+            ]
+        )
+        self._store.add_occurrences_bulk((e.name, source, timestamp, snippet) for e in entities)
+        if not relationships:
+            return
+        # Entities merged above exist; check the other endpoints in one call
+        existing = {e.name for e in entities}
+        unknown = {rel.source for rel in relationships} | {rel.target for rel in relationships}
+        unknown -= existing
+        if unknown:
+            existing |= self._store.existing_entities(unknown)
+        self._store.add_relationships_bulk(
+            (rel.source, rel.target, rel.type, source, timestamp)
+            for rel in relationships
+            if rel.source in existing and rel.target in existing
+        )
+
+    def process_transcript(
+        self,
+        transcript: Dict,
+        batch_size: int = 10,
+        max_workers: int = _LLM_WORKERS,
+        mode: str = "sync",
+    ) -> None:
+        """Process transcript segments into knowledge graph, batching for efficiency.
+
+        Up to max_workers batches are sent to the LLM at once; results are written
+        to the store in transcript order, from this thread only.
+
+        With mode="batch" every batch is submitted as one provider batch job
+        instead: roughly half the cost, but results can take hours. Providers
+        without a batch API, or a failed job, fall back to the default mode;
+        requests that fail inside a finished job are retried individually.
+        """
+        if mode not in ("sync", "batch"):
+            raise ValueError(f"Unknown mode: {mode!r} (expected 'sync' or 'batch')")
         if "segments" not in transcript:
             logger.warning("Transcript missing segments")
             return
 
         segments = transcript["segments"]
 
-        # Register speakers first
-        for i, segment in enumerate(segments):
-            speaker = segment.get("speaker", None)
-            if speaker and not self._store.has_entity(speaker):
-                self._store.merge_entity(speaker, "person", ["Speaker in transcript"])
+        # Register speakers first: one existence check for all of them, not one per segment
+        speakers: Dict[str, str] = {}
+        for segment in segments:
+            speaker = segment.get("speaker")
+            if speaker:
+                speakers.setdefault(speaker.lower(), speaker)
+        if speakers:
+            existing = self._store.existing_entities(speakers.values())
+            self._store.merge_entities_bulk(
+                [
+                    {"name": name, "type": "person", "descriptions": ["Speaker in transcript"]}
+                    for name in speakers.values()
+                    if name not in existing
+                ]
+            )
 
         # Batch segments together for fewer API calls
-        batches = []
-        for start in range(0, len(segments), batch_size):
-            batches.append(segments[start : start + batch_size])
+        batches = [
+            (start, segments[start : start + batch_size])
+            for start in range(0, len(segments), batch_size)
+        ]
 
-        for batch in tqdm(batches, desc="Building knowledge graph", unit="batch"):
+        jobs = []
+        for batch_start_idx, batch in batches:
             # Combine batch text
-            combined_text = " ".join(seg["text"] for seg in batch if "text" in seg)
-            if not combined_text.strip():
+            parts = [text for seg in batch if (text := seg.get("text"))]
+            if not parts:
+                continue
+            combined_text = " ".join(parts)
+            if combined_text.isspace():
                 continue
 
             # Use first segment's timestamp as batch timestamp
-            batch_start_idx = segments.index(batch[0])
             timestamp = batch[0].get("start", None)
             source = f"transcript_batch_{batch_start_idx}"
-
-            self.add_content(combined_text, source, timestamp)
-
-    def process_diagrams(self, diagrams: List[Dict]) -> None:
+            jobs.append((combined_text, source, timestamp))
+
+        if mode == "batch" and jobs:
+            extracted = self._extract_batch([text for text, _, _ in jobs])
+            if extracted is not None:
+                failed = [i for i, result in enumerate(extracted) if result is None]
+                if failed:
+                    logger.warning(
+                        f"{len(failed)} of {len(jobs)} batch requests failed, "
+                        "extracting them individually"
+                    )
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        retried = executor.map(self._extract_or_skip, [jobs[i][0] for i in failed])
+                        for i, result in zip(failed, retried):
+                            extracted[i] = result
+                for job, result in zip(jobs, extracted):
+                    self._add_extracted(*job, *result)
+                return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            extracted = executor.map(self._extract_or_skip, [text for text, _, _ in jobs])
+            for (text, source, timestamp), (entities, rels) in tqdm(
+                zip(jobs, extracted), total=len(jobs), desc="Building knowledge graph", unit="batch"
+            ):
+                self._add_extracted(text, source, timestamp, entities, rels)
+
+    def process_diagrams(self, diagrams: List[Dict], max_workers: int = _LLM_WORKERS) -> None:
         """Process diagram results into knowledge graph."""
-        for i, diagram in enumerate(tqdm(diagrams, desc="Processing diagrams for KG", unit="diag")):
-            text_content = diagram.get("text_content", "")
-            source = f"diagram_{i}"
-            if text_content:
-                self.add_content(text_content, source)
-
-            diagram_id = f"diagram_{i}"
-            if not self._store.has_entity(diagram_id):
-                self._store.merge_entity(diagram_id, "diagram", ["Visual diagram from video"])
-                self._store.add_occurrence(
-                    diagram_id,
-                    source if text_content else diagram_id,
-                    text=f"frame_index={diagram.get('frame_index')}",
-                )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Extraction runs ahead in the pool; results are consumed in diagram order
+            extracted = executor.map(
+                self._extract_or_skip,
+                [d["text_content"] for d in diagrams if d.get("text_content")],
+            )
+            for i, diagram in enumerate(
+                tqdm(diagrams, desc="Processing diagrams for KG", unit="diag")
+            ):
+                text_content = diagram.get("text_content", "")
+                source = f"diagram_{i}"
+                if text_content:
+                    self._add_extracted(text_content, source, None, *next(extracted))
+
+                diagram_id = f"diagram_{i}"
+                if not self._store.has_entity(diagram_id):
+                    self._store.merge_entity(diagram_id, "diagram", ["Visual diagram from video"])
+                    self._store.add_occurrence(
+                        diagram_id,
+                        source if text_content else diagram_id,
+                        text=f"frame_index={diagram.get('frame_index')}",
+                    )
 
     def to_data(self) -> KnowledgeGraphData:
         """Convert to pydantic KnowledgeGraphData model."""
-        nodes = []
-        for entity in self._store.get_all_entities():
-            descs = entity.get("descriptions", [])
-            if isinstance(descs, set):
-                descs = list(descs)
-            nodes.append(
-                Entity(
-                    name=entity["name"],
-                    type=entity.get("type", "concept"),
-                    descriptions=descs,
-                    occurrences=entity.get("occurrences", []),
-                )
+        # Streamed from the store, so raw entity dicts are never held alongside the models
+        nodes = [
+            Entity(
+                name=node["name"],
+                type=node["type"],
+                descriptions=node["descriptions"],
+                occurrences=node["occurrences"],
             )
+            for node in self._store.iter_nodes()
+        ]
 
+        cols = self._store.get_relationships_columnar()
         rels = [
-            Relationship(
-                source=r["source"],
-                target=r["target"],
-                type=r.get("type", "related_to"),
-                content_source=r.get("content_source"),
-                timestamp=r.get("timestamp"),
+            Relationship(source=s, target=t, type=ty, content_source=cs, timestamp=ts)
+            for s, t, ty, cs, ts in zip(
+                cols["source"],
+                cols["target"],
+                cols["type"],
+                cols["content_source"],
+                cols["timestamp"],
             )
-            for r in self._store.get_all_relationships()
         ]
         return KnowledgeGraphData(nodes=nodes, relationships=rels)
 
@@ -214,15 +346,21 @@ class KnowledgeGraph:
         """Convert knowledge graph to dictionary (backward-compatible)."""
         return self._store.to_dict()
 
-    def save(self, output_path: Union[str, Path]) -> Path:
-        """Save knowledge graph to JSON file."""
+    def save(self, output_path: Union[str, Path], compress: bool = False) -> Path:
+        """Save knowledge graph to JSON file.
+
+        With compress=True a zstd copy is also written alongside as <name>.zst
+        (requires the optional zstandard package).
+        """
         output_path = Path(output_path)
         if not output_path.suffix:
             output_path = output_path.with_suffix(".json")
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = self.to_data()
-        output_path.write_text(data.model_dump_json(indent=2))
+        with output_path.open("wb") as fp:
+            self._store.to_json_stream(fp)
+        if compress:
+            compress_file(output_path)
         logger.info(
             f"Saved knowledge graph with {self._store.get_entity_count()} nodes "
             f"and {self._store.get_relationship_count()} relationships to {output_path}"
@@ -233,91 +371,99 @@ class KnowledgeGraph:
     def from_dict(cls, data: Dict, db_path: Optional[Path] = None) -> "KnowledgeGraph":
         """Reconstruct a KnowledgeGraph from saved JSON dict."""
         kg = cls(db_path=db_path)
+        occurrences = []
         for node in data.get("nodes", []):
             name = node.get("name", node.get("id", ""))
             descs = node.get("descriptions", [])
-            if isinstance(descs, set):
+            if isinstance(descs, (set, tuple)):
                 descs = list(descs)
             kg._store.merge_entity(
                 name, node.get("type", "concept"), descs, source=node.get("source")
             )
-            for occ in node.get("occurrences", []):
-                kg._store.add_occurrence(
-                    name,
-                    occ.get("source", ""),
-                    occ.get("timestamp"),
-                    occ.get("text"),
-                )
-        for rel in data.get("relationships", []):
-            kg._store.add_relationship(
+            occurrences.extend(
+                (name, occ.get("source", ""), occ.get("timestamp"), occ.get("text"))
+                for occ in node.get("occurrences", [])
+            )
+        kg._store.add_occurrences_bulk(occurrences)
+        kg._store.add_relationships_bulk(
+            (
                 rel.get("source", ""),
                 rel.get("target", ""),
                 rel.get("type", "related_to"),
-                content_source=rel.get("content_source"),
-                timestamp=rel.get("timestamp"),
+                rel.get("content_source"),
+                rel.get("timestamp"),
             )
+            for rel in data.get("relationships", [])
+        )
         return kg
 
     def merge(self, other: "KnowledgeGraph") -> None:
         """Merge another KnowledgeGraph into this one."""
-        for entity in other._store.get_all_entities():
+        occurrences = []
+        for entity in other._store.iter_entities():
             name = entity["name"]
             descs = entity.get("descriptions", [])
-            if isinstance(descs, set):
+            if isinstance(descs, (set, tuple)):
                 descs = list(descs)
             self._store.merge_entity(
                 name, entity.get("type", "concept"), descs, source=entity.get("source")
             )
-            for occ in entity.get("occurrences", []):
-                self._store.add_occurrence(
-                    name,
-                    occ.get("source", ""),
-                    occ.get("timestamp"),
-                    occ.get("text"),
-                )
-
-        for rel in other._store.get_all_relationships():
-            self._store.add_relationship(
+            occurrences.extend(
+                (name, occ.get("source", ""), occ.get("timestamp"), occ.get("text"))
+                for occ in entity.get("occurrences", [])
+            )
+        self._store.add_occurrences_bulk(occurrences)
+
+        self._store.add_relationships_bulk(
+            (
                 rel.get("source", ""),
                 rel.get("target", ""),
                 rel.get("type", "related_to"),
-                content_source=rel.get("content_source"),
-                timestamp=rel.get("timestamp"),
+                rel.get("content_source"),
+                rel.get("timestamp"),
             )
+            for rel in other._store.get_all_relationships()
+        )
 
     def generate_mermaid(self, max_nodes: int = 30) -> str:
         """Generate Mermaid visualization code."""
-        nodes = self.nodes
         rels = self.relationships
 
-        node_importance = {}
-        for node_id in nodes:
-            count = sum(1 for rel in rels if rel["source"] == node_id or rel["target"] == node_id)
-            node_importance[node_id] = count
-
-        important = sorted(node_importance.items(), key=lambda x: x[1], reverse=True)
-        important_ids = [n[0] for n in important[:max_nodes]]
+        # One pass over the relationships for every node's degree
+        degree = Counter()
+        for rel in rels:
+            degree[rel["source"]] += 1
+            degree[rel["target"]] += 1
+
+        # Only name and type are drawn, so fetch just those, and only for
+        # connected entities; unconnected ones pad out a sparse graph
+        connected = self._store.get_entities_by_names(degree)
+        important = heapq.nlargest(max_nodes, connected, key=lambda e: degree[e["name"]])
+        if len(important) < max_nodes:
+            shown = {e["name"] for e in important}
+            spare = [
+                e for e in self._store.find_entities(limit=max_nodes) if e["name"] not in shown
+            ]
+            important += spare[: max_nodes - len(important)]
+        safe_ids = {e["name"]: _MERMAID_UNSAFE.sub("_", e["name"]) for e in important}
 
         mermaid = ["graph LR"]
 
-        for nid in important_ids:
-            node = nodes[nid]
+        for node in important:
+            nid = node["name"]
             ntype = node.get("type", "concept")
-            # Sanitize id for mermaid (alphanumeric + underscore only)
-            safe_id = "".join(c if c.isalnum() or c == "_" else "_" for c in nid)
+            safe_id = safe_ids[nid]
             safe_name = node["name"].replace('"', "'")
             mermaid.append(f'    {safe_id}["{safe_name}"]:::{ntype}')
 
         added = set()
         for rel in rels:
             src, tgt = rel["source"], rel["target"]
-            if src in important_ids and tgt in important_ids:
+            if src in safe_ids and tgt in safe_ids:
                 rtype = rel.get("type", "related_to")
-                key = f"{src}|{tgt}|{rtype}"
+                key = (src, tgt, rtype)
                 if key not in added:
-                    safe_src = "".join(c if c.isalnum() or c == "_" else "_" for c in src)
-                    safe_tgt = "".join(c if c.isalnum() or c == "_" else "_" for c in tgt)
-                    mermaid.append(f'    {safe_src} -- "{rtype}" --> {safe_tgt}')
+                    mermaid.append(f'    {safe_ids[src]} -- "{rtype}" --> {safe_ids[tgt]}')
                     added.add(key)
 
         mermaid.append("    classDef person fill:#f9d5e5,stroke:#333,stroke-width:1px")
@@ -18,6 +18,7 @@ def create_video_output_dirs(output_dir: str | Path, video_name: str) -> Dict[st
             manifest.json
             transcript/
                 transcript.json, .txt, .srt
+                transcript.json.zst (comprehensive depth, when zstandard installed)
             frames/
                 frame_0000.jpg ...
             diagrams/
@@ -27,6 +28,7 @@ def create_video_output_dirs(output_dir: str | Path, video_name: str) -> Dict[st
             results/
                 analysis.md, .html, .pdf
                 knowledge_graph.json
+                knowledge_graph.json.zst (comprehensive depth, when zstandard installed)
                 knowledge_graph.db (when falkordblite installed)
                 key_points.json
                 action_items.json
@@ -12,8 +12,8 @@ from tqdm import tqdm
 from video_processor.analyzers.diagram_analyzer import DiagramAnalyzer
 from video_processor.extractors.audio_extractor import AudioExtractor
 from video_processor.extractors.frame_extractor import (
-    extract_frames,
     filter_people_frames,
+    iter_frames,
     save_frames,
 )
 from video_processor.integrators.knowledge_graph import KnowledgeGraph
@@ -27,6 +27,7 @@ from video_processor.models import (
 )
 from video_processor.output_structure import create_video_output_dirs, write_video_manifest
 from video_processor.providers.manager import ProviderManager
+from video_processor.utils.compression import write_zstd
 from video_processor.utils.export import export_all_formats
 
 logger = logging.getLogger(__name__)
@@ -43,10 +44,14 @@ def process_single_video(
     periodic_capture_seconds: float = 30.0,
     use_gpu: bool = False,
     title: Optional[str] = None,
+    llm_batch: bool = False,
 ) -> VideoManifest:
     """
     Full pipeline: frames -> audio -> transcription -> diagrams -> KG -> report -> export.
 
+    With llm_batch, transcript entity extraction goes through the chat provider's
+    batch API: cheaper, but the knowledge graph step can take hours.
+
     Returns a populated VideoManifest.
     """
     start_time = time.time()
@@ -61,6 +66,8 @@ def process_single_video(
 
     # Create standardized directory structure
     dirs = create_video_output_dirs(output_dir, video_name)
+    # Comprehensive runs produce the largest artifacts; keep zstd copies alongside
+    compress_artifacts = depth == "comprehensive"
 
     logger.info(f"Processing: {input_path}")
     logger.info(f"Depth: {depth}, Focus: {focus_areas or 'all'}")
@@ -81,22 +88,25 @@ def process_single_video(
     pm.usage.start_step("Frame extraction")
     pipeline_bar.set_description("Pipeline: extracting frames")
     existing_frames = sorted(dirs["frames"].glob("frame_*.jpg"))
+    audio_path = dirs["root"] / "audio" / f"{video_name}.wav"
     people_removed = 0
     if existing_frames:
         frame_paths = existing_frames
         logger.info(f"Resuming: found {len(frame_paths)} frames on disk, skipping extraction")
     else:
         logger.info("Extracting video frames...")
-        frames = extract_frames(
+        frames = iter_frames(
             input_path,
             sampling_rate=sampling_rate,
             change_threshold=change_threshold,
             periodic_capture_seconds=periodic_capture_seconds,
+            # If frames go through ffmpeg it writes the soundtrack too, saving a demux;
+            # otherwise the audio step below extracts it as usual
+            audio_path=None if audio_path.exists() else audio_path,
             disable_gpu=not use_gpu,
         )
-        logger.info(f"Extracted {len(frames)} raw frames")
 
-        # Filter out people/webcam frames before saving
+        # Filter out people/webcam frames as they stream in, before saving
         frames, people_removed = filter_people_frames(frames)
         frame_paths = save_frames(frames, dirs["frames"], "frame")
         logger.info(f"Saved {len(frames)} content frames ({people_removed} people frames filtered)")
@@ -105,10 +115,9 @@ def process_single_video(
     # --- Step 2: Extract audio ---
     pm.usage.start_step("Audio extraction")
     pipeline_bar.set_description("Pipeline: extracting audio")
-    audio_path = dirs["root"] / "audio" / f"{video_name}.wav"
     audio_extractor = AudioExtractor()
     if audio_path.exists():
-        logger.info(f"Resuming: found audio at {audio_path}, skipping extraction")
+        logger.info(f"Found audio at {audio_path}, skipping extraction")
     else:
         logger.info("Extracting audio...")
         audio_path = audio_extractor.extract_audio(input_path, output_path=audio_path)
@@ -139,7 +148,10 @@ def process_single_video(
             "provider": transcription.get("provider"),
             "model": transcription.get("model"),
         }
-        transcript_json.write_text(json.dumps(transcript_data, indent=2))
+        transcript_json_text = json.dumps(transcript_data, indent=2)
+        transcript_json.write_text(transcript_json_text)
+        if compress_artifacts:
+            write_zstd(transcript_json, transcript_json_text)
 
         transcript_txt = dirs["transcript"] / "transcript.txt"
         transcript_txt.write_text(transcript_text)
@@ -201,11 +213,11 @@ def process_single_video(
     else:
         logger.info("Building knowledge graph...")
         kg = KnowledgeGraph(provider_manager=pm, db_path=kg_db_path)
-        kg.process_transcript(transcript_data)
+        kg.process_transcript(transcript_data, mode="batch" if llm_batch else "sync")
         if diagrams:
             diagram_dicts = [d.model_dump() for d in diagrams]
             kg.process_diagrams(diagram_dicts)
-        kg.save(kg_json_path)
+        kg.save(kg_json_path, compress=compress_artifacts)
     pipeline_bar.update(1)
 
     # --- Step 6: Extract key points & action items ---
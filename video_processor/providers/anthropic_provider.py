@@ -3,6 +3,7 @@
 import base64
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -81,6 +82,52 @@ class AnthropicProvider(BaseProvider):
         }
         return response.content[0].text
 
+    # Seconds between status checks while a batch job runs
+    _BATCH_POLL_SECONDS = 30
+
+    def chat_batch(
+        self,
+        requests: list[list[dict]],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+    ) -> list[Optional[str]]:
+        model = model or "claude-sonnet-4-5-20250929"
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": str(i),
+                    "params": {
+                        "model": model,
+                        "messages": messages,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                    },
+                }
+                for i, messages in enumerate(requests)
+            ]
+        )
+        logger.info(f"Submitted Anthropic batch {batch.id} ({len(requests)} requests)")
+        while batch.processing_status != "ended":
+            time.sleep(self._BATCH_POLL_SECONDS)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        texts: list[Optional[str]] = [None] * len(requests)
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.warning(f"Batch request {entry.custom_id} {entry.result.type}")
+                continue
+            message = entry.result.message
+            usage["input_tokens"] += getattr(message.usage, "input_tokens", 0)
+            usage["output_tokens"] += getattr(message.usage, "output_tokens", 0)
+            if not message.content:
+                logger.warning(f"Batch request {entry.custom_id} returned no content")
+                continue
+            texts[int(entry.custom_id)] = message.content[0].text
+        self._last_usage = usage
+        return texts
+
     def transcribe_audio(
         self,
         audio_path: str | Path,
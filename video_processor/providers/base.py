@@ -1,5 +1,6 @@
 """Abstract base class and shared types for provider implementations."""
 
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional
@@ -23,6 +24,23 @@ class BaseProvider(ABC):
 
     provider_name: str = ""
 
+    # Token usage of the calling thread's last request, read back by
+    # ProviderManager._track. Thread-local so concurrent calls on one provider
+    # can't swap or drop each other's figures.
+    @property
+    def _last_usage(self) -> Optional[dict]:
+        return getattr(self._usage_local(), "value", None)
+
+    @_last_usage.setter
+    def _last_usage(self, value: Optional[dict]) -> None:
+        self._usage_local().value = value
+
+    def _usage_local(self) -> threading.local:
+        local = self.__dict__.get("_usage_tls")
+        if local is None:
+            local = self.__dict__.setdefault("_usage_tls", threading.local())
+        return local
+
     @abstractmethod
     def chat(
         self,
@@ -55,3 +73,18 @@ class BaseProvider(ABC):
     @abstractmethod
     def list_models(self) -> list[ModelInfo]:
         """Discover available models from this provider's API."""
+
+    def chat_batch(
+        self,
+        requests: list[list[dict]],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+    ) -> list[Optional[str]]:
+        """Run many chat requests as one provider batch job, blocking until it ends.
+
+        Returns the assistant texts in request order, None for any request that
+        failed or expired inside the job.
+        Not supported by all providers — raises NotImplementedError by default.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch requests")
@@ -1,6 +1,7 @@
 """ProviderManager - unified interface for routing API calls to the best available provider."""
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -63,6 +64,7 @@ class ProviderManager:
         self._providers: dict[str, BaseProvider] = {}
         self._available_models: Optional[list[ModelInfo]] = None
         self.usage = UsageTracker()
+        self._usage_lock = threading.Lock()  # record() is called from worker threads
 
         # If a single provider is forced, apply it
         if provider:
@@ -196,12 +198,13 @@ class ProviderManager:
         """Record usage from the last API call on a provider."""
         last = getattr(provider, "_last_usage", None)
         if last:
-            self.usage.record(
-                provider=prov_name,
-                model=model,
-                input_tokens=last.get("input_tokens", 0),
-                output_tokens=last.get("output_tokens", 0),
-            )
+            with self._usage_lock:
+                self.usage.record(
+                    provider=prov_name,
+                    model=model,
+                    input_tokens=last.get("input_tokens", 0),
+                    output_tokens=last.get("output_tokens", 0),
+                )
             provider._last_usage = None
 
     # --- Public API ---
@@ -222,6 +225,27 @@ class ProviderManager:
         self._track(provider, prov_name, model)
         return result
 
+    def chat_batch(
+        self,
+        requests: list[list[dict]],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> list[Optional[str]]:
+        """Send many chat completions as one batch job to the chat provider.
+
+        Batch jobs cost less but may take hours. Results are in request order,
+        None where a request failed. Raises NotImplementedError if the provider
+        has no batch API.
+        """
+        prov_name, model = self._resolve_model(self.chat_model, "chat", _CHAT_PREFERENCES)
+        logger.info(f"Chat batch: using {prov_name}/{model} for {len(requests)} requests")
+        provider = self._get_provider(prov_name)
+        results = provider.chat_batch(
+            requests, max_tokens=max_tokens, temperature=temperature, model=model
+        )
+        self._track(provider, prov_name, model)
+        return results
+
     def analyze_image(
         self,
         image_bytes: bytes,
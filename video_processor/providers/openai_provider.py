@@ -1,8 +1,10 @@
 """OpenAI provider implementation."""
 
 import base64
+import json
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -96,6 +98,66 @@ class OpenAIProvider(BaseProvider):
         }
         return response.choices[0].message.content or ""
 
+    # Seconds between status checks while a batch job runs
+    _BATCH_POLL_SECONDS = 30
+    _BATCH_DONE = {"completed", "failed", "expired", "cancelled"}
+
+    def chat_batch(
+        self,
+        requests: list[list[dict]],
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+    ) -> list[Optional[str]]:
+        model = model or "gpt-4o"
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": messages,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                    },
+                }
+            )
+            for i, messages in enumerate(requests)
+        ]
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} ({len(requests)} requests)")
+        while batch.status not in self._BATCH_DONE:
+            time.sleep(self._BATCH_POLL_SECONDS)
+            batch = self.client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} {batch.status}")
+
+        texts: list[Optional[str]] = [None] * len(requests)
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        output = ""
+        if batch.output_file_id:  # absent when every request failed
+            output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            item = json.loads(line)
+            body = (item.get("response") or {}).get("body") or {}
+            if not body.get("choices"):
+                logger.warning(f"Batch request {item.get('custom_id')} failed: {item.get('error')}")
+                continue
+            texts[int(item["custom_id"])] = body["choices"][0]["message"].get("content") or ""
+            usage["input_tokens"] += body.get("usage", {}).get("prompt_tokens", 0)
+            usage["output_tokens"] += body.get("usage", {}).get("completion_tokens", 0)
+        self._last_usage = usage
+        return texts
+
     # Whisper API limit is 25MB
     _MAX_FILE_SIZE = 25 * 1024 * 1024
 
@@ -150,7 +212,7 @@ class OpenAIProvider(BaseProvider):
         from video_processor.extractors.audio_extractor import AudioExtractor
 
         extractor = AudioExtractor()
-        audio_data, sr = extractor.load_audio(audio_path)
+        audio_data, sr = extractor.extract_audio_to_array(audio_path)
         total_duration = len(audio_data) / sr
 
         # Calculate chunk duration to stay under 25MB
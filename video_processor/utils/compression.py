@@ -0,0 +1,88 @@
+"""Optional zstd compression for large JSON artifacts."""
+
+import logging
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+logger = logging.getLogger(__name__)
+
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 3
+
+
+def _compressor(level: int):
+    """A zstd compressor, or None (logged) if zstandard is not installed."""
+    try:
+        import zstandard
+    except ImportError:
+        logger.debug(
+            "zstandard not installed, skipping compressed artifacts. "
+            "Install with: pip install planopticon[compress]"
+        )
+        return None
+    return zstandard.ZstdCompressor(level=level, threads=-1)
+
+
+def _zstandard_for_reading(path: Path):
+    """The zstandard module, or ImportError naming the extra that provides it."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            f"Reading {path} requires zstandard. Install with: pip install planopticon[compress]"
+        ) from None
+    return zstandard
+
+
+def write_zstd(path: str | Path, text: str, level: int = ZSTD_LEVEL) -> Optional[Path]:
+    """
+    Write *text* zstd-compressed to ``<path>.zst``, alongside the plain file.
+
+    Returns the compressed path, or None if zstandard is not installed.
+    """
+    compressor = _compressor(level)
+    if compressor is None:
+        return None
+
+    path = Path(path)
+    zst_path = path.with_name(path.name + ZSTD_SUFFIX)
+    zst_path.write_bytes(compressor.compress(text.encode("utf-8")))
+    return zst_path
+
+
+def compress_file(path: str | Path, level: int = ZSTD_LEVEL) -> Optional[Path]:
+    """
+    Stream the file at *path* zstd-compressed to ``<path>.zst``, alongside it.
+
+    Returns the compressed path, or None if zstandard is not installed.
+    """
+    compressor = _compressor(level)
+    if compressor is None:
+        return None
+
+    path = Path(path)
+    zst_path = path.with_name(path.name + ZSTD_SUFFIX)
+    with path.open("rb") as src, zst_path.open("wb") as dst:
+        # Size up front so the frame header records it, as read_text() expects
+        compressor.copy_stream(src, dst, size=path.stat().st_size)
+    return zst_path
+
+
+def read_text(path: str | Path) -> str:
+    """Read a text artifact, transparently decompressing ``.zst`` files."""
+    path = Path(path)
+    if path.suffix != ZSTD_SUFFIX:
+        return path.read_text()
+
+    zstandard = _zstandard_for_reading(path)
+    return zstandard.ZstdDecompressor().decompress(path.read_bytes()).decode("utf-8")
+
+
+def open_binary(path: str | Path) -> BinaryIO:
+    """Open an artifact for binary reading, streaming-decompressing ``.zst`` files."""
+    path = Path(path)
+    if path.suffix != ZSTD_SUFFIX:
+        return path.open("rb")
+
+    zstandard = _zstandard_for_reading(path)
+    return zstandard.ZstdDecompressor().stream_reader(path.open("rb"), closefd=True)
@@ -0,0 +1,38 @@
+"""Incremental reading of large JSON artifacts."""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Iterator, Tuple
+
+from video_processor.utils.compression import open_binary, read_text
+
+logger = logging.getLogger(__name__)
+
+
+def iter_json_arrays(path: str | Path, *keys: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ``(key, item)`` for each item of the top-level arrays *keys*, in order.
+
+    With the optional ijson package installed, items are parsed one at a time so
+    a large file (e.g. a knowledge graph) is never materialized in full;
+    otherwise the file is loaded once with json. ``.zst`` files are decompressed
+    on the fly either way.
+    """
+    try:
+        import ijson
+    except ImportError:
+        logger.debug(
+            "ijson not installed, loading JSON in full. "
+            "Install with: pip install planopticon[stream]"
+        )
+        data = json.loads(read_text(path))
+        for key in keys:
+            for item in data.get(key, []):
+                yield key, item
+        return
+
+    for key in keys:
+        with open_binary(path) as f:
+            for item in ijson.items(f, f"{key}.item", use_float=True):
+                yield key, item